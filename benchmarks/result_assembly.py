@@ -0,0 +1,69 @@
+'''
+    Benchmark of the result assembly in Entity.
+
+    Compares concatenating every slice into the accumulated DataFrame,
+    as Entity used to do, with ResultAssembler, which builds the frame
+    once. The time per slice stays flat for the assembler and grows
+    with the number of slices for the per-slice concatenation.
+
+    Usage: python benchmarks/result_assembly.py [rows_per_slice]
+'''
+import sys
+import time
+sys.path.insert(1, './')
+
+import pandas as pd
+
+from iudx.entity.ResultAssembler import ResultAssembler
+
+
+def make_slice(index: int, rows: int):
+    return [
+        {
+            "id": "resource",
+            "observationDateTime": f"2021-01-01T00:00:{i % 60:02d}+05:30",
+            "speed": float(i),
+            "location": {"type": "Point", "coordinates": [77.5, 12.9]},
+            "slice": index,
+        }
+        for i in range(rows)
+    ]
+
+
+def per_slice_concat(slices):
+    resources_df = pd.DataFrame()
+    resources_json = []
+    for results in slices:
+        resource_df = pd.json_normalize(results)
+        resources_json = resources_json + results
+        if len(resources_df) == 0:
+            resources_df = resource_df
+        else:
+            resources_df = pd.concat([resources_df, resource_df])
+    return resources_df.reset_index(drop=True)
+
+
+def assembled(slices):
+    assembler = ResultAssembler()
+    for results in slices:
+        assembler.add(results)
+    assembler.records()
+    return assembler.to_frame()
+
+
+def measure(fn, slices) -> float:
+    start = time.perf_counter()
+    fn(slices)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'slices':>8} {'concat s':>10} {'per slice ms':>13} "
+          f"{'assembler s':>12} {'per slice ms':>13}")
+    for count in (25, 50, 100, 200, 300):
+        slices = [make_slice(i, rows) for i in range(count)]
+        concat_time = measure(per_slice_concat, slices)
+        assembler_time = measure(assembled, slices)
+        print(f"{count:>8} {concat_time:>10.2f} {1000 * concat_time / count:>13.2f} "
+              f"{assembler_time:>12.2f} {1000 * assembler_time / count:>13.2f}")
@@ -0,0 +1,139 @@
+"""Module doc string. Leave empty for now.
+
+FileTokenCache.py
+"""
+import contextlib
+import json
+import os
+import stat
+import tempfile
+import time
+from typing import TypeVar, Callable, Dict, Iterator, Tuple
+
+from iudx.auth.TokenCache import TokenCache, TokenKey
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+FileTokenCache = TypeVar('T')
+
+
+class FileTokenCache(TokenCache):
+    """Token cache persisted to a file readable by the owner only, so that
+       short lived processes such as the command line reuse unexpired
+       tokens. Concurrent processes serialize on a lock file, so that only
+       one of them requests a missing token from the auth server.
+    """
+
+    def __init__(self: FileTokenCache, path: str = "~/.iudx/tokens.json",
+                 refresh_margin: float = 60.0,
+                 proactive_refresh: bool = False):
+        """FileTokenCache base class constructor
+
+        Args:
+            path (String): File the tokens are stored in.
+            refresh_margin (Float): Seconds before expiry a token is
+                considered stale and requested again.
+            proactive_refresh (Boolean): Refresh tokens in use in the
+                background, before they turn stale.
+        """
+        TokenCache.__init__(self, refresh_margin, proactive_refresh)
+        self.path = os.path.expanduser(path)
+        return
+
+    def get_or_fetch(self, key: TokenKey,
+                     fetch: Callable[[], Tuple[str, float]]) -> str:
+        """Method to return the token cached in memory or in the file, or
+            request it once for all the threads and processes asking at
+            the same time.
+
+        Args:
+            key (Tuple): Credentials digest, itemId, itemType and role.
+            fetch (Callable): Requests a new (token, expiry).
+        Returns:
+            access_token (String): The token.
+        """
+        current = self.get(key)
+
+        def fetch_locked() -> Tuple[str, float]:
+            with self._locked():
+                # Another process may have stored the token, or a newer
+                # one than the token being refreshed, meanwhile.
+                tokens = self._read()
+                entry = tokens.get(self._name(key))
+                if (entry is not None and self._fresh(entry)
+                        and entry["access_token"] != current):
+                    return entry["access_token"], entry["expires_at"]
+                access_token, expires_at = fetch()
+                tokens[self._name(key)] = {"access_token": access_token,
+                                           "expires_at": expires_at}
+                self._write(tokens)
+                return access_token, expires_at
+
+        if current is not None:
+            self._refresh_due(key, fetch_locked)
+            return current
+        return self._fetch_shared(key, fetch_locked)
+
+    def clear(self) -> None:
+        """Method to drop every token, in memory and on disk.
+        """
+        TokenCache.clear(self)
+        with self._locked():
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        return None
+
+    @staticmethod
+    def _name(key: TokenKey) -> str:
+        return json.dumps(list(key))
+
+    def _fresh(self, entry: Dict) -> bool:
+        return entry["expires_at"] - self.refresh_margin > time.time()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the descriptor releases the lock.
+            os.close(fd)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            if os.stat(self.path).st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                # Tokens others could read are not trusted, the file is
+                # rewritten with the owner's permissions on the next write.
+                return {}
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(tokens, dict):
+            return {}
+        return tokens
+
+    def _write(self, tokens: Dict[str, Dict]) -> None:
+        tokens = {name: entry for name, entry in tokens.items()
+                  if entry.get("expires_at", 0) > time.time()}
+        # mkstemp creates the file readable by the owner only, replacing
+        # the cache with it is atomic for readers.
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return None
@@ -1,7 +1,13 @@
+import hashlib
 import json
+from typing import Dict, List, Tuple
 
 from iudx.common.HTTPEntity import HTTPEntity
 from iudx.common.HTTPResponse import HTTPResponse
+from iudx.common.Transport import Transport
+from iudx.common.Executor import Executor
+from iudx.common.JSONCodec import JSONCodec
+from iudx.auth.TokenCache import TokenCache, token_expiry
 
 
 class Token:
@@ -17,7 +23,9 @@ class Token:
             token_file: str = None,
             client_id: str = None,
             client_secret: str = None,
-            headers: dict = None):
+            headers: dict = None,
+            transport: Transport = None,
+            cache: TokenCache = None):
         """
         Token class constructor for requesting tokens
 
@@ -28,6 +36,9 @@ class Token:
             client_id (String): Keycloak Issued clientId.
             client_secret (String): Keycloak Issued clientSecret.
             headers (Dict): Headers passed with the API Request.
+            transport (Transport): Connection pool shared with other clients.
+            cache (TokenCache): Cache of the access tokens, a new one
+                is used when None.
         """
         if headers is None:
             headers = {"content-type": "application/json"}
@@ -36,7 +47,7 @@ class Token:
             headers.update({"Authorization": authorization_token})
         elif token_file is not None:
             with open(token_file) as f:
-                token = json.load(f)
+                token = JSONCodec.get_default().load(f)
                 if "access_token" in token.keys():
                     headers.update({"Authorization": "Bearer " + token["access_token"]})
                 else:
@@ -50,6 +61,8 @@ class Token:
         self.headers = headers
         self.credentials = None
         self.item = None
+        self.transport = transport
+        self.cache = cache if cache is not None else TokenCache()
         return
 
     def set_item(
@@ -70,7 +83,8 @@ class Token:
 
     def request_token(self) -> str:
         """
-        Method to request a token for the private resources
+        Method to request a token for the private resources. Tokens are
+        cached per item and reused until shortly before they expire.
 
         Returns:
              access_token (String): Token to access the private resources
@@ -78,14 +92,66 @@ class Token:
         if self.item is None:
             self.set_item("rs.cos.iudx.org.in", "resource_server", "consumer")
 
-        http_entity = HTTPEntity()
+        return self._request_item(dict(self.item))
+
+    def request_tokens(
+            self,
+            items: List[Tuple[str, str, str]],
+            workers: int = 8) -> List[str]:
+        """
+        Method to request the tokens of many items concurrently. The item
+        set with set_item is left as it is.
+
+        Args:
+            items (List[Tuple]): (item_id, item_type, role) of every item.
+            workers (Integer): Number of concurrent requests to the auth
+                server.
+        Returns:
+             access_tokens (List[String]): Tokens in the order of the items
+        """
+        items = [
+            {"itemId": item_id, "itemType": item_type, "role": role}
+            for item_id, item_type, role in items
+        ]
+        if len(items) <= 1:
+            return [self._request_item(item) for item in items]
+        executor = Executor.shared("thread", workers)
+        return executor.starmap(self._request_item, [(item,) for item in items])
+
+    def _request_item(self, item: Dict) -> str:
+        key = (self._identity(), item["itemId"], item["itemType"], item["role"])
+        return self.cache.get_or_fetch(key, lambda: self._fetch_token(item))
+
+    def _identity(self) -> str:
+        """
+        Digest of the auth server and credentials, so that a cache shared
+        by several Token objects never mixes up their tokens
+        """
+        credentials = [self.auth_url] + [
+            f"{name}={self.headers.get(name)}"
+            for name in ("Authorization", "clientId", "clientSecret")
+        ]
+        return hashlib.sha256("\n".join(credentials).encode("utf-8")).hexdigest()
+
+    def _fetch_token(self, item: Dict) -> Tuple[str, float]:
+        """
+        Method to request a token from the auth server
+
+        Args:
+            item (Dict): Item the token is requested for.
+        Returns:
+            access_token (String): Token to access the private resources
+            expires_at (Float): Expiry of the token as a unix timestamp
+        """
+        http_entity = HTTPEntity(transport=self.transport)
         url = self.auth_url + "/token"
-        response: HTTPResponse = http_entity.post(url, json.dumps(self.item), self.headers)
+        response: HTTPResponse = http_entity.post(
+            url, JSONCodec.get_default().dumps(item), self.headers)
         result_data = response.get_json()
 
         if response.get_status_code() == 200:
             self.credentials = result_data["results"]
             access_token = self.credentials["accessToken"]
-            return access_token
+            return access_token, token_expiry(access_token, self.credentials)
         else:
             raise RuntimeError(result_data)
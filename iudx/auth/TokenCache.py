@@ -0,0 +1,193 @@
+"""Module doc string. Leave empty for now.
+
+TokenCache.py
+"""
+import base64
+import json
+import threading
+import time
+from typing import TypeVar, Callable, Dict, Tuple
+
+
+TokenCache = TypeVar('T')
+
+# (credentials digest, itemId, itemType, role)
+TokenKey = Tuple[str, str, str, str]
+
+
+def token_expiry(access_token: str, results: Dict = None,
+                 default_ttl: float = 300.0) -> float:
+    """Return the expiry of an access token as a unix timestamp.
+
+    The 'exp' claim of the JWT is used when present, then the 'expiry'
+    field of the auth server response, which is either a timestamp or
+    a lifetime in seconds.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        pass
+
+    expiry = (results or {}).get("expiry")
+    if isinstance(expiry, (int, float)):
+        return float(expiry) if expiry > 1e9 else time.time() + expiry
+    return time.time() + default_ttl
+
+
+class _Pending():
+    """A token request in flight, shared by every caller of its key.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.access_token: str = None
+        self.error: BaseException = None
+
+
+class TokenCache():
+    """Cache of access tokens keyed by credentials, itemId, itemType and
+       role. Tokens are reused until shortly before they expire; a token
+       asked for close to that is refreshed in the background while the
+       current one is returned, and concurrent requests for the same key
+       share a single call to the auth server.
+    """
+
+    def __init__(self: TokenCache, refresh_margin: float = 60.0,
+                 proactive_refresh: bool = True):
+        """TokenCache base class constructor
+
+        Args:
+            refresh_margin (Float): Seconds before expiry a token is
+                considered stale and refreshed.
+            proactive_refresh (Boolean): Refresh tokens in use in the
+                background, before they turn stale.
+        """
+        self.refresh_margin = refresh_margin
+        self.proactive_refresh = proactive_refresh
+        self._entries: Dict[TokenKey, Dict] = {}
+        self._pending: Dict[TokenKey, _Pending] = {}
+        self._lock = threading.Lock()
+        return
+
+    def get(self, key: TokenKey) -> str:
+        """Method to return a cached token which is not stale.
+
+        Args:
+            key (Tuple): Credentials digest, itemId, itemType and role.
+        Returns:
+            access_token (String): The token, None when missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] - self.refresh_margin <= time.time():
+                return None
+            return entry["access_token"]
+
+    def put(self, key: TokenKey, access_token: str, expires_at: float) -> None:
+        """Method to store a token.
+
+        Args:
+            key (Tuple): Credentials digest, itemId, itemType and role.
+            access_token (String): The token.
+            expires_at (Float): Expiry as a unix timestamp.
+        """
+        # Refresh a margin ahead of the token turning stale, or halfway
+        # there for short lived tokens.
+        stale_in = expires_at - self.refresh_margin - time.time()
+        refresh_in = max(stale_in - self.refresh_margin, stale_in / 2, 1.0)
+        with self._lock:
+            self._entries[key] = {
+                "access_token": access_token,
+                "expires_at": expires_at,
+                "refresh_at": time.time() + refresh_in,
+            }
+        return None
+
+    def get_or_fetch(self, key: TokenKey,
+                     fetch: Callable[[], Tuple[str, float]]) -> str:
+        """Method to return the cached token, or request it once for all
+            the threads asking at the same time.
+
+        Args:
+            key (Tuple): Credentials digest, itemId, itemType and role.
+            fetch (Callable): Requests a new (token, expiry).
+        Returns:
+            access_token (String): The token.
+        """
+        access_token = self.get(key)
+        if access_token is not None:
+            self._refresh_due(key, fetch)
+            return access_token
+
+        return self._fetch_shared(key, fetch)
+
+    def _fetch_shared(self, key: TokenKey,
+                      fetch: Callable[[], Tuple[str, float]]) -> str:
+        # The first caller of a key requests the token, the others wait
+        # for its result.
+        with self._lock:
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = _Pending()
+                self._pending[key] = pending
+
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.access_token
+
+        try:
+            access_token, expires_at = fetch()
+            self.put(key, access_token, expires_at)
+            pending.access_token = access_token
+            return access_token
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
+
+    def _refresh_due(self, key: TokenKey,
+                     fetch: Callable[[], Tuple[str, float]]) -> None:
+        """Refresh a token in use in the background once it is due, the
+            caller keeps the current token.
+        """
+        if not self.proactive_refresh:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is None or entry["refresh_at"] > time.time()
+                    or key in self._pending):
+                return None
+            # One refresh per token, until the new one is stored.
+            entry["refresh_at"] = entry["expires_at"]
+        thread = threading.Thread(target=self._refresh, args=(key, fetch),
+                                  daemon=True)
+        thread.start()
+        return None
+
+    def _refresh(self, key: TokenKey,
+                 fetch: Callable[[], Tuple[str, float]]) -> None:
+        try:
+            # Readers keep getting the current token meanwhile.
+            self._fetch_shared(key, fetch)
+        except Exception:
+            # The next caller requests the token itself.
+            pass
+        return None
+
+    def clear(self) -> None:
+        """Method to drop every token.
+        """
+        with self._lock:
+            self._entries = {}
+        return None
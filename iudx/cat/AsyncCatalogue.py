@@ -0,0 +1,123 @@
+"""Module doc string. Leave empty for now.
+
+AsyncCatalogue.py
+"""
+
+from typing import TypeVar, Dict
+
+from iudx.common.AsyncHTTPEntity import AsyncHTTPEntity
+from iudx.common.HTTPResponse import HTTPResponse
+
+from iudx.cat.CatalogueQuery import CatalogueQuery
+from iudx.cat.CatalogueResult import CatalogueResult
+
+AsyncCatalogue = TypeVar('T')
+
+
+class AsyncCatalogue():
+    """Asyncio counterpart of Catalogue. Helps to query the catalogue
+       server from an event loop.
+    """
+
+    def __init__(self, cat_url: str=None, token: str=None,
+                 headers: Dict[str, str]=None,
+                 http_entity: AsyncHTTPEntity=None):
+        """AsyncCatalogue base class constructor
+
+        Args:
+            cat_url (String): Catalogue server url.
+            token (String): Access token for the catalogue.
+            headers (Dict): Headers passed with the API Request.
+            http_entity (AsyncHTTPEntity): Shared async transport.
+        """
+        if (cat_url is not None):
+            self.url: str = cat_url
+        else:
+            self.url = "https://cos.iudx.org.in/iudx/cat/v1"
+        self.token: str = token
+        self.headers: Dict[str, str] = headers if headers is not None else {}
+        if http_entity is None:
+            http_entity = AsyncHTTPEntity()
+        self.http_entity: AsyncHTTPEntity = http_entity
+        return
+
+    async def _get(self, url: str) -> CatalogueResult:
+        response: HTTPResponse = await self.http_entity.get(url, dict(self.headers))
+        result_data = response.get_json()
+
+        cat_result = CatalogueResult()
+        if response.get_status_code() == 200:
+            cat_result.documents = result_data["results"]
+            cat_result.total_hits = result_data["totalHits"]
+            cat_result.status = result_data["type"]
+        return cat_result
+
+    async def search_entity(self, query: CatalogueQuery) -> CatalogueResult:
+        """Method to get the search response for entities, based on a query.
+
+        Args:
+            query (CatalogueQuery): A query object of CatalogueQuery class.
+        Returns:
+            cat_result (CatalogueResult): returns a CatalogueResult object.
+        """
+        url = self.url + "/search"
+        url = url + "?" + query.get_query()
+        return await self._get(url)
+
+    async def count_entity(self, query: CatalogueQuery) -> CatalogueResult:
+        """Method to get the count response for entities, based on a query.
+
+        Args:
+            query (CatalogueQuery): A query object of CatalogueQuery class.
+        Returns:
+            cat_result (CatalogueResult): returns a CatalogueResult object.
+        """
+        url = self.url + "/count"
+        url = url + "?" + query.get_query()
+        return await self._get(url)
+
+    async def list_entity(self, entity_type: str) -> CatalogueResult:
+        """Method to get the list response for entities, based on an entity type.
+
+        Args:
+            entity_type (String): type must be either resource,
+                resourceGroup, resourceServer.
+        Returns:
+            cat_result (CatalogueResult): returns a CatalogueResult object.
+        """
+        url = self.url + "/list"
+        url = url + "/" + entity_type
+        return await self._get(url)
+
+    async def get_related_entity(self, iid: str, rel: str) -> CatalogueResult:
+        """Method to get the relationship response for entities,
+                based on their id and relation.
+
+        Args:
+            iid (String): Id of the entity.
+            rel (String): Relationship attribute of the entity
+                whose id is provided.
+        Returns:
+            cat_result (CatalogueResult): returns a CatalogueResult object.
+        """
+        url = self.url + "/relationship"
+        url = url + "?" + "id=" + iid + "&" + "rel=" + rel
+        return await self._get(url)
+
+    async def get_item(self, iid: str) -> CatalogueResult:
+        """Method to get the catalogue document of an item.
+
+        Args:
+            iid (String): Id of the item.
+        Returns:
+            cat_result (CatalogueResult): returns a CatalogueResult object.
+        """
+        url = self.url + "/item"
+        url = url + "?" + "id=" + iid
+        return await self._get(url)
+
+    async def close(self) -> None:
+        """Method to close the connections of the async transport.
+        """
+        await self.http_entity.close()
+        return None
@@ -3,13 +3,16 @@
 Catalogue.py
 """
 
-from typing import TypeVar, Generic, Any, List, Dict
+import copy
+from typing import TypeVar, Generic, Any, List, Dict, Tuple
 
 from iudx.common.HTTPEntity import HTTPEntity
 from iudx.common.HTTPResponse import HTTPResponse
+from iudx.common.Transport import Transport
 
 from iudx.cat.CatalogueQuery import CatalogueQuery
 from iudx.cat.CatalogueResult import CatalogueResult
+from iudx.cat.CatalogueCache import CatalogueCache
 
 
 class Catalogue():
@@ -18,13 +21,17 @@ class Catalogue():
     """
 
     def __init__(self, cat_url: str=None, token: str=None,
-                 headers: Dict[str, str]=None):
-        """Pydoc heading.
+                 headers: Dict[str, str]=None, transport: Transport=None,
+                 cache: CatalogueCache=None):
+        """Catalogue base class constructor
 
         Args:
-            argument (argument-type): argument-description
-        Returns:
-            returned-varaible (returned-varaible-type): return-variable-description
+            cat_url (String): Catalogue server url.
+            token (String): Token for the catalogue.
+            headers (Dict): Headers passed with the API Request.
+            transport (Transport): Connection pool shared with other clients.
+            cache (CatalogueCache): Cache of the item, search, list and
+                relationship responses, not cached when None.
         """
         if (cat_url is not None):
             self.url: str = cat_url
@@ -32,8 +39,41 @@ class Catalogue():
             self.url = "https://cos.iudx.org.in/iudx/cat/v1"
         self.token: str = token
         self.headers: Dict[str, str] = headers
+        self.transport: Transport = transport
+        self.cache: CatalogueCache = cache
         return
 
+    def _get(self, url: str) -> Tuple[int, Dict]:
+        """Send a GET request through the cache, revalidating expired
+            responses with their ETag or Last-Modified header.
+        """
+        entry = None
+        headers = self.headers
+        if self.cache is not None:
+            entry = self.cache.get(url)
+            if entry is not None:
+                if self.cache.is_fresh(entry):
+                    return 200, copy.deepcopy(entry["body"])
+                headers = dict(self.headers or {})
+                if entry["etag"] is not None:
+                    headers["If-None-Match"] = entry["etag"]
+                if entry["last_modified"] is not None:
+                    headers["If-Modified-Since"] = entry["last_modified"]
+
+        http_entity = HTTPEntity(transport=self.transport)
+        response: HTTPResponse = http_entity.get(url, headers)
+        if response.get_status_code() == 304 and entry is not None:
+            self.cache.revalidated(url, entry)
+            return 200, copy.deepcopy(entry["body"])
+
+        result_data = response.get_json()
+        if self.cache is not None and response.get_status_code() == 200:
+            response_headers = response.get_headers()
+            self.cache.put(url, copy.deepcopy(result_data),
+                           etag=response_headers.get("ETag"),
+                           last_modified=response_headers.get("Last-Modified"))
+        return response.get_status_code(), result_data
+
     def status(self) -> bool:
         """Pydoc heading.
 
@@ -54,12 +94,10 @@ class Catalogue():
         """
         url = self.url + "/search"
         url = url + "?" + query.get_query()
-        http_entity = HTTPEntity()
-        response: HTTPResponse = http_entity.get(url, self.headers)
-        result_data = response.get_json()
+        status, result_data = self._get(url)
 
         cat_result = CatalogueResult()
-        if response.get_status_code() == 200:
+        if status == 200:
             cat_result.documents = result_data["results"]
             cat_result.total_hits = result_data["totalHits"]
             cat_result.status = result_data["type"]
@@ -75,7 +113,7 @@ class Catalogue():
         """
         url = self.url + "/count"
         url = url + "?" + query.get_query()
-        http_entity = HTTPEntity()
+        http_entity = HTTPEntity(transport=self.transport)
         response: HTTPResponse = http_entity.get(url, self.headers)
         result_data = response.get_json()
 
@@ -97,12 +135,10 @@ class Catalogue():
         """
         url = self.url + "/list"
         url = url + "/" + entity_type
-        http_entity = HTTPEntity()
-        response: HTTPResponse = http_entity.get(url, self.headers)
-        result_data = response.get_json()
+        status, result_data = self._get(url)
 
         cat_result = CatalogueResult()
-        if response.get_status_code() == 200:
+        if status == 200:
             cat_result.documents = result_data["results"]
             cat_result.total_hits = result_data["totalHits"]
             cat_result.status = result_data["type"]
@@ -121,12 +157,10 @@ class Catalogue():
         """
         url = self.url + "/relationship"
         url = url + "?" + "id=" + iid + "&" + "rel=" + rel
-        http_entity = HTTPEntity()
-        response: HTTPResponse = http_entity.get(url, self.headers)
-        result_data = response.get_json()
+        status, result_data = self._get(url)
 
         cat_result = CatalogueResult()
-        if response.get_status_code() == 200:
+        if status == 200:
             cat_result.documents = result_data["results"]
             cat_result.total_hits = result_data["totalHits"]
             cat_result.status = result_data["type"]
@@ -154,12 +188,10 @@ class Catalogue():
         """
         url = self.url + "/item"
         url = url + "?" + "id=" + iid
-        http_entity = HTTPEntity()
-        response: HTTPResponse = http_entity.get(url, self.headers)
-        result_data = response.get_json()
+        status, result_data = self._get(url)
 
         cat_result = CatalogueResult()
-        if response.get_status_code() == 200:
+        if status == 200:
             cat_result.documents = result_data["results"]
             cat_result.total_hits = result_data["totalHits"]
             cat_result.status = result_data["type"]
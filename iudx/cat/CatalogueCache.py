@@ -0,0 +1,143 @@
+"""Module doc string. Leave empty for now.
+
+CatalogueCache.py
+"""
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import TypeVar, Dict
+
+from iudx.common.JSONCodec import JSONCodec
+
+
+CatalogueCache = TypeVar('T')
+
+
+class CatalogueCache():
+    """Cache of catalogue responses keyed by request url, kept in memory
+       with least recently used eviction and optionally on disk. Entries
+       are served locally for 'ttl' seconds, after that they are
+       revalidated with their ETag or Last-Modified header so unchanged
+       documents are not downloaded again.
+    """
+
+    def __init__(self: CatalogueCache, ttl: float = 3600.0,
+                 max_entries: int = 4096, path: str = None):
+        """CatalogueCache base class constructor
+
+        Args:
+            ttl (Float): Seconds a response is used without revalidation.
+            max_entries (Integer): Responses kept in memory.
+            path (String): Directory the responses are also stored in, in
+                memory only when None.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = os.path.expanduser(path) if path is not None else None
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def get(self, url: str) -> Dict:
+        """Method to return the cached response of a url.
+
+        Args:
+            url (String): Request url.
+        Returns:
+            entry (Dict): 'body', 'etag', 'last_modified' and 'stored'
+                time of the response, None when not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+
+        entry = self._read(url)
+        if entry is not None:
+            with self._lock:
+                self._remember(url, entry)
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Method to check whether a response can be used without
+            revalidation.
+        """
+        return time.time() - entry["stored"] < self.ttl
+
+    def put(self, url: str, body: Dict, etag: str = None,
+            last_modified: str = None) -> None:
+        """Method to store the response of a url.
+
+        Args:
+            url (String): Request url.
+            body (Dict): Decoded response body.
+            etag (String): ETag header of the response.
+            last_modified (String): Last-Modified header of the response.
+        """
+        entry = {"url": url, "body": body, "etag": etag,
+                 "last_modified": last_modified, "stored": time.time()}
+        with self._lock:
+            self._remember(url, entry)
+        self._write(url, entry)
+        return None
+
+    def revalidated(self, url: str, entry: Dict) -> None:
+        """Method to restart the TTL of a response the server reported
+            unchanged.
+
+        Args:
+            url (String): Request url.
+            entry (Dict): The cached response.
+        """
+        entry = dict(entry, stored=time.time())
+        with self._lock:
+            self._remember(url, entry)
+        self._write(url, entry)
+        return None
+
+    def clear(self) -> None:
+        """Method to drop every response, in memory and on disk.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self.path is not None and os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.path, name))
+        return None
+
+    def _remember(self, url: str, entry: Dict) -> None:
+        self._entries[url] = entry
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _file(self, url: str) -> str:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.path, name)
+
+    def _read(self, url: str) -> Dict:
+        if self.path is None:
+            return None
+        try:
+            with open(self._file(url), "r") as f:
+                entry = JSONCodec.get_default().load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def _write(self, url: str, entry: Dict) -> None:
+        if self.path is None:
+            return None
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            JSONCodec.get_default().dump(entry, f)
+        os.replace(tmp_path, self._file(url))
+        return None
@@ -0,0 +1,145 @@
+"""Module doc string. Leave empty for now.
+
+AsyncHTTPEntity.py
+"""
+import asyncio
+import time
+from typing import TypeVar, Dict
+
+import aiohttp
+
+from iudx.common.AsyncHTTPResponse import AsyncHTTPResponse
+
+
+AsyncHTTPEntity = TypeVar("T")
+
+
+class AsyncHTTPEntity():
+    """Asyncio counterpart of HTTPEntity. Sends API requests over a pooled
+       aiohttp session and bounds the number of requests in flight.
+    """
+
+    def __init__(self: AsyncHTTPEntity, max_in_flight: int = 64,
+                 pool_maxsize: int = 100, keep_alive: bool = True,
+                 timeout: float = None):
+        """AsyncHTTPEntity base class constructor
+
+        Args:
+            max_in_flight (Integer): Maximum concurrent requests.
+            pool_maxsize (Integer): Maximum open connections.
+            keep_alive (Boolean): Reuse connections between requests.
+            timeout (Float): Total timeout in seconds for every request.
+        """
+        self.max_in_flight = max_in_flight
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self._session: aiohttp.ClientSession = None
+        self._semaphore: asyncio.Semaphore = None
+        return
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                force_close=not self.keep_alive,
+                )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._session
+
+    async def request(self, method: str, url: str, headers: Dict,
+                      body: str = None) -> AsyncHTTPResponse:
+        """Method to send an API request and read the full response.
+
+        Args:
+            method (String): HTTP method of the API Request.
+            url (String): Base URL for the API Request.
+            headers (Dict): Headers passed with the API Request.
+            body (String): Data for the body passed with the API Request.
+        Returns:
+            response (AsyncHTTPResponse): HTTP Response after the API Request.
+        """
+        session = self._get_session()
+        async with self._semaphore:
+            start = time.monotonic()
+            async with session.request(method, url, data=body,
+                                       headers=headers) as response:
+                content = await response.read()
+                http_response = AsyncHTTPResponse(
+                    status=response.status,
+                    content=content,
+                    headers=dict(response.headers),
+                    elapsed=time.monotonic() - start,
+                    )
+        return http_response
+
+    async def get(self, url: str, headers: Dict) -> AsyncHTTPResponse:
+        """Method to create a 'GET' API request and returns response.
+
+        Args:
+            url (String): Base URL for the API Request.
+            headers (Dict): Headers passed with the API Request.
+        Returns:
+            response (AsyncHTTPResponse): HTTP Response after the API Request.
+        """
+        if "content-type" not in headers.keys():
+            headers["content-type"] = "application/json"
+        return await self.request("GET", url, headers)
+
+    async def delete(self, url: str, headers: Dict) -> AsyncHTTPResponse:
+        """Method to create a 'DELETE' API request and returns response.
+
+        Args:
+            url (String): Base URL for the API Request.
+            headers (Dict): Headers passed with the API Request.
+        Returns:
+            response (AsyncHTTPResponse): HTTP Response after the API Request.
+        """
+        return await self.request("DELETE", url, headers)
+
+    async def post(self, url: str, body: str,
+                   headers: Dict) -> AsyncHTTPResponse:
+        """Method to create a 'POST' API request and returns response.
+
+        Args:
+            url (String): Base URL for the API Request.
+            body (String): Data for the body passed with the API Request.
+            headers (Dict): Headers passed with the API Request.
+        Returns:
+            response (AsyncHTTPResponse): HTTP Response after the API Request.
+        """
+        if "content-type" not in headers.keys():
+            headers["content-type"] = "application/json"
+        return await self.request("POST", url, headers, body)
+
+    async def update(self, url: str, body: str,
+                     headers: Dict) -> AsyncHTTPResponse:
+        """Method to create a 'PUT' API request and returns response.
+
+        Args:
+            url (String): Base URL for the API Request.
+            body (String): Data for the body passed with the API Request.
+            headers (Dict): Headers passed with the API Request.
+        Returns:
+            response (AsyncHTTPResponse): HTTP Response after the API Request.
+        """
+        return await self.request("PUT", url, headers, body)
+
+    async def close(self) -> None:
+        """Method to close the pooled connections of the session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        return None
+
+    async def __aenter__(self) -> AsyncHTTPEntity:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,89 @@
+"""Module doc string. Leave empty for now.
+
+AsyncHTTPResponse.py
+"""
+from typing import TypeVar, Dict, Iterator
+
+from iudx.common.HTTPResponse import HTTPResponse, iter_json_results
+from iudx.common.JSONCodec import JSONCodec
+
+
+AsyncHTTPResponse = TypeVar('T')
+
+
+class AsyncHTTPResponse(HTTPResponse):
+    """Response returned by AsyncHTTPEntity. The body is read completely
+       before the connection is released, so the accessors are plain
+       synchronous methods like the ones of HTTPResponse.
+    """
+
+    def __init__(self: AsyncHTTPResponse, status: int = None,
+                 content: bytes = b"", headers: Dict = None,
+                 elapsed: float = None):
+        """AsyncHTTPResponse base class constructor
+
+        Args:
+            status (Integer): Status code of the response.
+            content (Bytes): Raw body of the response.
+            headers (Dict): Headers of the response.
+            elapsed (Float): Seconds until the response arrived.
+        """
+        HTTPResponse.__init__(self)
+        self._status = status
+        self._content = content
+        self._headers = headers if headers is not None else {}
+        self._elapsed = elapsed
+        return
+
+    def get_json(self) -> Dict:
+        """Method to return the json object for the response body.
+
+        Returns:
+            result_json (Dict): Returns json data.
+        """
+        result_json = JSONCodec.get_default().loads(self._content)
+        return result_json
+
+    def iter_results(self, batch_size: int = None,
+                     chunk_size: int = 65536) -> Iterator:
+        """Method to decode the 'results' array of the response body
+            record by record.
+
+        Args:
+            batch_size (Integer): Yield lists of this many records instead
+                of single records.
+            chunk_size (Integer): Bytes decoded at a time.
+        Yields:
+            record (Dict/List[Dict]): A record, or a batch of records.
+        """
+        self.meta = {}
+        chunks = (
+            self._content[i:i + chunk_size]
+            for i in range(0, len(self._content), chunk_size)
+        )
+        yield from iter_json_results(chunks, batch_size=batch_size,
+                                     meta=self.meta)
+
+    def get_elapsed(self) -> float:
+        """Method to return the time taken by the server to respond.
+
+        Returns:
+            elapsed (Float): Seconds until the response arrived.
+        """
+        return self._elapsed
+
+    def get_content_length(self) -> int:
+        """Method to return the size of the response body.
+
+        Returns:
+            length (Integer): Bytes in the response body.
+        """
+        return len(self._content)
+
+    def get_status_code(self) -> int:
+        """Method to return the status code for the response.
+
+        Returns:
+            status (Integer): Returns numerical status code for the Response.
+        """
+        return self._status
@@ -0,0 +1,148 @@
+"""Module doc string. Leave empty for now.
+
+CircuitBreaker.py
+"""
+import threading
+import time
+from typing import TypeVar, Dict
+from urllib.parse import urlsplit
+
+
+CircuitBreaker = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is refused because the circuit of its host
+       is open.
+    """
+
+
+class CircuitBreaker():
+    """Per-host circuit breaker for HTTPEntity. After a number of
+       consecutive failures requests to the host are refused for a cool
+       down period, then a single trial request decides whether the
+       circuit closes again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    _default: CircuitBreaker = None
+
+    def __init__(self: CircuitBreaker, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        """CircuitBreaker base class constructor
+
+        Args:
+            failure_threshold (Integer): Consecutive failures opening the
+                circuit of a host.
+            reset_timeout (Float): Seconds the circuit stays open before
+                a trial request is let through.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._hosts: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        return
+
+    @classmethod
+    def get_default(cls) -> CircuitBreaker:
+        """Method to return the breaker used when none is supplied.
+
+        Returns:
+            circuit_breaker (CircuitBreaker): The default CircuitBreaker.
+        """
+        if cls._default is None:
+            cls._default = CircuitBreaker()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, circuit_breaker: CircuitBreaker) -> None:
+        """Method to replace the breaker used when none is supplied.
+
+        Args:
+            circuit_breaker (CircuitBreaker): The new default breaker.
+        """
+        cls._default = circuit_breaker
+        return None
+
+    def _get_host(self, url: str) -> Dict:
+        host = urlsplit(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = {
+                "state": CircuitBreaker.CLOSED,
+                "failures": 0,
+                "opened_at": 0.0,
+            }
+        return self._hosts[host]
+
+    def get_state(self, url: str) -> str:
+        """Method to return the state of the circuit for a url.
+
+        Args:
+            url (String): URL, or host, of the API Request.
+        Returns:
+            state (String): 'closed', 'open' or 'half_open'.
+        """
+        with self._lock:
+            return self._get_host(url)["state"]
+
+    def before_request(self, url: str) -> None:
+        """Method to check whether a request may be sent to the host.
+
+        Args:
+            url (String): URL of the API Request.
+        Raises:
+            CircuitOpenError: If the circuit of the host is open.
+        """
+        with self._lock:
+            host = self._get_host(url)
+            if host["state"] == CircuitBreaker.CLOSED:
+                return None
+            # Let one trial request through per cool down period.
+            if time.monotonic() - host["opened_at"] >= self.reset_timeout:
+                host["state"] = CircuitBreaker.HALF_OPEN
+                host["opened_at"] = time.monotonic()
+                return None
+            raise CircuitOpenError(
+                f"Circuit open for '{urlsplit(url).netloc}', "
+                "too many consecutive failures."
+            )
+
+    def record_success(self, url: str) -> None:
+        """Method to record a successful request to the host.
+
+        Args:
+            url (String): URL of the API Request.
+        """
+        with self._lock:
+            host = self._get_host(url)
+            host["state"] = CircuitBreaker.CLOSED
+            host["failures"] = 0
+        return None
+
+    def record_failure(self, url: str) -> None:
+        """Method to record a failed request to the host.
+
+        Args:
+            url (String): URL of the API Request.
+        """
+        with self._lock:
+            host = self._get_host(url)
+            host["failures"] += 1
+            if (host["state"] == CircuitBreaker.HALF_OPEN
+                    or host["failures"] >= self.failure_threshold):
+                host["state"] = CircuitBreaker.OPEN
+                host["opened_at"] = time.monotonic()
+        return None
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
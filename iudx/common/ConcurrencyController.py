@@ -0,0 +1,132 @@
+"""Module doc string. Leave empty for now.
+
+ConcurrencyController.py
+"""
+import threading
+import time
+from collections import deque
+from typing import TypeVar, Dict, List
+
+
+ConcurrencyController = TypeVar("T")
+
+
+class ConcurrencyController():
+    """Adaptive (AIMD) limit on the requests a client keeps in flight.
+       The limit grows by one request per round trip while responses
+       are healthy, and is cut multiplicatively on 429/5xx responses,
+       errors, or when the p95 latency drifts above its baseline. The
+       baseline follows the lowest p95 down at once and lasting rises
+       slowly up, so a slower mix of requests becomes the new normal.
+    """
+
+    def __init__(self: ConcurrencyController, initial_limit: int = 4,
+                 min_limit: int = 1, max_limit: int = 32,
+                 decrease_factor: float = 0.5, latency_window: int = 100,
+                 latency_tolerance: float = 2.0,
+                 baseline_rise: float = 0.05):
+        """ConcurrencyController base class constructor
+
+        Args:
+            initial_limit (Integer): Requests in flight to start with.
+            min_limit (Integer): Lower bound of the limit.
+            max_limit (Integer): Upper bound of the limit.
+            decrease_factor (Float): Factor applied to the limit on backoff.
+            latency_window (Integer): Latencies kept for the percentiles.
+            latency_tolerance (Float): Backoff when the p95 latency exceeds
+                its baseline by this factor.
+            baseline_rise (Float): Fraction of the gap to a higher p95 the
+                baseline moves up per healthy response.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_rise = baseline_rise
+
+        self._in_flight = 0
+        self._latencies = deque(maxlen=latency_window)
+        self._baseline_p95: float = None
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._failures = 0
+        self._cond = threading.Condition()
+        return
+
+    def acquire(self) -> None:
+        """Method to block until one more request may be sent.
+        """
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return None
+
+    def release(self, latency: float = None, status: int = None,
+                error: bool = False) -> None:
+        """Method to report the outcome of a request and adapt the limit.
+
+        Args:
+            latency (Float): Seconds the request took.
+            status (Integer): Status code of the response.
+            error (Boolean): The request failed without a response.
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if latency is not None:
+                self._latencies.append(latency)
+
+            if error or status == 429 or (status is not None and status >= 500):
+                self._failures += 1
+                self._decrease()
+            else:
+                self._successes += 1
+                p95 = self._percentile(0.95)
+                if p95 is not None and len(self._latencies) >= 20:
+                    if self._baseline_p95 is None or p95 < self._baseline_p95:
+                        self._baseline_p95 = p95
+                    else:
+                        self._baseline_p95 += (p95 - self._baseline_p95) * self.baseline_rise
+                if (self._baseline_p95 is not None and p95 is not None
+                        and p95 > self._baseline_p95 * self.latency_tolerance):
+                    self._decrease()
+                else:
+                    # Additive increase, about one request per round trip.
+                    self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+        return None
+
+    def _decrease(self) -> None:
+        # Responses of one overloaded round trip arrive together, back off
+        # at most once per typical latency.
+        now = time.monotonic()
+        p50 = self._percentile(0.5) or 0.0
+        if now - self._last_decrease < p50:
+            return None
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        return None
+
+    def _percentile(self, q: float) -> float:
+        if len(self._latencies) == 0:
+            return None
+        latencies: List[float] = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    def get_stats(self) -> Dict:
+        """Method to return the current concurrency and latency stats.
+
+        Returns:
+            stats (Dict): Limit, requests in flight, latency percentiles
+                in seconds and counts of healthy and failed requests.
+        """
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self._in_flight,
+                "p50_latency": self._percentile(0.5),
+                "p95_latency": self._percentile(0.95),
+                "successes": self._successes,
+                "failures": self._failures,
+            }
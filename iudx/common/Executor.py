@@ -0,0 +1,232 @@
+"""Module doc string. Leave empty for now.
+
+Executor.py
+"""
+import atexit
+import multiprocessing
+import multiprocessing.pool
+import os
+import threading
+from typing import TypeVar, Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from iudx.common.RateLimiter import RateLimiter
+
+
+Executor = TypeVar("T")
+
+
+class InlineResult():
+    """Result of a task run by InlinePool, mirroring AsyncResult.
+    """
+
+    def __init__(self, value: Any = None, error: BaseException = None):
+        self._value = value
+        self._error = error
+
+    def ready(self) -> bool:
+        return True
+
+    def successful(self) -> bool:
+        return self._error is None
+
+    def wait(self, timeout: float = None) -> None:
+        return None
+
+    def get(self, timeout: float = None) -> Any:
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class InlinePool():
+    """Pool look-alike which runs every task in the calling thread.
+       Useful for debugging and for environments without fork support.
+    """
+
+    def starmap(self, fn: Callable, iterable: Iterable[Tuple]) -> List:
+        return [fn(*args) for args in iterable]
+
+    def map(self, fn: Callable, iterable: Iterable) -> List:
+        return [fn(arg) for arg in iterable]
+
+    def imap(self, fn: Callable, iterable: Iterable) -> Iterator:
+        for arg in iterable:
+            yield fn(arg)
+
+    imap_unordered = imap
+
+    def apply_async(self, fn: Callable, args: Tuple = (), kwds: Dict = None,
+                    callback: Callable = None,
+                    error_callback: Callable = None) -> InlineResult:
+        try:
+            value = fn(*args, **(kwds or {}))
+        except Exception as e:
+            if error_callback is not None:
+                error_callback(e)
+            return InlineResult(error=e)
+        if callback is not None:
+            callback(value)
+        return InlineResult(value=value)
+
+    def close(self) -> None:
+        return None
+
+    def terminate(self) -> None:
+        return None
+
+    def join(self) -> None:
+        return None
+
+
+class Executor():
+    """Lazily created worker pool used to fan out API requests.
+       The pool is one of 'thread', 'process' or 'inline' and is only
+       started on the first task, so constructing clients stays cheap.
+       Executor.shared() hands out one executor per kind and size.
+    """
+
+    KINDS = ("thread", "process", "inline")
+
+    _shared: Dict[Tuple[str, int], Executor] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self: Executor, kind: str = "thread", workers: int = None):
+        """Executor base class constructor
+
+        Args:
+            kind (String): One of 'thread', 'process' or 'inline'.
+            workers (Integer): Number of workers, defaults to the cpu count
+                for processes and to five times the cpu count for threads.
+        """
+        if kind not in Executor.KINDS:
+            raise ValueError(
+                f"Executor kind '{kind}' is not supported. "
+                f"Please choose one of: {Executor.KINDS}"
+            )
+        if workers is None:
+            if kind == "thread":
+                workers = min(32, multiprocessing.cpu_count() * 5)
+            elif kind == "process":
+                workers = multiprocessing.cpu_count()
+            else:
+                workers = 1
+
+        self.kind = kind
+        self.workers = workers
+
+        self._pool = None
+        self._pid = os.getpid()
+        self._refs = 0
+        self._lock = threading.Lock()
+        return
+
+    @classmethod
+    def shared(cls, kind: str = "thread", workers: int = None) -> Executor:
+        """Method to return the executor shared by every client that asks
+            for the same kind and number of workers.
+
+        Args:
+            kind (String): One of 'thread', 'process' or 'inline'.
+            workers (Integer): Number of workers.
+        Returns:
+            executor (Executor): The shared Executor object.
+        """
+        with cls._shared_lock:
+            executor = cls._shared.get((kind, workers))
+            if executor is None:
+                executor = Executor(kind=kind, workers=workers)
+                cls._shared[(kind, workers)] = executor
+        return executor
+
+    @property
+    def pool(self):
+        """The underlying pool, created on first access.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # A pool inherited through fork has no live workers.
+                self._pool = None
+                self._pid = os.getpid()
+            if self._pool is None:
+                if self.kind == "thread":
+                    self._pool = multiprocessing.pool.ThreadPool(
+                        processes=self.workers)
+                elif self.kind == "process":
+                    # Workers share the rate limiter buckets of this process.
+                    self._pool = multiprocessing.Pool(
+                        processes=self.workers,
+                        initializer=RateLimiter._install,
+                        initargs=RateLimiter._export(),
+                        )
+                else:
+                    self._pool = InlinePool()
+            return self._pool
+
+    def starmap(self, fn: Callable, iterable: Iterable[Tuple]) -> List:
+        """Method to run a function over argument tuples on the pool.
+
+        Args:
+            fn (Callable): Function to be called.
+            iterable (Iterable[Tuple]): Arguments for every call.
+        Returns:
+            results (List): Return values in the order of the arguments.
+        """
+        return self.pool.starmap(fn, iterable)
+
+    def apply_async(self, fn: Callable, args: Tuple = (),
+                    callback: Callable = None,
+                    error_callback: Callable = None):
+        """Method to run a function on the pool without waiting for it.
+
+        Args:
+            fn (Callable): Function to be called.
+            args (Tuple): Arguments of the call.
+            callback (Callable): Called with the return value.
+            error_callback (Callable): Called with the raised exception.
+        Returns:
+            result (AsyncResult): Handle to the pending result.
+        """
+        return self.pool.apply_async(fn, args, callback=callback,
+                                     error_callback=error_callback)
+
+    def acquire(self) -> Executor:
+        """Method to register a client using the executor.
+        """
+        with self._lock:
+            self._refs += 1
+        return self
+
+    def release(self) -> None:
+        """Method to unregister a client, the pool is shut down when
+            no client is left.
+        """
+        with self._lock:
+            self._refs = max(0, self._refs - 1)
+            refs = self._refs
+        if refs == 0:
+            self.close()
+        return None
+
+    def close(self) -> None:
+        """Method to shut down the workers of the pool. A later task
+            starts a new pool.
+        """
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None and self._pid == os.getpid():
+            pool.terminate()
+            pool.join()
+        return None
+
+    def __enter__(self) -> Executor:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+@atexit.register
+def _close_shared_executors() -> None:
+    for executor in list(Executor._shared.values()):
+        executor.close()
@@ -3,11 +3,15 @@
 HTTPEntity.py
 """
 
-from requests import Request, Session
+from requests import Request
 from typing import TypeVar, Dict
 from iudx.common.HTTPResponse import HTTPResponse
+from iudx.common.Transport import Transport
+from iudx.common.RetryPolicy import RetryPolicy
+from iudx.common.CircuitBreaker import CircuitBreaker
+from iudx.common.RateLimiter import RateLimiter
 import json
-import warnings
+import time
 
 
 HTTPEntity = TypeVar("T")
@@ -18,37 +22,121 @@ class HTTPEntity(Request):
     for the API Request in Python.
     """
 
-    def __init__(self: HTTPEntity, cert: Dict = None):
+    def __init__(self: HTTPEntity, cert: Dict = None,
+                 transport: Transport = None,
+                 retry_policy: RetryPolicy = None,
+                 circuit_breaker: CircuitBreaker = None,
+                 rate_limiter: RateLimiter = None):
         """HTTPEntity base class constructor
 
         Args:
             cert (Dict): certificate for authentication.
+            transport (Transport): Connection pool used to send requests,
+                defaults to the process wide shared transport.
+            retry_policy (RetryPolicy): When and how often failed requests
+                are re-sent, defaults to RetryPolicy.get_default().
+            circuit_breaker (CircuitBreaker): Per-host breaker, defaults
+                to CircuitBreaker.get_default().
+            rate_limiter (RateLimiter): Client side rate limits, defaults
+                to RateLimiter.get_default().
         """
-        warnings.filterwarnings(
-            action="ignore", message="unclosed", category=ResourceWarning
-        )
         Request.__init__(self)
+        self._transport = transport
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._rate_limiter = rate_limiter
         return
 
-    def get(self, url: str, headers: Dict) -> HTTPResponse:
+    @property
+    def transport(self) -> Transport:
+        if self._transport is None:
+            return Transport.get_default()
+        return self._transport
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        if self._retry_policy is None:
+            return RetryPolicy.get_default()
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        if self._circuit_breaker is None:
+            return CircuitBreaker.get_default()
+        return self._circuit_breaker
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        if self._rate_limiter is None:
+            return RateLimiter.get_default()
+        return self._rate_limiter
+
+    def send(self, request: Request, stream: bool = False) -> HTTPResponse:
+        """Method to send a request through the pooled transport,
+            retrying it according to the retry policy.
+
+        Args:
+            request (Request): The API Request to be sent.
+            stream (Boolean): Defer reading the body, see
+                HTTPResponse.iter_results.
+        Returns:
+            response (HTTPResponse): HTTP Response after the API Request,
+                the last one if every attempt failed.
+        Raises:
+            CircuitOpenError: If the circuit of the host is open.
+        """
+        prepared_req = request.prepare()
+        url = prepared_req.url
+        retry_policy = self.retry_policy
+        circuit_breaker = self.circuit_breaker
+        rate_limiter = self.rate_limiter
+
+        attempt = 0
+        while True:
+            attempt += 1
+            circuit_breaker.before_request(url)
+            rate_limiter.acquire(url)
+            try:
+                response = self.transport.send(prepared_req.copy(), stream=stream)
+            except Exception as e:
+                if not retry_policy.is_retryable_exception(e):
+                    raise
+                circuit_breaker.record_failure(url)
+                if attempt >= retry_policy.max_attempts:
+                    raise
+                time.sleep(retry_policy.get_backoff(attempt))
+                continue
+
+            if response.status_code >= 500:
+                circuit_breaker.record_failure(url)
+            else:
+                circuit_breaker.record_success(url)
+
+            if (attempt >= retry_policy.max_attempts
+                    or not retry_policy.is_retryable_status(response.status_code)):
+                break
+            backoff = retry_policy.get_backoff(attempt, response)
+            response.close()
+            time.sleep(backoff)
+
+        http_response = HTTPResponse()
+        http_response._response = response
+        return http_response
+
+    def get(self, url: str, headers: Dict, stream: bool = False) -> HTTPResponse:
         """Method to create a 'GET' API request and returns response.
 
         Args:
             url (String): Base URL for the API Request.
             headers (Dict): Headers passed with the API Request.
+            stream (Boolean): Defer reading the body of the response.
         Returns:
             response (HTTPResponse): HTTP Response after the API Request.
         """
-        s = Session()
         request = Request("GET", url, headers=headers)
         if "content-type" not in headers.keys():
             headers["content-type"] = "application/json"
-        prepared_req = request.prepare()
-
-        response = s.send(prepared_req)
-        http_response = HTTPResponse()
-        http_response._response = response
-        return http_response
+        return self.send(request, stream=stream)
 
     def delete(self, url: str, headers: Dict) -> HTTPResponse:
         """Method to create a 'DELETE' API request and returns response.
@@ -59,34 +147,25 @@ class HTTPEntity(Request):
         Returns:
             response (HTTPResponse): HTTP Response after the API Request.
         """
-        s = Session()
         request = Request("DELETE", url, headers=headers)
-        prepared_req = request.prepare()
+        return self.send(request)
 
-        response = s.send(prepared_req)
-        http_response = HTTPResponse()
-        http_response._response = response
-        return http_response
-
-    def post(self, url: str, body: str, headers: Dict) -> HTTPResponse:
+    def post(self, url: str, body: str, headers: Dict,
+             stream: bool = False) -> HTTPResponse:
         """Method to create a 'POST' API request and returns response.
 
         Args:
             url (String): Base URL for the API Request.
             body (Dict): Data for the body passed with the API Request.
             headers (Dict): Headers passed with the API Request.
+            stream (Boolean): Defer reading the body of the response.
         Returns:
             response (HTTPResponse): HTTP Response after the API Request.
         """
-        s = Session()
         if "content-type" not in headers.keys():
             headers["content-type"] = "application/json"
         request = Request("POST", url, data=body, headers=headers)
-        prepared_req = request.prepare()
-        response = s.send(prepared_req)
-        http_response = HTTPResponse()
-        http_response._response = response
-        return http_response
+        return self.send(request, stream=stream)
 
     def update(self, url: str, body: str, headers: Dict) -> HTTPResponse:
         """Method to create a 'PUT' API request and returns response.
@@ -98,11 +177,5 @@ class HTTPEntity(Request):
         Returns:
             response (HTTPResponse): HTTP Response after the API Request.
         """
-        s = Session()
         request = Request("PUT", url, data=body, headers=headers)
-        prepared_req = request.prepare()
-
-        response = s.send(prepared_req)
-        http_response = HTTPResponse()
-        http_response._response = response
-        return http_response
+        return self.send(request)
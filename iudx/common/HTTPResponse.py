@@ -3,11 +3,137 @@
 HTTPEntity.py
 """
 from requests import Response
-from typing import TypeVar, Dict
+from typing import TypeVar, Any, Dict, Iterable, Iterator, List, Union
+import codecs
+import json
+from iudx.common.JSONCodec import JSONCodec
 
 
 HTTPResponse = TypeVar('T')
 
+# Characters which may continue a JSON number.
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _JSONStream():
+    """Incremental reader over chunks of a JSON document. Only the
+       text which hasn't been decoded yet is kept in memory.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            self._buf = self._buf[self._pos:] + self._text_decoder.decode(
+                b"", final=True)
+            self._pos = 0
+            return True
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, None at the end.
+        """
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\n\r":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read():
+                return None
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                f"Malformed JSON: expected '{char}' at '{self._buf[self._pos:self._pos + 20]}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            # A number or literal may continue in the next chunk, also when
+            # it was cut after '1.' or '2e', which decode as a shorter number.
+            if self._buf[self._pos] not in '{["':
+                rest = end
+                while rest < len(self._buf) and self._buf[rest] in _NUMBER_CHARS:
+                    rest += 1
+                if rest == len(self._buf) and self._read():
+                    continue
+            self._pos = end
+            return value
+
+
+def iter_json_results(chunks: Iterable[Union[bytes, str]],
+                      batch_size: int = None,
+                      meta: Dict = None) -> Iterator:
+    """Incrementally decode the 'results' array of a JSON document.
+
+    Args:
+        chunks (Iterable[bytes/str]): The document, in chunks.
+        batch_size (Integer): Yield lists of this many records instead
+            of single records.
+        meta (Dict): Filled with the other top-level fields of the document.
+    Yields:
+        record (Dict/List[Dict]): A record, or a batch of records.
+    """
+    stream = _JSONStream(chunks)
+    batch: List = []
+    if meta is None:
+        meta = {}
+
+    stream.expect("{")
+    while stream.peek() != "}":
+        if stream.peek() == ",":
+            stream.expect(",")
+            continue
+        key = stream.value()
+        stream.expect(":")
+        if key != "results" or stream.peek() != "[":
+            meta[key] = stream.value()
+            continue
+
+        stream.expect("[")
+        while stream.peek() != "]":
+            if stream.peek() == ",":
+                stream.expect(",")
+                continue
+            if stream.peek() is None:
+                raise ValueError("Malformed JSON: unterminated 'results' array")
+            record = stream.value()
+            if batch_size is None:
+                yield record
+            else:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        stream.expect("]")
+
+    if len(batch) > 0:
+        yield batch
+
 
 class HTTPResponse():
     """Abstract class for Response. Helps to create a modular interface
@@ -18,6 +144,7 @@ class HTTPResponse():
         """HTTPResponse base class constructor
         """
         self._response = None
+        self.meta: Dict = {}
         return
 
     def get_json(self) -> Dict:
@@ -26,9 +153,83 @@ class HTTPResponse():
         Returns:
             result_json (Dict): Returns json data.
         """
-        result_json = self._response.json()
+        result_json = JSONCodec.get_default().loads(self._response.content)
         return result_json
 
+    def iter_results(self, batch_size: int = None,
+                     chunk_size: int = 65536) -> Iterator:
+        """Method to decode the 'results' array of the response body
+            incrementally. Send the request with stream=True so that
+            the body is read from the socket while records are consumed.
+            The other top-level fields are available in 'meta' afterwards.
+
+        Args:
+            batch_size (Integer): Yield lists of this many records instead
+                of single records.
+            chunk_size (Integer): Bytes read from the socket at a time.
+        Yields:
+            record (Dict/List[Dict]): A record, or a batch of records.
+        """
+        self.meta = {}
+        try:
+            yield from iter_json_results(
+                self._response.iter_content(chunk_size=chunk_size),
+                batch_size=batch_size,
+                meta=self.meta,
+                )
+        finally:
+            self._response.close()
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Method to read the raw response body chunk by chunk. Send the
+            request with stream=True so that the body is not buffered.
+
+        Args:
+            chunk_size (Integer): Bytes read from the socket at a time.
+        Yields:
+            chunk (bytes): The next chunk of the body.
+        """
+        try:
+            yield from self._response.iter_content(chunk_size=chunk_size)
+        finally:
+            self._response.close()
+
+    def get_text(self) -> str:
+        """Method to return the response body as text.
+
+        Returns:
+            text (String): The decoded response body.
+        """
+        text = self._response.text
+        return text
+
+    def get_elapsed(self) -> float:
+        """Method to return the time taken by the server to respond.
+
+        Returns:
+            elapsed (Float): Seconds until the response headers arrived.
+        """
+        elapsed = self._response.elapsed.total_seconds()
+        return elapsed
+
+    def get_content_length(self) -> int:
+        """Method to return the size of the response body.
+
+        Returns:
+            length (Integer): Bytes in the response body.
+        """
+        length = len(self._response.content)
+        return length
+
+    def get_headers(self) -> Dict:
+        """Method to return the headers of the response.
+
+        Returns:
+            headers (Dict): Case insensitive mapping of the headers.
+        """
+        headers = self._response.headers
+        return headers
+
     def get_status_code(self) -> int:
         """Method to return the status code for the response.
 
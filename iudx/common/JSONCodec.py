@@ -0,0 +1,124 @@
+"""Module doc string. Leave empty for now.
+
+JSONCodec.py
+"""
+import json
+from typing import TypeVar, Any, IO, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+JSONCodec = TypeVar("T")
+
+
+class JSONCodec():
+    """Encoder and decoder for every JSON document handled by the SDK:
+       request bodies, response bodies and downloaded files. Uses orjson
+       or ujson when installed, and the standard library otherwise.
+    """
+
+    BACKENDS = ("orjson", "ujson", "json")
+
+    _default: JSONCodec = None
+
+    def __init__(self: JSONCodec, backend: str = None):
+        """JSONCodec base class constructor
+
+        Args:
+            backend (String): One of 'orjson', 'ujson' or 'json', defaults
+                to the fastest installed backend.
+        """
+        available = {"orjson": orjson, "ujson": ujson, "json": json}
+        if backend is None:
+            backend = next(b for b in JSONCodec.BACKENDS
+                           if available[b] is not None)
+        elif backend not in JSONCodec.BACKENDS:
+            raise ValueError(
+                f"JSON backend '{backend}' is not supported. "
+                f"Please choose one of: {JSONCodec.BACKENDS}"
+            )
+        elif available[backend] is None:
+            raise ImportError(f"JSON backend '{backend}' is not installed.")
+        self.backend = backend
+        return
+
+    @classmethod
+    def get_default(cls) -> JSONCodec:
+        """Method to return the codec used throughout the SDK.
+
+        Returns:
+            codec (JSONCodec): The default JSONCodec object.
+        """
+        if cls._default is None:
+            cls._default = JSONCodec()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, codec: JSONCodec) -> None:
+        """Method to replace the codec used throughout the SDK.
+
+        Args:
+            codec (JSONCodec): The new default codec.
+        """
+        cls._default = codec
+        return None
+
+    def dumps(self, obj: Any, indent: int = None) -> str:
+        """Method to serialize an object to a JSON string.
+
+        Args:
+            obj (Any): Object to be serialized.
+            indent (Integer): Pretty print with this indent, orjson
+                always indents with two spaces.
+        Returns:
+            data (String): The JSON document.
+        """
+        if self.backend == "orjson":
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        if self.backend == "ujson":
+            return ujson.dumps(obj, ensure_ascii=False, indent=indent or 0)
+        return json.dumps(obj, indent=indent)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Method to deserialize a JSON document.
+
+        Args:
+            data (Bytes/String): The JSON document.
+        Returns:
+            obj (Any): The deserialized object.
+        """
+        if self.backend == "orjson":
+            return orjson.loads(data)
+        if self.backend == "ujson":
+            return ujson.loads(data)
+        return json.loads(data)
+
+    def dump(self, obj: Any, fp: IO, indent: int = None) -> None:
+        """Method to serialize an object into a text file.
+
+        Args:
+            obj (Any): Object to be serialized.
+            fp (IO): File opened for writing text.
+            indent (Integer): Pretty print with this indent.
+        """
+        fp.write(self.dumps(obj, indent=indent))
+        return None
+
+    def load(self, fp: IO) -> Any:
+        """Method to deserialize a JSON document from a file.
+
+        Args:
+            fp (IO): File opened for reading.
+        Returns:
+            obj (Any): The deserialized object.
+        """
+        return self.loads(fp.read())
@@ -0,0 +1,165 @@
+"""Module doc string. Leave empty for now.
+
+RateLimiter.py
+"""
+import multiprocessing
+import threading
+import time
+import uuid
+from typing import TypeVar, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+
+RateLimiter = TypeVar("T")
+
+
+def _lookup_rate_limiter(key: str) -> RateLimiter:
+    """Resolve a pickled RateLimiter to the instance living in this process.
+
+    Worker processes receive the shared bucket state once, through the
+    pool initializer, so every task has to resolve to that instance.
+    """
+    rate_limiter = RateLimiter._registry.get(key)
+    if rate_limiter is None:
+        raise RuntimeError(
+            "RateLimiter is not shared with this process. "
+            "Configure limits before the executor starts its workers."
+        )
+    return rate_limiter
+
+
+class RateLimiter():
+    """Client side token-bucket rate limiter for HTTPEntity. Limits are
+       set per host and/or per endpoint path and hold across the threads
+       and worker processes of an Executor, since the buckets live in
+       shared memory.
+    """
+
+    _default: RateLimiter = None
+    _registry: Dict[str, RateLimiter] = {}
+    _registry_lock = threading.RLock()
+
+    def __init__(self: RateLimiter):
+        """RateLimiter base class constructor
+        """
+        self._key = uuid.uuid4().hex
+        self._rules: List[Dict] = []
+
+        with RateLimiter._registry_lock:
+            RateLimiter._registry[self._key] = self
+        return
+
+    @classmethod
+    def get_default(cls) -> RateLimiter:
+        """Method to return the limiter used when none is supplied.
+
+        Returns:
+            rate_limiter (RateLimiter): The default RateLimiter object.
+        """
+        with cls._registry_lock:
+            if cls._default is None:
+                cls._default = RateLimiter()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, rate_limiter: RateLimiter) -> None:
+        """Method to replace the limiter used when none is supplied.
+
+        Args:
+            rate_limiter (RateLimiter): The new default limiter.
+        """
+        cls._default = rate_limiter
+        return None
+
+    def add_limit(self, rate: float, burst: int = None, host: str = None,
+                  endpoint: str = None) -> RateLimiter:
+        """Method to limit the requests to a host and/or an endpoint.
+
+        Args:
+            rate (Float): Sustained requests per second.
+            burst (Integer): Requests allowed back to back, defaults to
+                one second worth of requests.
+            host (String): Host, e.g. 'rs.iudx.org.in', all when None.
+            endpoint (String): Path fragment, e.g. '/entities' or
+                '/temporal/entityOperations/query', all when None.
+        """
+        if rate <= 0:
+            raise ValueError("rate should be greater than 0.")
+        if burst is None:
+            burst = max(1, int(rate))
+        self._rules.append({
+            "host": host,
+            "endpoint": endpoint,
+            "rate": float(rate),
+            "burst": float(burst),
+            "state": multiprocessing.RawArray("d", [float(burst), time.monotonic()]),
+            "lock": multiprocessing.Lock(),
+        })
+        return self
+
+    def _matches(self, rule: Dict, url: str) -> bool:
+        parts = urlsplit(url)
+        if rule["host"] is not None and rule["host"] != parts.hostname:
+            return False
+        if rule["endpoint"] is not None and rule["endpoint"] not in parts.path:
+            return False
+        return True
+
+    def _reserve(self, rule: Dict) -> float:
+        # Tokens may go negative: the caller then owns a slot in the future
+        # and sleeps until it, outside the lock.
+        state = rule["state"]
+        with rule["lock"]:
+            now = time.monotonic()
+            tokens = min(rule["burst"], state[0] + (now - state[1]) * rule["rate"])
+            state[0] = tokens - 1
+            state[1] = now
+        if tokens >= 1:
+            return 0.0
+        return (1 - tokens) / rule["rate"]
+
+    def acquire(self, url: str) -> float:
+        """Method to block until a request to the url is allowed.
+
+        Args:
+            url (String): URL of the API Request.
+        Returns:
+            wait (Float): Seconds spent waiting.
+        """
+        wait = 0.0
+        for rule in self._rules:
+            if self._matches(rule, url):
+                wait = max(wait, self._reserve(rule))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def __reduce__(self):
+        return (_lookup_rate_limiter, (self._key,))
+
+    @classmethod
+    def _export(cls) -> Tuple:
+        """Method to collect the shared state handed to worker processes.
+        """
+        cls.get_default()
+        with cls._registry_lock:
+            limiters = [(key, rate_limiter._rules)
+                        for key, rate_limiter in cls._registry.items()]
+            default_key = cls._default._key if cls._default is not None else None
+        return (limiters, default_key)
+
+    @classmethod
+    def _install(cls, limiters: List[Tuple[str, List[Dict]]],
+                 default_key: str) -> None:
+        """Pool initializer, recreates the limiters of the parent process
+            on top of the shared bucket state.
+        """
+        with cls._registry_lock:
+            cls._registry = {}
+            for key, rules in limiters:
+                rate_limiter = RateLimiter.__new__(RateLimiter)
+                rate_limiter._key = key
+                rate_limiter._rules = rules
+                cls._registry[key] = rate_limiter
+            cls._default = cls._registry.get(default_key)
+        return None
@@ -0,0 +1,133 @@
+"""Module doc string. Leave empty for now.
+
+RetryPolicy.py
+"""
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar, Tuple, Type
+
+from requests import Response
+from requests.exceptions import ConnectionError, Timeout
+
+
+RetryPolicy = TypeVar("T")
+
+
+class RetryPolicy():
+    """Describes when and how often HTTPEntity re-sends a failed request.
+       Waits grow exponentially between attempts, with full jitter, and
+       a 'Retry-After' header of the response takes precedence.
+    """
+
+    _default: RetryPolicy = None
+
+    def __init__(
+            self: RetryPolicy,
+            max_attempts: int = 3,
+            statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+            exceptions: Tuple[Type[Exception], ...] = (ConnectionError, Timeout),
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30.0,
+            jitter: bool = True,
+            respect_retry_after: bool = True):
+        """RetryPolicy base class constructor
+
+        Args:
+            max_attempts (Integer): Total attempts, including the first one.
+            statuses (Tuple[int]): Status codes which are retried.
+            exceptions (Tuple[Exception]): Exception classes which are retried.
+            backoff_factor (Float): Wait in seconds before the first retry.
+            max_backoff (Float): Upper bound of any wait, including
+                the one requested by 'Retry-After'.
+            jitter (Boolean): Randomize the waits between zero and the backoff.
+            respect_retry_after (Boolean): Wait as long as the server asks.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be at least 1.")
+        self.max_attempts = max_attempts
+        self.statuses = tuple(statuses)
+        self.exceptions = tuple(exceptions)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        return
+
+    @classmethod
+    def get_default(cls) -> RetryPolicy:
+        """Method to return the policy used when none is supplied.
+
+        Returns:
+            retry_policy (RetryPolicy): The default RetryPolicy object.
+        """
+        if cls._default is None:
+            cls._default = RetryPolicy()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, retry_policy: RetryPolicy) -> None:
+        """Method to replace the policy used when none is supplied.
+
+        Args:
+            retry_policy (RetryPolicy): The new default policy.
+        """
+        cls._default = retry_policy
+        return None
+
+    @classmethod
+    def no_retry(cls) -> RetryPolicy:
+        """Method to create a policy which sends every request once.
+
+        Returns:
+            retry_policy (RetryPolicy): RetryPolicy with a single attempt.
+        """
+        return RetryPolicy(max_attempts=1)
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.statuses
+
+    def is_retryable_exception(self, error: Exception) -> bool:
+        return isinstance(error, self.exceptions)
+
+    def get_backoff(self, attempt: int, response: Response = None) -> float:
+        """Method to compute the wait before the next attempt.
+
+        Args:
+            attempt (Integer): Number of the attempt which just failed.
+            response (Response): Failed response, if there was one.
+        Returns:
+            backoff (Float): Seconds to wait before retrying.
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self.parse_retry_after(
+                response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float:
+        """Method to parse a 'Retry-After' header value.
+
+        Args:
+            value (String): Delay in seconds or an HTTP date.
+        Returns:
+            delay (Float): Seconds to wait, or None if it can't be parsed.
+        """
+        if value is None:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
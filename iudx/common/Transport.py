@@ -0,0 +1,171 @@
+"""Module doc string. Leave empty for now.
+
+Transport.py
+"""
+import os
+import threading
+import uuid
+from typing import TypeVar, Dict
+from urllib.parse import urlsplit
+
+from requests import Session, Response, PreparedRequest
+from requests.adapters import HTTPAdapter
+
+
+Transport = TypeVar("T")
+
+
+def _lookup_transport(key: str, config: Dict) -> Transport:
+    """Resolve a pickled Transport to the instance living in this process.
+
+    Worker processes unpickle the same transport once per task; resolving
+    through the registry keeps a single pool of connections per worker.
+    """
+    with Transport._registry_lock:
+        transport = Transport._registry.get(key)
+        if transport is None:
+            transport = Transport(**config)
+            Transport._registry.pop(transport._key, None)
+            transport._key = key
+            Transport._registry[key] = transport
+    return transport
+
+
+class Transport():
+    """Shared connection-pool transport for HTTPEntity. Keeps one
+       keep-alive Session per host, so repeated API requests reuse open
+       TCP/TLS connections instead of handshaking on every call.
+    """
+
+    _default: Transport = None
+    _registry: Dict[str, Transport] = {}
+    _registry_lock = threading.RLock()
+
+    def __init__(self: Transport, pool_connections: int = 10,
+                 pool_maxsize: int = 32, keep_alive: bool = True,
+                 timeout: float = None):
+        """Transport base class constructor
+
+        Args:
+            pool_connections (Integer): Number of per-host pools to cache.
+            pool_maxsize (Integer): Maximum connections kept open per host.
+            keep_alive (Boolean): Reuse connections between requests.
+            timeout (Float): Timeout in seconds for every request.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self._key = uuid.uuid4().hex
+        self._sessions: Dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        with Transport._registry_lock:
+            Transport._registry[self._key] = self
+        return
+
+    @classmethod
+    def get_default(cls) -> Transport:
+        """Method to return the process wide shared transport.
+
+        Returns:
+            transport (Transport): The shared Transport object.
+        """
+        with cls._registry_lock:
+            if cls._default is None:
+                cls._default = Transport()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, transport: Transport) -> None:
+        """Method to replace the process wide shared transport.
+
+        Args:
+            transport (Transport): Transport used when none is supplied.
+        """
+        cls._default = transport
+        return None
+
+    def get_config(self) -> Dict:
+        """Method to return the constructor arguments of the transport.
+
+        Returns:
+            config (Dict): Pool size, keep-alive and timeout settings.
+        """
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "keep_alive": self.keep_alive,
+            "timeout": self.timeout,
+        }
+
+    def get_session(self, url: str) -> Session:
+        """Method to return the pooled Session for the host of a url.
+
+        Args:
+            url (String): URL of the API Request.
+        Returns:
+            session (Session): Session bound to the host of the url.
+        """
+        parts = urlsplit(url)
+        host = parts.scheme + "://" + parts.netloc
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # Sockets inherited from the parent process must not be
+                # shared, drop them without closing the parent's streams.
+                self._sessions = {}
+                self._pid = os.getpid()
+
+            session = self._sessions.get(host)
+            if session is None:
+                session = Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+        return session
+
+    def send(self, prepared_req: PreparedRequest,
+             stream: bool = False) -> Response:
+        """Method to send a prepared request over the pooled connections.
+
+        Args:
+            prepared_req (PreparedRequest): Request to be sent.
+            stream (Boolean): Defer downloading the response body.
+        Returns:
+            response (Response): Response for the API Request.
+        """
+        if not self.keep_alive:
+            prepared_req.headers["Connection"] = "close"
+        session = self.get_session(prepared_req.url)
+        return session.send(prepared_req, timeout=self.timeout, stream=stream)
+
+    def close(self) -> None:
+        """Method to close every pooled connection of the transport.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+        with Transport._registry_lock:
+            Transport._registry.pop(self._key, None)
+        if Transport._default is self:
+            Transport._default = None
+        return None
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return (_lookup_transport, (self._key, self.get_config()))
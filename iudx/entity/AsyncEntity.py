@@ -0,0 +1,310 @@
+"""Module doc string. Leave empty for now.
+
+AsyncEntity.py
+"""
+
+from typing import TypeVar, Any, List, Dict, AsyncIterator
+import asyncio
+from datetime import datetime
+
+import pandas as pd
+
+from iudx.auth.Token import Token
+from iudx.common.AsyncHTTPEntity import AsyncHTTPEntity
+from iudx.cat.AsyncCatalogue import AsyncCatalogue
+from iudx.cat.CatalogueQuery import CatalogueQuery
+
+from iudx.rs.AsyncResourceServer import AsyncResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.ResourceResult import ResourceResult
+from iudx.rs.QueryPlanner import QueryPlanner
+
+from iudx.entity.Entity import Entity
+from iudx.entity.ResultAssembler import ResultAssembler
+
+
+AsyncEntity = TypeVar("T")
+
+
+class AsyncEntity:
+    """Asyncio counterpart of Entity. The catalogue lookups, query
+    planning and data requests all run on one event loop, sharing a
+    single bounded AsyncHTTPEntity.
+
+    The entity has to be initialized before use, either with
+    ``await entity.initialize()`` or ``async with AsyncEntity(...)``.
+    """
+
+    def __init__(
+        self: AsyncEntity,
+        entity_id: str = None,
+        cat_url: str = "https://cos.iudx.org.in/iudx/cat/v1",
+        rs_url: str = "https://rs.cos.iudx.org.in/ngsi-ld/v1",
+        headers: Dict = None,
+        token: str = None,
+        token_obj: Token = None,
+        max_in_flight: int = 64,
+    ):
+        """AsyncEntity base class constructor.
+
+        Args:
+            entity_id (String): Id of the entity to be queried.
+            cat_url (String): Catalogue server url.
+            rs_url (String): Resource server url.
+            headers (Dict): Headers passed with the API Request.
+            token (String): Access token for the resources.
+            token_obj (Token): Token object to request access tokens.
+            max_in_flight (Integer): Maximum concurrent requests.
+        """
+        if headers is None:
+            headers = {"content-type": "application/json"}
+
+        self.http_entity = AsyncHTTPEntity(max_in_flight=max_in_flight)
+        self.catalogue: AsyncCatalogue = AsyncCatalogue(
+            cat_url=cat_url, headers=headers, token=token,
+            http_entity=self.http_entity
+        )
+
+        self.token = token
+        self.token_obj = token_obj
+        self.headers = headers
+
+        self.rs: AsyncResourceServer = None
+        self.rs_url = rs_url
+        self.resources: List[Dict] = []
+        self.entity_id = entity_id
+        self.resources_df = None
+        self.failed_results: List[ResourceResult] = []
+        self.start_time = None
+        self.end_time = None
+        self.time_format = "%Y-%m-%dT%H:%M:%S+05:30"
+        return
+
+    make_date_bins = Entity.make_date_bins
+
+    async def _request_token(self) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.token_obj.request_token)
+
+    async def initialize(self) -> AsyncEntity:
+        """Method to fetch the catalogue item and resources of the entity
+            and set up the resource server.
+        """
+        documents_result = await self.catalogue.get_item(self.entity_id)
+        item = documents_result.documents[0]
+        is_open = "accessPolicy" in item.keys() and item["accessPolicy"] == "OPEN"
+        open_item = (self.rs_url.split("/")[2], "resource_server", "consumer")
+
+        if "iudx:ResourceGroup" in item["type"]:
+            if is_open:
+                self.token_obj.set_item(*open_item)
+
+            cat_query = CatalogueQuery()
+            query = cat_query.property_search(
+                key="resourceGroup", value=[self.entity_id]
+            ).property_search(key="type", value=["iudx:Resource"])
+            cat_result = await self.catalogue.search_entity(query)
+            self.resources = cat_result.documents
+
+        elif "iudx:Resource" in item["type"]:
+            cat_query = CatalogueQuery()
+            query = cat_query.property_search(key="id", value=[self.entity_id])
+            cat_result, rg = await asyncio.gather(
+                self.catalogue.search_entity(query),
+                self.catalogue.get_related_entity(self.entity_id, rel="resourceGroup"),
+            )
+            self.resources = cat_result.documents
+            if is_open or (
+                "accessPolicy" in rg.documents[0].keys()
+                and rg.documents[0]["accessPolicy"] == "OPEN"
+            ):
+                self.token_obj.set_item(*open_item)
+
+        # Request access token
+        if self.token is None and self.token_obj is not None:
+            self.token = await self._request_token()
+
+        self.rs = AsyncResourceServer(
+            rs_url=self.rs_url, headers=dict(self.headers), token=self.token,
+            http_entity=self.http_entity
+        )
+        return self
+
+    async def latest(self) -> pd.DataFrame:
+        """Method to fetch resources for latest data
+            and generate a dataframe.
+
+        Returns:
+            resources_df (pd.DataFrame): Pandas DataFrame with latest data.
+        """
+        tokens = [None] * len(self.resources)
+        if self.token_obj is not None:
+            loop = asyncio.get_running_loop()
+            tokens = await loop.run_in_executor(
+                None, self.token_obj.request_tokens,
+                [(resource["id"], "resource", "consumer") for resource in self.resources],
+            )
+        queries = []
+        for resource, token in zip(self.resources, tokens):
+            resource_query = ResourceQuery()
+            if token is not None:
+                resource_query.set_header("token", token)
+            queries.append(resource_query.add_entity(resource["id"]))
+
+        self.failed_results = []
+        rs_results: List[ResourceResult] = self._collect_results(
+            await self.rs.get_latest(queries))
+        self._report_failed(len(queries))
+        frames = [pd.json_normalize(rs_result.results) for rs_result in rs_results]
+        return self._to_time_series(frames)
+
+    def _collect_results(self, rs_results: List[ResourceResult]) -> List[ResourceResult]:
+        """Split off the failed queries into 'failed_results' and return
+            the successful results, as Entity does.
+        """
+        succeeded = []
+        for rs_result in rs_results:
+            if rs_result.status == 401:
+                raise RuntimeError("Not Authorized: Invalid Credentials")
+            if rs_result.is_success():
+                succeeded.append(rs_result)
+            else:
+                self.failed_results.append(rs_result)
+        return succeeded
+
+    def _report_failed(self, total: int) -> None:
+        if len(self.failed_results) > 0:
+            print(f"{len(self.failed_results)} of {total} queries failed, "
+                  f"see 'failed_results'.")
+
+    async def make_query_batches(self, q: ResourceQuery,
+                                 batch_queries: List[ResourceQuery]):
+        """Method to split a temporal query into slices of at most 5000
+            records, see QueryPlanner.
+
+        Args:
+            q (ResourceQuery): The temporal query to be split.
+            batch_queries (List[ResourceQuery]): List the slices are added to.
+        """
+        batch_queries += await self._plan([q])
+
+    async def _plan(self, queries: List[ResourceQuery]) -> List[ResourceQuery]:
+        # The slices of all the bins are counted together, level by level.
+        planner = QueryPlanner(self.rs, time_format=self.time_format)
+        slices = await planner.plan_async(queries)
+        failed = planner.take_failed()
+        if len(failed) > 0:
+            raise RuntimeError(f"Count query failed: {failed[0].error}")
+        return slices
+
+    async def iter_during(
+        self,
+        start_time: str = None,
+        end_time: str = None,
+        offset: int = None,
+        limit: int = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Method to fetch resources for temporal based search, yielding
+            a dataframe for every time slice as soon as it arrives.
+
+        Args:
+            start_time (String): The starting timestamp for the query.
+            end_time (String): The ending timestamp for the query.
+            offset (Integer): The offset from the first result to fetch.
+            limit (Integer): The maximum results to be returned.
+
+        Yields:
+            resource_df (pd.DataFrame): Pandas DataFrame of one time slice.
+        """
+        self.start_time = start_time
+        self.end_time = end_time
+
+        start_date = datetime.strptime(self.start_time, self.time_format)
+        end_date = datetime.strptime(self.end_time, self.time_format)
+
+        if end_date <= start_date:
+            raise RuntimeError("'end_time' should be greater than 'start_time'")
+
+        date_bins = []
+        self.make_date_bins(start_date, end_date, date_bins)
+
+        bins = []
+        for i in range(0, len(date_bins) - 1):
+            resource_query = ResourceQuery()
+            if self.token is not None:
+                resource_query.set_header("token", self.token)
+            resource_query.set_offset_limit(offset, limit)
+            resource_query.add_entity(self.resources[0]["id"])
+            resource_query.during_search(
+                start_time=date_bins[i], end_time=date_bins[i + 1]
+            )
+            bins.append(resource_query)
+
+        slices = await self._plan(bins)
+
+        self.failed_results = []
+        tasks = [asyncio.ensure_future(self.rs.get_data([q])) for q in slices]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for rs_result in self._collect_results(await task):
+                    yield pd.json_normalize(rs_result.results)
+        finally:
+            for task in tasks:
+                task.cancel()
+        self._report_failed(len(slices))
+
+    async def during_search(
+        self,
+        start_time: str = None,
+        end_time: str = None,
+        offset: int = None,
+        limit: int = None,
+    ) -> pd.DataFrame:
+        """Method to fetch resources for temporal based search
+            and generate a dataframe.
+
+        Args:
+            start_time (String): The starting timestamp for the query.
+            end_time (String): The ending timestamp for the query.
+            offset (Integer): The offset from the first result to fetch.
+            limit (Integer): The maximum results to be returned.
+
+        Returns:
+            resources_df (pd.DataFrame): Pandas DataFrame with temporal data.
+        """
+        frames = [
+            frame async for frame in
+            self.iter_during(start_time, end_time, offset, limit)
+        ]
+        self.resources_df = self._to_time_series(frames)
+        return self.resources_df
+
+    def _to_time_series(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        # Processing data as a time series dataframe:
+        # 1) converting time feature to datetime.
+        # 2) sorting values based on time.
+        # 3) resetting the indices for the dataframe.
+        assembler = ResultAssembler()
+        for frame in frames:
+            assembler.add_frame(frame)
+        if assembler.rows == 0:
+            print("No Data available during the timeframe.")
+            return pd.DataFrame()
+
+        try:
+            return assembler.to_time_series()
+        except Exception as e:
+            print(f"Data format issue: {e}")
+            return assembler.to_frame()
+
+    async def close(self) -> None:
+        """Method to close the connections of the async transport.
+        """
+        await self.http_entity.close()
+        return None
+
+    async def __aenter__(self) -> AsyncEntity:
+        return await self.initialize()
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
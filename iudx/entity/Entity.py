@@ -3,23 +3,37 @@
 Entity.py
 """
 
-from typing import TypeVar, Generic, Any, List, Dict, Optional
+from typing import TypeVar, Generic, Any, Callable, Iterator, List, Dict, Optional, Tuple, Union
 import time
-import requests
+import os
+import threading
 import sys
+import urllib.parse
+import functools
 
 from iudx.auth.Token import Token
+from iudx.auth.FileTokenCache import FileTokenCache
+from iudx.common.Transport import Transport
+from iudx.common.Executor import Executor
+from iudx.common.JSONCodec import JSONCodec
 from iudx.cat.Catalogue import Catalogue
 from iudx.cat.CatalogueQuery import CatalogueQuery
+from iudx.cat.CatalogueCache import CatalogueCache
 
 from iudx.rs.ResourceServer import ResourceServer
 from iudx.rs.ResourceQuery import ResourceQuery
 from iudx.rs.ResourceResult import ResourceResult
+from iudx.rs.QueryPlanner import QueryPlanner
+from iudx.rs.DensityModel import DensityModel
+from iudx.entity.ResultAssembler import ResultAssembler
+from iudx.entity.ResultSink import ResultSink
+from iudx.entity.TemporalCache import TemporalCache
+from iudx.entity.SyncState import SyncState
+from iudx.entity.SearchProgress import SearchProgress
 
 import pandas as pd
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import click
-import copy
 import tqdm
 import json
 
@@ -42,27 +56,49 @@ class Entity:
         headers: Dict = {"content-type": "application/json"},
         token: str = None,
         token_obj: Token = None,
+        transport: Transport = None,
+        executor: Union[str, Executor] = "thread",
+        density_model: DensityModel = None,
+        temporal_cache: TemporalCache = None,
+        catalogue_cache: CatalogueCache = None,
+        lazy: bool = False,
     ):
         """Entity base class constructor for getting the resources from
                 catalogue server.
 
         Args:
             entity_id (String): Id of the entity to be queried.
+            transport (Transport): Connection pool shared by the catalogue
+                and resource server clients.
+            executor (String/Executor): 'thread', 'process', 'inline' or an
+                Executor object used by the resource server.
+            density_model (DensityModel): Records per hour learnt for the
+                resources, defaults to the shared store in ~/.iudx.
+            temporal_cache (TemporalCache): Local cache of temporal search
+                results, during_search fetches only what it lacks.
+            catalogue_cache (CatalogueCache): Cache of the catalogue
+                metadata, share one to build many entities quickly.
+            lazy (Boolean): Defer the catalogue queries, the token request
+                and the resource server set up to the first use of the
+                entity, see also Entity.prefetch.
         """
 
         # public variables
         self.catalogue: Catalogue = Catalogue(
-            cat_url=cat_url, headers=headers, token=token
+            cat_url=cat_url, headers=headers, token=token, transport=transport,
+            cache=catalogue_cache
         )
 
         self.token_obj = token_obj
 
-        self.rs: ResourceServer = None
         self.rs_url = rs_url
-        self.resources: List[Dict] = []
         self.entity_id = entity_id
         self.resources_df = None
         self.resources_json = []
+        self.failed_results: List[ResourceResult] = []
+        self.progress: SearchProgress = None
+        self.density_model: DensityModel = density_model
+        self.temporal_cache: TemporalCache = temporal_cache
         self.start_time = None
         self.end_time = None
         self.time_format = "%Y-%m-%dT%H:%M:%S+05:30"
@@ -78,10 +114,81 @@ class Entity:
         self._time_properties: List[Dict] = None
         self._quantitative_properties: List[Dict] = None
         self._properties: List[Dict] = None
+        self._failed_fetch: Callable = None
+        # The item is read now, a Token shared by many entities may be set
+        # to another item before this one is resolved.
+        self._token_item: Dict = None
+        if token_obj is not None and token_obj.item is not None:
+            self._token_item = dict(token_obj.item)
+        # Item of every token set on a query, to renew it on a refetch.
+        self._token_items: Dict[str, Dict] = {}
+        self._rs: ResourceServer = None
+        self._resources: List[Dict] = []
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._init_args = (rs_url, headers, token, token_obj, transport, executor)
+
+        if not lazy:
+            self._initialize()
+        return
+
+    @property
+    def resources(self) -> List[Dict]:
+        """Resources of the entity, fetched from the catalogue on first
+            access in lazy mode.
+        """
+        self._initialize()
+        return self._resources
+
+    @resources.setter
+    def resources(self, resources: List[Dict]) -> None:
+        self._resources = resources
+
+    @property
+    def rs(self) -> ResourceServer:
+        """Resource server client, set up on first access in lazy mode.
+        """
+        self._initialize()
+        return self._rs
 
+    @rs.setter
+    def rs(self, rs: ResourceServer) -> None:
+        self._rs = rs
+
+    @staticmethod
+    def prefetch(entities: List[Entity], workers: int = 8) -> List[Entity]:
+        """Method to resolve the catalogue metadata, tokens and resource
+            servers of many lazy entities concurrently.
+
+        Args:
+            entities (List[Entity]): Entities to be resolved.
+            workers (Integer): Number of entities resolved at a time.
+        Returns:
+            entities (List[Entity]): The same entities, resolved.
+        """
+        pending = [(entity,) for entity in entities if not entity._initialized]
+        if len(pending) > 0:
+            Executor.shared("thread", workers).starmap(Entity._initialize, pending)
+        return entities
+
+    def _initialize(self) -> Entity:
+        """Run the catalogue queries, token request and resource server set
+            up once, the first caller does the work.
+        """
+        if self._initialized:
+            return self
+        with self._init_lock:
+            if not self._initialized:
+                self._resolve(*self._init_args)
+                self._initialized = True
+        return self
+
+    def _resolve(self, rs_url: str, headers: Dict, token: str, token_obj: Token,
+                 transport: Transport, executor: Union[str, Executor]) -> None:
         # Query the Catalogue module and fetch the item based on entity_id
         # and set the data descriptors
         documents_result = self.catalogue.get_item(self.entity_id)
+        is_open = False
 
         if "iudx:ResourceGroup" in documents_result.documents[0]["type"]:
             try:
@@ -94,7 +201,7 @@ class Entity:
                 "accessPolicy" in documents_result.documents[0].keys()
                 and documents_result.documents[0]["accessPolicy"] == "OPEN"
             ):
-                token_obj.set_item(rs_url.split("/")[2], "resource_server", "consumer")
+                is_open = True
 
             # TODO: Parse the data schema from the data descriptor
             for key in self._data_descriptor.keys():
@@ -113,7 +220,7 @@ class Entity:
             # from Catalogue query.
             cat_result = self.catalogue.search_entity(query)
 
-            self.resources = cat_result.documents
+            self._resources = cat_result.documents
 
             # for res in cat_result.documents:
             #     self.resources.append(res["id"])
@@ -123,33 +230,136 @@ class Entity:
             param1 = {"key": "id", "value": [self.entity_id]}
             query = cat_query.property_search(key=param1["key"], value=param1["value"])
             cat_result = self.catalogue.search_entity(query)
-            self.resources = cat_result.documents
+            self._resources = cat_result.documents
             rg = self.catalogue.get_related_entity(self.entity_id, rel="resourceGroup")
             if (
                 "accessPolicy" in documents_result.documents[0].keys()
                 and documents_result.documents[0]["accessPolicy"] == "OPEN"
             ):
-                token_obj.set_item(rs_url.split("/")[2], "resource_server", "consumer")
+                is_open = True
             if (
                 "accessPolicy" in rg.documents[0].keys()
                 and rg.documents[0]["accessPolicy"] == "OPEN"
             ):
-                token_obj.set_item(rs_url.split("/")[2], "resource_server", "consumer")
+                is_open = True
 
         # Request access token
+        if is_open:
+            self._token_item = {"itemId": rs_url.split("/")[2],
+                                "itemType": "resource_server", "role": "consumer"}
         if token is None and token_obj is not None:
-            token = token_obj.request_token()
+            token = self._request_token()
 
-        if "iudx:Resource" in documents_result.documents[0]["type"]:
-            self.rs: ResourceServer = ResourceServer(
-                rs_url=rs_url, headers=headers, token=token
-            )
-        else:
-            self.rs: ResourceServer = ResourceServer(
-                rs_url=rs_url, headers=headers, token_obj=token_obj
-            )
+        self._rs = ResourceServer(
+            rs_url=rs_url, headers=headers, token=token, transport=transport,
+            executor=executor
+        )
         return
 
+    def _request_token(self) -> str:
+        """Request the token of the item the entity was built for.
+        """
+        if self._token_item is None:
+            token = self.token_obj.request_token()
+            self._token_items[token] = dict(self.token_obj.item)
+            return token
+        token = self.token_obj._request_item(self._token_item)
+        self._token_items[token] = self._token_item
+        return token
+
+    def close(self) -> None:
+        """Method to release the executor of the resource server.
+        """
+        if self._rs is not None:
+            self._rs.close()
+        return None
+
+    def __enter__(self) -> Entity:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _collect_results(self, rs_results: List[ResourceResult],
+                         fetch: Callable) -> List[ResourceResult]:
+        """Split off the failed queries into 'failed_results' and return
+            the successful results.
+        """
+        succeeded = []
+        failed = []
+        for rs_result in rs_results:
+            if rs_result.is_success():
+                succeeded.append(rs_result)
+            else:
+                failed.append(rs_result)
+
+        if any(rs_result.status == 401 for rs_result in failed):
+            raise RuntimeError("Not Authorized: Invalid Credentials")
+
+        if len(failed) > 0:
+            self.failed_results += failed
+            self._failed_fetch = fetch
+            print(f"{len(failed)} of {len(rs_results)} queries failed, "
+                  f"see 'failed_results' and 'refetch_failed()'.")
+        return succeeded
+
+    def refetch_failed(self) -> pd.DataFrame:
+        """Method to re-send only the queries which failed in the last
+            search and merge their data into 'resources_df'.
+
+        Returns:
+            resources_df (pd.DataFrame): Pandas DataFrame with the data.
+        """
+        queries = [rs_result.query for rs_result in self.failed_results]
+        fetch = self._failed_fetch
+        self.failed_results = []
+        if len(queries) == 0:
+            return self.resources_df
+
+        if self.token_obj is not None:
+            for query in queries:
+                # The token is renewed for the item it was requested for,
+                # queries with an unknown token keep theirs.
+                item = self._token_items.get(query.get_headers().get("token"))
+                if item is not None:
+                    query.set_header("token", self.token_obj._request_item(item))
+
+        rs_results = self._collect_results(fetch(queries), fetch)
+
+        assembler = ResultAssembler()
+        assembler.add_frame(self.resources_df)
+        self.resources_df = self._assemble(rs_results, assembler, keep_json=True)
+        return self.resources_df
+
+    def _assemble(self, rs_results: List[ResourceResult],
+                  assembler: ResultAssembler = None, keep_json: bool = False,
+                  time_series: bool = True) -> pd.DataFrame:
+        """Build the DataFrame of the successful results in one pass.
+        """
+        if assembler is None:
+            assembler = ResultAssembler()
+        for rs_result in rs_results:
+            if rs_result.type == "urn:dx:rs:success":
+                assembler.add(rs_result.results)
+        if keep_json:
+            self.resources_json.extend(assembler.records())
+
+        if not time_series:
+            return assembler.to_frame()
+
+        # Processing data as a time series dataframe:
+        # 1) converting time feature to datetime.
+        # 2) sorting values based on time.
+        # 3) resetting the indices for the dataframe.
+        try:
+            resources_df = assembler.to_time_series()
+        except Exception as e:
+            print(f"Data format issue: {e}")
+            resources_df = assembler.to_frame()
+        if len(resources_df) == 0:
+            print("No Data available during the timeframe.")
+        return resources_df
+
     """ Deprecated """
 
     def set_slot_hours(self, hours: int = 24) -> Entity:
@@ -177,74 +387,93 @@ class Entity:
         Returns:
             resources_df (pd.DataFrame): Pandas DataFrame with latest data.
         """
-        resources_df = pd.DataFrame()
-
+        items = [(resource["id"], "resource", "consumer") for resource in self.resources]
+        tokens = self.token_obj.request_tokens(items)
         queries = []
-        for resource in self.resources:
+        for resource, item, token in zip(self.resources, items, tokens):
+            self._token_items[token] = dict(zip(("itemId", "itemType", "role"), item))
             resource_query = ResourceQuery()
-            resource_query.set_header(
-                "token",
-                self.token_obj.set_item(
-                    resource["id"], "resource", "consumer"
-                ).request_token(),
-            )
+            resource_query.set_header("token", token)
             query = resource_query.add_entity(resource["id"])
             queries.append(query)
 
-        rs_results: List[ResourceResult] = self.rs.get_latest(queries)
-
-        for rs_result in rs_results:
-            try:
-                if rs_result.type == "urn:dx:rs:success":
-                    resource_df = pd.json_normalize(rs_result.results)
+        self.failed_results = []
+        rs_results: List[ResourceResult] = self._collect_results(
+            self.rs.get_latest(queries), self.rs.get_latest
+        )
 
-                    if len(resources_df) == 0:
-                        resources_df = resource_df
-                    else:
-                        resources_df = pd.concat([resources_df, resource_df])
-            except Exception as e:
-                print(f"No Latest Data: {e}")
+        return self._assemble(rs_results)
 
-        # Processing data as a time series dataframe:
-        # 1) converting time feature to datetime.
-        # 2) sorting values based on time.
-        # 3) resetting the indices for the dataframe.
-        try:
-            if len(resources_df) != 0:
-                resources_df["observationDateTime"] = pd.to_datetime(
-                    resources_df["observationDateTime"]
-                )
-                resources_df = resources_df.sort_values(by="observationDateTime")
-            else:
-                print("No Data available during the timeframe.")
-        except Exception as e:
-            print(f"Data format issue: {e}")
+    def make_query_batches(self, q: ResourceQuery, batch_queries: List[ResourceQuery]):
+        """Method to split a temporal query into slices of at most 5000
+            records, see QueryPlanner.
 
-        resources_df = resources_df.reset_index(drop=True)
-        return resources_df
+        Args:
+            q (ResourceQuery): The temporal query to be split.
+            batch_queries (List[ResourceQuery]): List the slices are added to.
+        """
+        planner = self._planner()
+        batch_queries += planner.plan([q])
+        failed = planner.take_failed()
+        if len(failed) > 0:
+            raise RuntimeError(f"Count query failed: {failed[0].error}")
+
+    def _planner(self) -> QueryPlanner:
+        density_model = self.density_model
+        if density_model is None:
+            density_model = DensityModel.get_default()
+        return QueryPlanner(self.rs, time_format=self.time_format,
+                            density_model=density_model)
+
+    def _fetch_slices(self, planner: QueryPlanner, queries: List[ResourceQuery],
+                      progress: SearchProgress = None) -> List[ResourceResult]:
+        """Fetch planned slices. Slices sized from a density estimate which
+            turned out too low are planned again with counts and re-fetched.
+        """
+        rs_results = self._collect_results(
+            self._planner_failures(planner, progress)
+            + self._get_slices(queries, progress), self.rs.get_data
+        )
+        overflowed = [r for r in rs_results if planner.overflowed(r)]
+        if len(overflowed) > 0:
+            rs_results = [r for r in rs_results if not planner.overflowed(r)]
+            replanned = planner.plan([r.query for r in overflowed], use_model=False)
+            if progress is not None:
+                progress.replanned(overflowed, replanned)
+            rs_results += self._collect_results(
+                self._planner_failures(planner, progress)
+                + self._get_slices(replanned, progress), self.rs.get_data
+            )
 
-    def make_query_batches(self, q: ResourceQuery, batch_queries: List[ResourceQuery]):
-        res = []
-        q_count = copy.deepcopy(q)
-        q_count.count()
-        res = self.rs.get_data([q_count])
-        for r in res:
-            if r.results[0]["totalHits"] > 5000:
-                mid_time = (
-                    q._start_time_datetime
-                    + (q._end_time_datetime - q._start_time_datetime) / 2
-                )
-                mid_time_str = mid_time.strftime(self.time_format)
-                qa = copy.deepcopy(q)
-                qa.during_search(start_time=q._start_time, end_time=mid_time_str)
-                qb = copy.deepcopy(q)
-                qb.during_search(
-                    start_time=mid_time.strftime(self.time_format), end_time=q._end_time
-                )
-                self.make_query_batches(qa, batch_queries)
-                self.make_query_batches(qb, batch_queries)
-            else:
-                return batch_queries.append(q)
+        for rs_result in rs_results:
+            planner.observe(rs_result.query,
+                            max(rs_result.totalHits, len(rs_result.results)))
+        planner.save()
+        return rs_results
+
+    def _planner_failures(self, planner: QueryPlanner,
+                          progress: SearchProgress = None) -> List[ResourceResult]:
+        """Take the failed counts of the planner, as failed slices.
+        """
+        failed = planner.take_failed()
+        if progress is not None:
+            progress.plan([rs_result.query for rs_result in failed])
+            for rs_result in failed:
+                progress.update(rs_result)
+        return failed
+
+    def _get_slices(self, queries: List[ResourceQuery],
+                    progress: SearchProgress = None) -> List[ResourceResult]:
+        """Fetch slices, of any number of resources, under the concurrency
+            budget of the resource server and report each as it completes.
+        """
+        if progress is None:
+            return self.rs.get_data(queries)
+        rs_results = []
+        for rs_result in self.rs.iter_data(queries):
+            progress.update(rs_result)
+            rs_results.append(rs_result)
+        return rs_results
 
     def make_date_bins(self, start_date, end_date, date_bins):
         if end_date - start_date > timedelta(days=10):
@@ -256,13 +485,153 @@ class Entity:
             date_bins.append(end_date.strftime(self.time_format))
             return
 
+    def _during_queries(self, start_time: str, end_time: str, offset: int,
+                        limit: int,
+                        ranges: Dict[str, List[Tuple[datetime, datetime]]] = None,
+                        resource_ids: List[str] = None
+                        ) -> Tuple[QueryPlanner, List[ResourceQuery]]:
+        """Build and plan the slices of a temporal search for every resource,
+            or the given ones, or for the given ranges of each resource.
+        """
+        if ranges is not None:
+            resource_ids = list(ranges.keys())
+        elif resource_ids is None:
+            resource_ids = [resource["id"] for resource in self.resources]
+        self.start_time = start_time
+        self.end_time = end_time
+
+        start_date = datetime.strptime(self.start_time, self.time_format)
+        end_date = datetime.strptime(self.end_time, self.time_format)
+
+        if end_date <= start_date:
+            raise RuntimeError("'end_time' should be greater than 'start_time'")
+
+        token = self._request_token()
+
+        """ Make batch queries """
+        queries = []
+        for resource_id in resource_ids:
+            resource_ranges = [(start_date, end_date)]
+            if ranges is not None:
+                resource_ranges = ranges[resource_id]
+            for range_start, range_end in resource_ranges:
+                date_bins = []
+                self.make_date_bins(range_start, range_end, date_bins)
+                for i in range(0, len(date_bins) - 1):
+                    resource_query = ResourceQuery()
+                    resource_query.set_header("token", token)
+                    resource_query.set_offset_limit(offset, limit)
+                    resource_query.add_entity(resource_id)
+                    resource_query.during_search(
+                        start_time=date_bins[i], end_time=date_bins[i + 1]
+                    )
+                    queries.append(resource_query)
+
+        # Slices of all the bins and resources are planned together,
+        # level by level.
+        planner = self._planner()
+        queries = planner.plan(queries)
+        return planner, queries
+
+    def _iter_slices(self, planner: QueryPlanner, queries: List[ResourceQuery],
+                     buffer_size: int, progress: SearchProgress = None
+                     ) -> Iterator[ResourceResult]:
+        """Fetch planned slices and yield the successful ones in the order
+            of the resources and of time, with at most buffer_size responses
+            held at a time.
+        """
+        self.failed_results = []
+        for rs_result in self._planner_failures(planner, progress):
+            self._slice_failed(rs_result)
+        for rs_result in self.rs.iter_data(queries, ordered=True,
+                                           buffer_size=buffer_size):
+            if progress is not None:
+                progress.update(rs_result)
+            rs_results = [rs_result]
+            if planner.overflowed(rs_result):
+                replanned = planner.plan([rs_result.query], use_model=False)
+                rs_results = self._planner_failures(planner) + self._get_slices(replanned)
+                if progress is not None:
+                    progress.replanned([rs_result],
+                                       [r.query for r in rs_results])
+                    for replanned_result in rs_results:
+                        progress.update(replanned_result)
+
+            for rs_result in rs_results:
+                if not rs_result.is_success():
+                    self._slice_failed(rs_result)
+                    continue
+                planner.observe(rs_result.query,
+                                max(rs_result.totalHits, len(rs_result.results)))
+                yield rs_result
+
+        planner.save()
+        if len(self.failed_results) > 0:
+            print(f"{len(self.failed_results)} of {len(queries)} queries failed, "
+                  f"see 'failed_results' and 'refetch_failed()'.")
+
+    def _slice_failed(self, rs_result: ResourceResult) -> None:
+        """Keep a failed slice for refetch_failed, a 401 fails the search.
+        """
+        if rs_result.status == 401:
+            raise RuntimeError("Not Authorized: Invalid Credentials")
+        self.failed_results.append(rs_result)
+        self._failed_fetch = self.rs.get_data
+
+    def iter_during(
+        self,
+        start_time: str = None,
+        end_time: str = None,
+        offset: int = None,
+        limit: int = None,
+        buffer_size: int = 8,
+        resource_ids: List[str] = None,
+        progress: Callable[[str, Dict], None] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Method to fetch resources for temporal based search slice by
+            slice, without holding the whole range in memory.
+
+        Args:
+            start_time (String): The starting timestamp for the query.
+            end_time (String): The ending timestamp for the query.
+            offset (Integer): The offset from the first result to fetch.
+            limit (Integer): The maximum results to be returned.
+            buffer_size (Integer): Slices fetched ahead of the consumer.
+            resource_ids (List[String]): Resources to be searched, every
+                resource of the entity when None.
+            progress (Callable): Called with the resource id and its
+                progress whenever one of its slices completes.
+
+        Yields:
+            resource_df (pd.DataFrame): Pandas DataFrame of a slice, by
+                resource and in time order.
+        """
+        planner, queries = self._during_queries(start_time, end_time, offset, limit,
+                                                resource_ids=resource_ids)
+        self.progress = SearchProgress(progress).plan(queries)
+        for rs_result in self._iter_slices(planner, queries, buffer_size,
+                                           self.progress):
+            yield self._slice_frame(rs_result.results)
+
+    def _slice_frame(self, results: List[Dict]) -> pd.DataFrame:
+        resource_df = pd.json_normalize(results)
+        if "observationDateTime" in resource_df.columns:
+            resource_df = resource_df.sort_values(
+                by="observationDateTime", kind="stable").reset_index(drop=True)
+        return resource_df
+
     def during_search(
         self,
         start_time: str = None,
         end_time: str = None,
         offset: int = None,
         limit: int = None,
-    ) -> pd.DataFrame:
+        sink: Union[str, ResultSink] = None,
+        buffer_size: int = 8,
+        refresh_trailing: bool = False,
+        resource_ids: List[str] = None,
+        progress: Callable[[str, Dict], None] = None,
+    ) -> Union[pd.DataFrame, Dict]:
         """Method to fetch resources for temporal based search
             and generate a dataframe.
 
@@ -271,73 +640,240 @@ class Entity:
             end_time (String): The ending timestamp for the query.
             offset (Integer): The offset from the first result to fetch.
             limit (Integer): The maximum results to be returned.
+            sink (String/ResultSink): File path (.csv, .json or .parquet) or
+                ResultSink the slices are streamed to instead of being
+                collected in memory.
+            buffer_size (Integer): Slices fetched ahead of the sink.
+            refresh_trailing (Boolean): With a temporal cache, fetch the
+                partially covered buckets again from their start instead
+                of only their uncovered end.
+            resource_ids (List[String]): Resources to be searched, every
+                resource of the entity when None. The slices of all the
+                resources share the concurrency of the resource server.
+            progress (Callable): Called with the resource id and its
+                progress whenever one of its slices completes, see also
+                'progress'.
 
         Returns:
-            resources_df (pd.DataFrame): Pandas DataFrame with temporal data.
+            resources_df (pd.DataFrame): Pandas DataFrame with temporal data,
+                or the stats of the sink (rows, slices, bytes, path).
         """
+        if resource_ids is None:
+            resource_ids = [resource["id"] for resource in self.resources]
+        self.progress = SearchProgress(progress)
+        if (self.temporal_cache is not None and sink is None
+                and offset is None and limit is None):
+            return self._cached_during_search(start_time, end_time,
+                                              refresh_trailing, resource_ids)
+
         print("Downloading data. This may take a while")
+        planner, queries = self._during_queries(start_time, end_time, offset, limit,
+                                                resource_ids=resource_ids)
+        self.progress.plan(queries)
+
+        if sink is not None:
+            if not isinstance(sink, ResultSink):
+                sink = ResultSink.create(sink)
+            with sink:
+                for rs_result in self._iter_slices(planner, queries, buffer_size,
+                                                   self.progress):
+                    sink.write(rs_result.results,
+                               self._slice_frame(rs_result.results))
+            stats = sink.close()
+            print(f"Wrote {stats['rows']} rows ({stats['bytes']} bytes) "
+                  f"to '{stats['path']}'")
+            return stats
+
+        self.failed_results = []
+        rs_results: List[ResourceResult] = self._fetch_slices(planner, queries,
+                                                              self.progress)
+        if len(resource_ids) > 1:
+            print(f"Fetched {sum(len(r.results) for r in rs_results)} rows "
+                  f"of {len(resource_ids)} resources, see 'progress'.")
+
+        self.resources_df = self._assemble(rs_results, keep_json=True)
+        return self.resources_df
+
+    def _cached_during_search(self, start_time: str, end_time: str,
+                              refresh_trailing: bool,
+                              resource_ids: List[str]) -> pd.DataFrame:
+        """Read a temporal search from the temporal cache, fetching only
+            the ranges it does not cover.
+        """
+        start, end = self._aware(start_time), self._aware(end_time)
+        if end <= start:
+            raise RuntimeError("'end_time' should be greater than 'start_time'")
         self.start_time = start_time
         self.end_time = end_time
 
-        start_date = datetime.strptime(self.start_time, self.time_format)
-        end_date = datetime.strptime(self.end_time, self.time_format)
-
-        if end_date <= start_date:
-            raise RuntimeError("'end_time' should be greater than 'start_time'")
-
-        date_bins = []
-        self.make_date_bins(start_date, end_date, date_bins)
-
-        resources_df = pd.DataFrame()
+        assembler = ResultAssembler()
+        gaps = {}
+        for resource_id in resource_ids:
+            records, resource_gaps = self.temporal_cache.lookup(
+                resource_id, start, end, refresh_trailing)
+            assembler.add(records)
+            if len(resource_gaps) > 0:
+                gaps[resource_id] = resource_gaps
+
+        self.failed_results = []
+        if len(gaps) > 0:
+            print("Downloading data. This may take a while")
+            fetched_at = time.time()
+            planner, queries = self._during_queries(
+                start_time, end_time, None, None, ranges=gaps)
+            self.progress.plan(queries)
+            rs_results = self._fetch_slices(planner, queries, self.progress)
+
+            fetched: Dict[str, List[Dict]] = {resource_id: [] for resource_id in gaps}
+            for rs_result in rs_results:
+                fetched[rs_result.query._entities[0]] += rs_result.results
+            failed = {rs_result.query._entities[0] for rs_result in self.failed_results}
+            for resource_id, records in fetched.items():
+                # Ranges with failed slices stay uncovered.
+                if resource_id not in failed:
+                    self.temporal_cache.store(resource_id, gaps[resource_id],
+                                              records, fetched_at)
+                assembler.add(self.temporal_cache.clip(records, start, end))
+
+        self.resources_df = self._assemble([], assembler, keep_json=True)
+        return self.resources_df
+
+    def _aware(self, timestamp: str) -> datetime:
+        """Parse a query timestamp into a timezone aware datetime.
+        """
+        try:
+            parsed = datetime.fromisoformat(timestamp)
+        except ValueError:
+            parsed = datetime.strptime(timestamp, self.time_format)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
+    def _format(self, moment: datetime) -> str:
+        """Format a timezone aware datetime with the time format, in the
+            offset the format carries.
+        """
+        sample = datetime(2000, 1, 1).strftime(self.time_format)
+        return moment.astimezone(self._aware(sample).tzinfo).strftime(self.time_format)
 
-        """ Make batch queries """
-        queries = []
-        for i in range(0, len(date_bins) - 1):
-            resource_query = ResourceQuery()
-            resource_query.set_header("token", self.token_obj.request_token())
-            resource_query.set_offset_limit(offset, limit)
-            resource_query.add_entity(self.resources[0]["id"])
-            resource_query.during_search(
-                start_time=date_bins[i], end_time=date_bins[i + 1]
-            )
-            batch_queries = []
-            self.make_query_batches(resource_query, batch_queries)
-            queries += batch_queries
+    def sync(
+        self,
+        path: str,
+        since: str = "auto",
+        until: str = None,
+        file_type: str = "json",
+        initial: timedelta = timedelta(days=1),
+        buffer_size: int = 8,
+    ) -> Dict[str, Dict]:
+        """Method to append the data of every resource which is newer than
+            the last sync to a local dataset, partitioned by resource and
+            day as <path>/resource=<id>/date=<YYYY-MM-DD>/part-<run>-<slice>.<type>.
+            The latest observationDateTime written per resource is kept in
+            <path>/_sync_state.json and saved with the files of each slice.
 
-        rs_results: List[ResourceResult] = self.rs.get_data(queries)
+        Args:
+            path (String): Directory of the dataset.
+            since (String): Start of the sync, 'auto' resumes after the
+                high-water mark of each resource.
+            until (String): End of the sync, defaults to now.
+            file_type (String): 'csv', 'json' (newline delimited) or
+                'parquet'.
+            initial (timedelta): Window synced for a resource without a
+                high-water mark.
+            buffer_size (Integer): Slices fetched ahead of the writer.
 
-        for rs_result in rs_results:
-            try:
-                if rs_result.type == "urn:dx:rs:success":
-                    resource_df = pd.json_normalize(rs_result.results)
-                    self.resources_json = self.resources_json + rs_result.results
-                    if len(resources_df) == 0:
-                        resources_df = resource_df
-                    else:
-                        resources_df = pd.concat([resources_df, resource_df])
-                elif rs_result.type == 401:
-                    raise RuntimeError("urn:dx:rs:invalidAuthorizationToken")
-            except Exception as e:
-                print(f"No Resource Data: {e}")
+        Returns:
+            stats (Dict): Rows written and high-water mark per resource.
+        """
+        state = SyncState(os.path.join(path, "_sync_state.json"))
+        if until is None:
+            until = self._format(datetime.now(timezone.utc))
+        run = str(int(time.time() * 1000))
 
-        # Processing data as a time series dataframe:
-        # 1) converting time feature to datetime.
-        # 2) sorting values based on time.
-        # 3) resetting the indices for the dataframe.
-        try:
-            if len(resources_df) != 0:
-                resources_df["observationDateTime"] = pd.to_datetime(
-                    resources_df["observationDateTime"]
-                )
-                resources_df = resources_df.sort_values(by="observationDateTime")
+        stats = {}
+        for resource in self.resources:
+            resource_id = resource["id"]
+            mark = state.get(resource_id) if since == "auto" else None
+            if mark is not None:
+                # The mark itself was synced, the query starts at its second.
+                start = self._format(self._aware(mark))
+            elif since == "auto":
+                start = self._format(self._aware(until) - initial)
             else:
-                print("No Data available during the timeframe.")
-        except Exception as e:
-            print(f"Data format issue: {e}")
-
-        resources_df = resources_df.reset_index(drop=True)
-        self.resources_df = resources_df
-        return resources_df
+                start = since
+
+            rows = 0
+            if self._aware(start) < self._aware(until):
+                print(f"Syncing '{resource_id}' from {start}")
+                rows = self._sync_resource(resource_id, start, until, mark, state,
+                                           os.path.join(path, "resource=" +
+                                                        urllib.parse.quote(resource_id, safe="")),
+                                           f"part-{run}", file_type, buffer_size)
+                state.save()
+            stats[resource_id] = {"rows": rows,
+                                  "high_water_mark": state.get(resource_id)}
+        return stats
+
+    def _sync_resource(self, resource_id: str, start: str, until: str,
+                       mark: str, state: SyncState, directory: str,
+                       file_name: str, file_type: str, buffer_size: int) -> int:
+        """Write the slices of a resource newer than its mark to daily
+            partitions. The part files of a slice are written under a
+            temporary name and renamed together with saving the mark, so
+            an interrupted run leaves no records newer than the mark.
+        """
+        # Part files of an interrupted run were never committed.
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(".tmp"):
+                    os.remove(os.path.join(root, name))
+
+        mark_ts = None if mark is None else SyncState.timestamp(mark)
+        planner, queries = self._during_queries(start, until, None, None,
+                                                resource_ids=[resource_id])
+        rows = 0
+        for index, rs_result in enumerate(self._iter_slices(planner, queries,
+                                                            buffer_size)):
+            if len(self.failed_results) > 0:
+                # Slices come in time order, the mark must not move past
+                # the failed one.
+                print(f"Sync of '{resource_id}' stopped at a failed slice, "
+                      f"the next run resumes from {state.get(resource_id)}.")
+                break
+            partitions: Dict[str, List[Dict]] = {}
+            newest = None
+            for record in rs_result.results:
+                observed = record.get("observationDateTime")
+                if observed is None:
+                    continue
+                if mark_ts is not None and SyncState.timestamp(observed) <= mark_ts:
+                    continue
+                partitions.setdefault(observed[:10], []).append(record)
+                if newest is None or SyncState.timestamp(observed) > SyncState.timestamp(newest):
+                    newest = observed
+
+            parts = []
+            try:
+                for day, records in partitions.items():
+                    partition = os.path.join(directory, "date=" + day)
+                    os.makedirs(partition, exist_ok=True)
+                    part = os.path.join(partition,
+                                        f"{file_name}-{index:05d}.{file_type}")
+                    parts.append(part)
+                    with ResultSink.create(part + ".tmp", file_type) as sink:
+                        sink.write(records)
+            except BaseException:
+                for part in parts:
+                    if os.path.exists(part + ".tmp"):
+                        os.remove(part + ".tmp")
+                raise
+            for part in parts:
+                os.replace(part + ".tmp", part)
+            rows += sum(len(records) for records in partitions.values())
+            if newest is not None:
+                state.advance(resource_id, newest)
+                state.save()
+        return rows
 
     def property_search(
         self, key: str = None, value: str_or_float = None, operation: str = None
@@ -355,36 +891,28 @@ class Entity:
             resources_df (pd.DataFrame): Pandas DataFrame with property data.
         """
         """ Make batch queries """
-        queries = []
         limit = 5000
-        curr_offset = 0
         # Max documents currently retrievable
         max_total_hits = 1e6
-        curr_total_hits = 1e6
-        resources_df = pd.DataFrame()
-        total_results = []
+        self.failed_results = []
 
+        queries = []
         for resource in self.resources:
-            while (curr_offset + 1 < curr_total_hits) and (
-                curr_offset + 1 < max_total_hits
-            ):
-                resource_query = ResourceQuery()
-                resource_query.set_offset_limit(curr_offset, limit)
-                resource_query.add_entity(resource["id"])
-                resource_query.property_search(
-                    key="id", value=resource["id"], operation=operation
-                )
-                rs_results = self.rs.get_data_using_get([resource_query])
-                curr_offset += 5000
-                curr_total_hits = rs_results[0].totalHits
-                if rs_results[0].type == "urn:dx:rs:success":
-                    self.resources_json = self.resources_json + rs_results[0].results
-                    resource_df = pd.json_normalize(rs_results[0].results)
-                    resources_df = pd.concat([resources_df, resource_df])
-
-        resources_df = resources_df.reset_index(drop=True)
-        self.resources_df = resources_df
-        return resources_df
+            resource_query = ResourceQuery()
+            resource_query.add_entity(resource["id"])
+            resource_query.property_search(
+                key="id", value=resource["id"], operation=operation
+            )
+            queries.append(resource_query)
+
+        # Every page of every resource is fetched concurrently.
+        fetch = functools.partial(self.rs.get_data_using_get,
+                                  page_size=limit, max_hits=max_total_hits)
+        rs_results = self._collect_results(fetch(queries), fetch)
+
+        self.resources_df = self._assemble(rs_results, keep_json=True,
+                                           time_series=False)
+        return self.resources_df
 
     def geo_search(
         self,
@@ -407,8 +935,6 @@ class Entity:
         Returns:
             resources_df (pd.DataFrame): Pandas DataFrame with geo data.
         """
-        resources_df = pd.DataFrame()
-
         queries = []
         for resource in self.resources:
             resource_query = ResourceQuery()
@@ -423,40 +949,13 @@ class Entity:
                 coordinates=coordinates,
             )
             queries.append(query)
-        rs_results: List[ResourceResult] = self.rs.get_data(queries)
-
-        for rs_result in rs_results:
-            try:
-                if rs_result.type == "urn:dx:rs:success":
-                    resource_df = pd.json_normalize(rs_result.results)
-
-                    if len(resources_df) == 0:
-                        resources_df = resource_df
-                    else:
-                        resources_df = pd.concat([resources_df, resource_df])
-                elif rs_result.type == 401:
-                    raise RuntimeError("Not Authorized: Invalid credentials")
-            except Exception as e:
-                print(f"No Resource Data: {e}")
-
-        # Processing data as a time series dataframe:
-        # 1) converting time feature to datetime.
-        # 2) sorting values based on time.
-        # 3) resetting the indices for the dataframe.
-        try:
-            if len(resources_df) != 0:
-                resources_df["observationDateTime"] = pd.to_datetime(
-                    resources_df["observationDateTime"]
-                )
-                resources_df = resources_df.sort_values(by="observationDateTime")
-            else:
-                print("No Data available during the timeframe.")
-        except Exception as e:
-            print(f"Data format issue: {e}")
+        self.failed_results = []
+        rs_results: List[ResourceResult] = self._collect_results(
+            self.rs.get_data(queries), self.rs.get_data
+        )
 
-        resources_df = resources_df.reset_index(drop=True)
-        self.resources_df = resources_df
-        return resources_df
+        self.resources_df = self._assemble(rs_results)
+        return self.resources_df
 
     def download(self, file_name: str = None, file_type: str = "csv") -> Entity:
         """Method to use the dataframe generated using generated queries
@@ -491,7 +990,7 @@ class Entity:
                 print(f"File downloaded successfully: '{file_name}")
             elif file_type == "json":
                 with open(file_name + ".json", "w") as f:
-                    json.dump(self.resources_json, f)
+                    JSONCodec.get_default().dump(self.resources_json, f)
                 print(f"File downloaded successfully: '{file_name}.json'")
             elif file_type == "parquet":
                 self.resources_df.to_parquet(f"{file_name}.parquet")
@@ -509,6 +1008,7 @@ class Entity:
         self,
         start_time: str = None,
         end_time: str = None,
+        resource_id: str = None,
     ) -> Dict:
         """Initiate an asynchronous search request for large datasets.
         
@@ -518,6 +1018,8 @@ class Entity:
         Args:
             start_time (String): The starting timestamp for the query.
             end_time (String): The ending timestamp for the query.
+            resource_id (String): Resource to be searched, defaults to the
+                first resource of the entity.
 
         Returns:
             Dict: Response containing searchId and status information.
@@ -532,7 +1034,8 @@ class Entity:
             raise RuntimeError("'end_time' should be greater than 'start_time'")
 
         # Get the resource ID
-        resource_id = self.resources[0]["id"]
+        if resource_id is None:
+            resource_id = self.resources[0]["id"]
         
         # Build the async search URL
         async_url = f"{self.rs_url}/async/search"
@@ -544,16 +1047,17 @@ class Entity:
         }
         
         # Get token
-        token = self.token_obj.request_token()
+        token = self._request_token()
         headers = {"token": token}
         
         # Make the async search request
-        response = requests.get(async_url, params=params, headers=headers)
+        response = self.rs._http_entity().get(
+            async_url + "?" + urllib.parse.urlencode(params), headers)
         
-        if response.status_code not in [200, 201]:
-            raise RuntimeError(f"Async search request failed: {response.status_code} - {response.text}")
+        if response.get_status_code() not in [200, 201]:
+            raise RuntimeError(f"Async search request failed: {response.get_status_code()} - {response.get_text()}")
         
-        result = response.json()
+        result = response.get_json()
         return result
 
     def async_status(
@@ -576,16 +1080,17 @@ class Entity:
         params = {"searchId": search_id}
         
         # Get token
-        token = self.token_obj.request_token()
+        token = self._request_token()
         headers = {"token": token}
         
         # Make the status request
-        response = requests.get(status_url, params=params, headers=headers)
+        response = self.rs._http_entity().get(
+            status_url + "?" + urllib.parse.urlencode(params), headers)
         
-        if response.status_code not in [200, 201]:
-            raise RuntimeError(f"Async status request failed: {response.status_code} - {response.text}")
+        if response.get_status_code() not in [200, 201]:
+            raise RuntimeError(f"Async status request failed: {response.get_status_code()} - {response.get_text()}")
         
-        result = response.json()
+        result = response.get_json()
         return result
 
     def _format_time(self, seconds: int) -> str:
@@ -722,20 +1227,20 @@ class Entity:
             file_name = file_name.split(".")[0]
         
         # Get token for download
-        token = self.token_obj.request_token()
+        token = self._request_token()
         headers = {"token": token}
         
         # Download the file with progress
-        response = requests.get(download_url, headers=headers, stream=True)
+        response = self.rs._http_entity().get(download_url, headers, stream=True)
         
-        if response.status_code not in [200, 201]:
-            raise RuntimeError(f"Download failed: {response.status_code} - {response.text}")
+        if response.get_status_code() not in [200, 201]:
+            raise RuntimeError(f"Download failed: {response.get_status_code()} - {response.get_text()}")
         
         # Async downloads always return JSON
         output_file = f"{file_name}.json"
         
         # Get file size if available
-        total_size = int(response.headers.get("content-length", 0))
+        total_size = int(response.get_headers().get("content-length", 0))
         downloaded = 0
         
         # Write to file with download progress
@@ -795,8 +1300,8 @@ class Entity:
         # Append to existing file or create new
         try:
             with open(output_file, "r") as f:
-                existing = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+                existing = JSONCodec.get_default().load(f)
+        except (FileNotFoundError, ValueError):
             existing = []
         
         existing.append({
@@ -808,7 +1313,7 @@ class Entity:
         })
         
         with open(output_file, "w") as f:
-            json.dump(existing, f, indent=2)
+            JSONCodec.get_default().dump(existing, f, indent=2)
         
         print(f"Async search initiated. SearchId: {search_id}")
         print(f"SearchId saved to: {output_file}")
@@ -948,6 +1453,13 @@ class Entity:
         type=int,
         help="Maximum seconds to wait for async download (default: 3600).",
     )
+    @click.option(
+        "--token-cache",
+        "token_cache",
+        is_flag=True,
+        default=False,
+        help="Reuse unexpired tokens across runs, kept in ~/.iudx/tokens.json.",
+    )
     def cli(
         self,
         auth_url,
@@ -972,6 +1484,7 @@ class Entity:
         async_only,
         poll_interval,
         max_poll_time,
+        token_cache,
     ) -> Entity:
         """Method to implement the command line interface for the
         sdk for getting termporal query and download files.
@@ -995,11 +1508,16 @@ class Entity:
             async_only (Boolean): Flag to start async without waiting.
             poll_interval (int): Seconds between async status checks.
             max_poll_time (int): Maximum seconds to wait for async download.
+            token_cache (Boolean): Flag to reuse tokens across invocations.
         """
         entity = None
         if entity_id is not None:
             if token is None and client_id is not None and client_secret is not None:
-                token_obj = Token(client_id=client_id, client_secret=client_secret)
+                token_obj = Token(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    cache=FileTokenCache() if token_cache else None,
+                )
                 if auth_url is not None:
                     token_obj.auth_url = auth_url
                 if entity_type is not None and role is not None:
@@ -0,0 +1,128 @@
+"""Module doc string. Leave empty for now.
+
+ResultAssembler.py
+"""
+import itertools
+from typing import TypeVar, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+ResultAssembler = TypeVar('T')
+
+
+class ResultAssembler():
+    """Gathers the records of many query results and builds the final
+       DataFrame in a single concatenation, so assembling N batches takes
+       linear instead of quadratic time and memory.
+    """
+
+    def __init__(self: ResultAssembler,
+                 time_column: str = "observationDateTime"):
+        """ResultAssembler base class constructor
+
+        Args:
+            time_column (String): Column the time series is sorted by.
+        """
+        self.time_column = time_column
+        self.rows = 0
+        self._batches: List[List[Dict]] = []
+        self._frames: List[pd.DataFrame] = []
+        return
+
+    def add(self, records: List[Dict]) -> ResultAssembler:
+        """Method to add the records of a result, they are not copied.
+
+        Args:
+            records (List[Dict]): Records of a result.
+        """
+        if records:
+            self._batches.append(records)
+            self.rows += len(records)
+        return self
+
+    def add_frame(self, frame: pd.DataFrame) -> ResultAssembler:
+        """Method to add an already normalized batch.
+
+        Args:
+            frame (pd.DataFrame): Batch of records.
+        """
+        if frame is not None and len(frame) > 0:
+            self._frames.append(frame)
+            self.rows += len(frame)
+        return self
+
+    def records(self) -> List[Dict]:
+        """Method to return the added records as one list.
+
+        Returns:
+            records (List[Dict]): Records in the order they were added.
+        """
+        return list(itertools.chain.from_iterable(self._batches))
+
+    @staticmethod
+    def reconcile(frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+        """Method to cast the columns whose dtype differs between batches
+            to a common dtype: the widest numeric type for numbers, and
+            object otherwise.
+
+        Args:
+            frames (List[pd.DataFrame]): Batches to be concatenated.
+        Returns:
+            frames (List[pd.DataFrame]): Batches with agreeing dtypes.
+        """
+        dtypes: Dict[str, set] = {}
+        for frame in frames:
+            for column, dtype in frame.dtypes.items():
+                dtypes.setdefault(column, set()).add(dtype)
+
+        common = {}
+        for column, kinds in dtypes.items():
+            if len(kinds) < 2:
+                continue
+            if all(pd.api.types.is_numeric_dtype(kind)
+                   and not pd.api.types.is_bool_dtype(kind) for kind in kinds):
+                common[column] = np.result_type(*kinds)
+            else:
+                common[column] = np.dtype(object)
+
+        if len(common) == 0:
+            return frames
+        reconciled = []
+        for frame in frames:
+            casts = {column: dtype for column, dtype in common.items()
+                     if column in frame.columns and frame[column].dtype != dtype}
+            reconciled.append(frame.astype(casts) if casts else frame)
+        return reconciled
+
+    def to_frame(self) -> pd.DataFrame:
+        """Method to build the DataFrame of every added batch, with the
+            union of their columns.
+
+        Returns:
+            resources_df (pd.DataFrame): The assembled DataFrame.
+        """
+        frames = list(self._frames)
+        frames += [pd.json_normalize(records) for records in self._batches]
+        if len(frames) == 0:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        return pd.concat(self.reconcile(frames), ignore_index=True, sort=False)
+
+    def to_time_series(self) -> pd.DataFrame:
+        """Method to build the DataFrame as a time series: the time column
+            converted to datetime, rows sorted by it and indices reset.
+
+        Returns:
+            resources_df (pd.DataFrame): The assembled DataFrame.
+        """
+        resources_df = self.to_frame()
+        if self.time_column in resources_df.columns:
+            resources_df[self.time_column] = pd.to_datetime(
+                resources_df[self.time_column]
+            )
+            resources_df = resources_df.sort_values(
+                by=self.time_column, kind="stable")
+        return resources_df.reset_index(drop=True)
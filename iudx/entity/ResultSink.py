@@ -0,0 +1,249 @@
+"""Module doc string. Leave empty for now.
+
+ResultSink.py
+"""
+import os
+from typing import TypeVar, Dict, List
+
+import pandas as pd
+
+from iudx.common.JSONCodec import JSONCodec
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+ResultSink = TypeVar('T')
+
+
+class ResultSink():
+    """Abstract class for the writers a streaming search appends its
+       slices to. Only the slice being written is held in memory. Sinks
+       with a fixed schema write the columns which appear after the first
+       slice, and values not fitting their column, to a side file, see
+       'extra_path'.
+    """
+
+    def __init__(self: ResultSink, path: str):
+        """ResultSink base class constructor
+
+        Args:
+            path (String): File the records are written to.
+        """
+        self.path = path
+        self.rows = 0
+        self.slices = 0
+        self.extra_path = os.path.splitext(path)[0] + ".extra.json"
+        self.extra_columns: set = set()
+        self._extra_file = None
+        self._closed = False
+        return
+
+    @staticmethod
+    def create(path: str, file_type: str = None) -> ResultSink:
+        """Method to create the sink for a file type.
+
+        Args:
+            path (String): File the records are written to.
+            file_type (String): 'csv', 'json' (newline delimited) or
+                'parquet', taken from the file extension when None.
+        Returns:
+            sink (ResultSink): The sink object.
+        """
+        if file_type is None:
+            file_type = os.path.splitext(path)[1].lstrip(".")
+        sinks = {"csv": CSVSink, "json": NDJSONSink, "ndjson": NDJSONSink,
+                 "parquet": ParquetSink}
+        if file_type.lower() not in sinks:
+            raise RuntimeError(
+                f"File type is not supported. "
+                f"Please choose a file type: {list(sinks.keys())}"
+            )
+        return sinks[file_type.lower()](path)
+
+    def write(self, records: List[Dict], frame: pd.DataFrame = None) -> None:
+        """Method to append the records of a slice.
+
+        Args:
+            records (List[Dict]): Records of the slice.
+            frame (pd.DataFrame): The records already normalized, if any.
+        """
+        if len(records) == 0:
+            return None
+        self._write(records, frame)
+        self.rows += len(records)
+        self.slices += 1
+        return None
+
+    def _write(self, records: List[Dict], frame: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        return None
+
+    def _fit(self, frame: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Reindex a slice to the columns of the file. Values of the other
+            columns go to the side file.
+        """
+        self._spill(frame[[column for column in frame.columns
+                           if column not in set(columns)]])
+        return frame.reindex(columns=columns)
+
+    def _spill(self, values: pd.DataFrame) -> None:
+        """Write the non-null values of columns the file cannot hold to the
+            side file as newline delimited JSON, with the index of their
+            row in the file under 'row'.
+        """
+        if len(values.columns) == 0:
+            return None
+        rows = values.reset_index(drop=True)
+        rows.insert(0, "row", range(self.rows, self.rows + len(rows)))
+        rows = rows[values.notna().any(axis=1).to_numpy()]
+        if len(rows) > 0:
+            self.extra_columns.update(values.columns)
+            if self._extra_file is None:
+                self._extra_file = open(self.extra_path, "w")
+            lines = rows.to_json(orient="records", lines=True)
+            self._extra_file.write(lines if lines.endswith("\n") else lines + "\n")
+        return None
+
+    def close(self) -> Dict:
+        """Method to flush and close the file.
+
+        Returns:
+            stats (Dict): Rows, slices and bytes written, and the path.
+        """
+        if not self._closed:
+            self._closed = True
+            self._close()
+            if self._extra_file is not None:
+                self._extra_file.close()
+                print(f"Values not fitting the columns of the first slice were "
+                      f"written to '{self.extra_path}': {sorted(self.extra_columns)}")
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {"path": self.path, "rows": self.rows, "slices": self.slices,
+                "bytes": size}
+
+    def __enter__(self) -> ResultSink:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class CSVSink(ResultSink):
+    """Appends slices to a CSV file. The columns are fixed by the first
+       slice; columns appearing later are written to the side file.
+    """
+
+    def __init__(self, path: str):
+        ResultSink.__init__(self, path)
+        self.columns: List[str] = None
+        self._file = open(path, "w", newline="")
+        return
+
+    def _write(self, records: List[Dict], frame: pd.DataFrame) -> None:
+        if frame is None:
+            frame = pd.json_normalize(records)
+        header = self.columns is None
+        if header:
+            self.columns = list(frame.columns)
+        else:
+            frame = self._fit(frame, self.columns)
+        frame.to_csv(self._file, index=False, header=header)
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class NDJSONSink(ResultSink):
+    """Appends the raw records to a newline delimited JSON file.
+    """
+
+    def __init__(self, path: str):
+        ResultSink.__init__(self, path)
+        self._codec = JSONCodec.get_default()
+        self._file = open(path, "w")
+        return
+
+    def _write(self, records: List[Dict], frame: pd.DataFrame) -> None:
+        self._file.write(
+            "".join(self._codec.dumps(record) + "\n" for record in records))
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """Appends every slice as a row group of a Parquet file. The schema is
+       fixed by the first slice, with integer columns widened to float and
+       all-null columns to string. Later slices are cast to it; columns
+       appearing later, or whose values do not fit the type of the file,
+       are written to the side file. Requires pyarrow.
+    """
+
+    def __init__(self, path: str):
+        if pyarrow is None:
+            raise ImportError("Parquet output requires pyarrow, "
+                              "please install pyarrow.")
+        ResultSink.__init__(self, path)
+        self._writer = None
+        self._schema = None
+        return
+
+    @staticmethod
+    def _widen(field):
+        if pyarrow.types.is_integer(field.type):
+            return field.with_type(pyarrow.float64())
+        if pyarrow.types.is_null(field.type):
+            return field.with_type(pyarrow.string())
+        return field
+
+    def _cast(self, values: pd.Series, field):
+        """Convert a column of a slice to the type of the file, None when
+            its values do not fit.
+        """
+        try:
+            array = pyarrow.array(values, from_pandas=True)
+            if array.type == field.type:
+                return array
+            # Text is not parsed into numbers or dates.
+            if (pyarrow.types.is_string(array.type)
+                    and not pyarrow.types.is_string(field.type)):
+                return None
+            return array.cast(field.type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError,
+                pyarrow.ArrowTypeError):
+            return None
+
+    def _write(self, records: List[Dict], frame: pd.DataFrame) -> None:
+        if frame is None:
+            frame = pd.json_normalize(records)
+        if self._writer is None:
+            table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+            self._schema = pyarrow.schema(
+                [self._widen(field) for field in table.schema])
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, self._schema)
+            self._writer.write_table(table.cast(self._schema))
+            return None
+
+        frame = self._fit(frame, self._schema.names)
+        arrays = []
+        spilled = []
+        for field in self._schema:
+            array = self._cast(frame[field.name], field)
+            if array is None:
+                spilled.append(field.name)
+                array = pyarrow.nulls(len(frame), field.type)
+            arrays.append(array)
+        self._spill(frame[spilled])
+        self._writer.write_table(
+            pyarrow.Table.from_arrays(arrays, schema=self._schema))
+        return None
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -0,0 +1,115 @@
+"""Module doc string. Leave empty for now.
+
+SearchProgress.py
+"""
+import threading
+from typing import TypeVar, Callable, Dict, List
+
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.ResourceResult import ResourceResult
+
+
+SearchProgress = TypeVar('T')
+
+
+class SearchProgress():
+    """Per-resource progress of a search fanned out over the resources of
+       an entity: slices planned, fetched and failed, and rows received.
+    """
+
+    def __init__(self: SearchProgress,
+                 callback: Callable[[str, Dict], None] = None):
+        """SearchProgress base class constructor
+
+        Args:
+            callback (Callable): Called with the resource id and its stats
+                whenever a slice of the resource completes.
+        """
+        self.callback = callback
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        return
+
+    def plan(self, queries: List[ResourceQuery]) -> SearchProgress:
+        """Method to count the slices planned for each resource.
+
+        Args:
+            queries (List[ResourceQuery]): Planned slices.
+        """
+        with self._lock:
+            for query in queries:
+                self._entry(query)["slices"] += 1
+        return self
+
+    def update(self, rs_result: ResourceResult) -> None:
+        """Method to record a completed slice.
+
+        Args:
+            rs_result (ResourceResult): Result of the slice.
+        """
+        if rs_result.query is None:
+            return None
+        with self._lock:
+            stats = self._entry(rs_result.query)
+            stats["done"] += 1
+            if rs_result.is_success():
+                stats["rows"] += len(rs_result.results)
+            else:
+                stats["failed"] += 1
+            resource_id = rs_result.query._entities[0]
+            stats = dict(stats)
+        if self.callback is not None:
+            self.callback(resource_id, stats)
+        return None
+
+    def replanned(self, rs_results: List[ResourceResult],
+                  queries: List[ResourceQuery]) -> None:
+        """Method to replace slices which overflowed by their new slices.
+
+        Args:
+            rs_results (List[ResourceResult]): Results of the overflowing
+                slices, already recorded.
+            queries (List[ResourceQuery]): Slices they were split into.
+        """
+        with self._lock:
+            for rs_result in rs_results:
+                stats = self._entry(rs_result.query)
+                stats["slices"] -= 1
+                stats["done"] -= 1
+                stats["rows"] -= len(rs_result.results)
+            for query in queries:
+                self._entry(query)["slices"] += 1
+        return None
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Method to return the progress of every resource.
+
+        Returns:
+            stats (Dict): 'slices', 'done', 'failed' and 'rows' per
+                resource id.
+        """
+        with self._lock:
+            return {resource_id: dict(stats)
+                    for resource_id, stats in self._stats.items()}
+
+    def report(self) -> str:
+        """Method to format the progress as one line per resource.
+
+        Returns:
+            report (String): The progress report.
+        """
+        lines = []
+        for resource_id, stats in self.get_stats().items():
+            line = (f"{resource_id}: {stats['done']}/{stats['slices']} slices, "
+                    f"{stats['rows']} rows")
+            if stats["failed"] > 0:
+                line += f", {stats['failed']} failed"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def _entry(self, query: ResourceQuery) -> Dict:
+        resource_id = query._entities[0]
+        if resource_id not in self._stats:
+            self._stats[resource_id] = {"slices": 0, "done": 0, "failed": 0,
+                                        "rows": 0}
+        return self._stats[resource_id]
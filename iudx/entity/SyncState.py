@@ -0,0 +1,83 @@
+"""Module doc string. Leave empty for now.
+
+SyncState.py
+"""
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import TypeVar, Dict
+
+from iudx.common.JSONCodec import JSONCodec
+
+
+SyncState = TypeVar('T')
+
+
+class SyncState():
+    """High-water marks of an incremental sync: the latest
+       observationDateTime written for each resource, kept in a JSON file
+       next to the synced dataset.
+    """
+
+    def __init__(self: SyncState, path: str):
+        """SyncState base class constructor
+
+        Args:
+            path (String): JSON file of the marks.
+        """
+        self.path = os.path.expanduser(path)
+        self._marks: Dict[str, str] = self._read()
+        return
+
+    def get(self, resource_id: str) -> str:
+        """Method to return the high-water mark of a resource.
+
+        Args:
+            resource_id (String): Id of the resource.
+        Returns:
+            mark (String): Latest observationDateTime synced, None when
+                the resource was never synced.
+        """
+        return self._marks.get(resource_id)
+
+    def advance(self, resource_id: str, mark: str) -> None:
+        """Method to move the high-water mark of a resource forward, marks
+            older than the current one are ignored.
+
+        Args:
+            resource_id (String): Id of the resource.
+            mark (String): observationDateTime of the newest record synced.
+        """
+        current = self._marks.get(resource_id)
+        if current is None or self.timestamp(mark) > self.timestamp(current):
+            self._marks[resource_id] = mark
+        return None
+
+    @staticmethod
+    def timestamp(mark: str) -> float:
+        """Method to convert a mark into a unix timestamp, marks without
+            an offset are taken as UTC.
+        """
+        parsed = datetime.fromisoformat(mark.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, "r") as f:
+                return JSONCodec.get_default().load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Method to write the marks, replacing the file atomically so an
+            interrupted run keeps the previous marks.
+        """
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            JSONCodec.get_default().dump(self._marks, f, indent=2)
+        os.replace(tmp_path, self.path)
+        return None
@@ -0,0 +1,299 @@
+"""Module doc string. Leave empty for now.
+
+TemporalCache.py
+"""
+import contextlib
+import hashlib
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TypeVar, Dict, Iterator, List, Tuple
+
+from iudx.common.JSONCodec import JSONCodec
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+TemporalCache = TypeVar('T')
+
+TimeRange = Tuple[datetime, datetime]
+
+
+class TemporalCache():
+    """On-disk cache of temporal search results, partitioned per resource
+       into time buckets. An index records how far each bucket is covered,
+       so a search only fetches the ranges not covered yet and reads the
+       rest from disk. Buckets are fetched whole, which lets a later
+       search over an overlapping window reuse them. Buckets used least
+       recently are evicted once the cache outgrows its size limit.
+    """
+
+    def __init__(self: TemporalCache, path: str = "~/.iudx/temporal",
+                 bucket: timedelta = timedelta(days=1),
+                 max_bytes: int = 1 << 30,
+                 time_key: str = "observationDateTime"):
+        """TemporalCache base class constructor
+
+        Args:
+            path (String): Directory of the cache.
+            bucket (timedelta): Duration of a bucket, buckets are aligned
+                to multiples of it since the epoch.
+            max_bytes (Integer): Size the bucket files are kept under.
+            time_key (String): Field holding the time of a record.
+        """
+        self.path = os.path.expanduser(path)
+        self.bucket = bucket
+        self.max_bytes = max_bytes
+        self.time_key = time_key
+        self._codec = JSONCodec.get_default()
+        self._lock = threading.Lock()
+        return
+
+    def lookup(self, resource_id: str, start: datetime, end: datetime,
+               refresh_trailing: bool = False
+               ) -> Tuple[List[Dict], List[TimeRange]]:
+        """Method to read the cached records of a time range and find the
+            ranges to be fetched.
+
+        Args:
+            resource_id (String): Id of the resource.
+            start (datetime): Start of the range, timezone aware.
+            end (datetime): End of the range, timezone aware.
+            refresh_trailing (Boolean): Fetch partially covered buckets
+                again from their start, instead of only their uncovered
+                end, to pick up records which arrived late.
+        Returns:
+            records (List[Dict]): Cached records within the range.
+            gaps (List[Tuple]): (start, end) ranges to be fetched, in the
+                timezone of start.
+        """
+        now = time.time()
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        records: List[Dict] = []
+        gaps: List[List[float]] = []
+
+        with self._locked():
+            index = self._read_index()
+            buckets = index.get(resource_id, {})
+            for bucket_start in self._buckets(start_ts, end_ts):
+                bucket_end = bucket_start + self.bucket.total_seconds()
+                entry = buckets.get(self._name(bucket_start))
+                if (entry is not None and refresh_trailing
+                        and entry["covered_until"] < bucket_end):
+                    entry = None
+
+                gap_start = bucket_start
+                if entry is not None:
+                    records += self._read_bucket(resource_id, bucket_start)
+                    entry["used"] = now
+                    if entry["covered_until"] >= min(bucket_end, end_ts, now):
+                        continue
+                    gap_start = entry["covered_until"]
+                # Timestamps of the queries have a resolution of seconds.
+                gap_end = min(bucket_end, math.floor(now))
+                if gap_start >= gap_end:
+                    continue
+                if len(gaps) > 0 and gaps[-1][1] == gap_start:
+                    gaps[-1][1] = gap_end
+                else:
+                    gaps.append([gap_start, gap_end])
+            if len(buckets) > 0:
+                self._write_index(index)
+
+        tz = start.tzinfo
+        return (
+            self.clip(records, start, end),
+            [(datetime.fromtimestamp(gap_start, tz), datetime.fromtimestamp(gap_end, tz))
+             for gap_start, gap_end in gaps],
+        )
+
+    def store(self, resource_id: str, gaps: List[TimeRange],
+              records: List[Dict], fetched_at: float = None) -> None:
+        """Method to store the records fetched for the gaps of a lookup.
+            Nothing is stored when a record has no time.
+
+        Args:
+            resource_id (String): Id of the resource.
+            gaps (List[Tuple]): The ranges which were fetched.
+            records (List[Dict]): Every record fetched for the gaps.
+            fetched_at (Float): Unix time the fetch started, the gaps are
+                covered up to it at most.
+        """
+        if fetched_at is None:
+            fetched_at = time.time()
+        bucket_seconds = self.bucket.total_seconds()
+
+        by_bucket: Dict[float, List[Dict]] = {}
+        for record in records:
+            timestamp = self._timestamp(record)
+            if timestamp is None:
+                return None
+            bucket_start = math.floor(timestamp / bucket_seconds) * bucket_seconds
+            by_bucket.setdefault(bucket_start, []).append(record)
+
+        with self._locked():
+            index = self._read_index()
+            buckets = index.setdefault(resource_id, {})
+            for gap_start, gap_end in gaps:
+                gap_start, gap_end = gap_start.timestamp(), gap_end.timestamp()
+                for bucket_start in self._buckets(gap_start, gap_end):
+                    bucket_end = bucket_start + bucket_seconds
+                    name = self._name(bucket_start)
+                    entry = buckets.get(name)
+                    bucket_records = [
+                        record for record in by_bucket.get(bucket_start, [])
+                        if gap_start <= self._timestamp(record) < gap_end
+                    ]
+                    # A gap starting inside a bucket continues its records.
+                    append = gap_start > bucket_start
+                    if append and entry is None:
+                        # Evicted meanwhile, its start is not covered.
+                        continue
+                    size = self._write_bucket(resource_id, bucket_start,
+                                              bucket_records, append)
+                    buckets[name] = {
+                        "covered_until": min(bucket_end, gap_end, fetched_at),
+                        "bytes": size,
+                        "used": time.time(),
+                    }
+            self._evict(index)
+            self._write_index(index)
+        return None
+
+    def clip(self, records: List[Dict], start: datetime,
+             end: datetime) -> List[Dict]:
+        """Method to keep the records within a time range.
+
+        Args:
+            records (List[Dict]): Records to be filtered.
+            start (datetime): Start of the range, inclusive.
+            end (datetime): End of the range, exclusive.
+        Returns:
+            records (List[Dict]): The records within the range.
+        """
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        clipped = []
+        for record in records:
+            timestamp = self._timestamp(record)
+            if timestamp is None or start_ts <= timestamp < end_ts:
+                clipped.append(record)
+        return clipped
+
+    def clear(self) -> None:
+        """Method to remove every cached bucket.
+        """
+        with self._locked():
+            for name in os.listdir(self.path):
+                if name.endswith(".lock"):
+                    continue
+                full_path = os.path.join(self.path, name)
+                if os.path.isdir(full_path):
+                    shutil.rmtree(full_path)
+                else:
+                    os.remove(full_path)
+        return None
+
+    def _timestamp(self, record: Dict) -> float:
+        value = record.get(self.time_key)
+        if not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def _buckets(self, start_ts: float, end_ts: float) -> Iterator[float]:
+        bucket_seconds = self.bucket.total_seconds()
+        bucket_start = math.floor(start_ts / bucket_seconds) * bucket_seconds
+        while bucket_start < end_ts:
+            yield bucket_start
+            bucket_start += bucket_seconds
+
+    @staticmethod
+    def _name(bucket_start: float) -> str:
+        return str(int(bucket_start))
+
+    def _bucket_path(self, resource_id: str, bucket_start: float) -> str:
+        directory = hashlib.sha1(resource_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, directory,
+                            self._name(bucket_start) + ".json")
+
+    def _read_bucket(self, resource_id: str, bucket_start: float) -> List[Dict]:
+        try:
+            with open(self._bucket_path(resource_id, bucket_start)) as f:
+                return [self._codec.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _write_bucket(self, resource_id: str, bucket_start: float,
+                      records: List[Dict], append: bool) -> int:
+        bucket_path = self._bucket_path(resource_id, bucket_start)
+        os.makedirs(os.path.dirname(bucket_path), exist_ok=True)
+        lines = "".join(self._codec.dumps(record) + "\n" for record in records)
+        if append:
+            with open(bucket_path, "a") as f:
+                f.write(lines)
+        else:
+            self._replace(bucket_path, lines)
+        return os.path.getsize(bucket_path)
+
+    def _read_index(self) -> Dict[str, Dict]:
+        try:
+            with open(os.path.join(self.path, "index.json")) as f:
+                return self._codec.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_index(self, index: Dict[str, Dict]) -> None:
+        self._replace(os.path.join(self.path, "index.json"),
+                      self._codec.dumps(index))
+
+    def _replace(self, path: str, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _evict(self, index: Dict[str, Dict]) -> None:
+        # Least recently used buckets go first.
+        entries = sorted(
+            ((entry["used"], resource_id, name)
+             for resource_id, buckets in index.items()
+             for name, entry in buckets.items()),
+        )
+        total = sum(index[resource_id][name]["bytes"]
+                    for _, resource_id, name in entries)
+        for _, resource_id, name in entries:
+            if total <= self.max_bytes:
+                break
+            entry = index[resource_id].pop(name)
+            total -= entry["bytes"]
+            bucket_path = self._bucket_path(resource_id, float(name))
+            if os.path.exists(bucket_path):
+                os.remove(bucket_path)
+            if len(index[resource_id]) == 0:
+                del index[resource_id]
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        # Threads and processes sharing the directory take turns.
+        os.makedirs(self.path, exist_ok=True)
+        with self._lock:
+            fd = os.open(os.path.join(self.path, "index.lock"),
+                         os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
@@ -7,8 +7,15 @@ from iudx.rs.ResourceServer import ResourceServer
 from iudx.rs.ResourceQuery import ResourceQuery
 from iudx.rs.ResourceResult import ResourceResult
 from iudx.auth.Token import Token
+from iudx.common.Transport import Transport
+from iudx.common.Executor import Executor
+from iudx.common.RetryPolicy import RetryPolicy
+from iudx.common.CircuitBreaker import CircuitBreaker
+from iudx.common.RateLimiter import RateLimiter
+from iudx.common.ConcurrencyController import ConcurrencyController
+from iudx.common.JSONCodec import JSONCodec
 
-from typing import  List, Dict
+from typing import  List, Dict, Union
 
 # Creating a child class for existing ResourceServer class
 
@@ -17,11 +24,19 @@ class EncryptedResourceServer(ResourceServer):
     # __init__ function for the class
     
     def __init__(self, rs_url: str=None, token: str=None, token_obj: Token=None,
-                 headers: Dict[str, str]=None, publickey: str=None):
+                 headers: Dict[str, str]=None, publickey: str=None,
+                 transport: Transport=None,
+                 executor: Union[str, Executor]="thread", workers: int=None,
+                 retry_policy: RetryPolicy=None,
+                 circuit_breaker: CircuitBreaker=None,
+                 rate_limiter: RateLimiter=None,
+                 concurrency: ConcurrencyController=None):
         
         # overriding the __init__ function of the parent class
         
-        super().__init__(rs_url, token, token_obj, headers)
+        super().__init__(rs_url, token, token_obj, headers, transport,
+                         executor, workers, retry_policy, circuit_breaker,
+                         rate_limiter, concurrency)
 
         ##### KEY GENERATION CODE BLOCK #####
 
@@ -49,6 +64,8 @@ class EncryptedResourceServer(ResourceServer):
         # Get the encrypted results
 
         ers_results = super().get_latest(queries)
+        if len(ers_results) == 0 or not ers_results[0].is_success():
+            return ers_results
 
         # Decrypt the results   
         encrypted_data = ers_results[0].results
@@ -63,7 +80,7 @@ class EncryptedResourceServer(ResourceServer):
         bytes_decrypted_data = unseal_box.decrypt(bytes_encrypted_data)
 
         # Decode to JSON format
-        decrypted_data = json.loads(bytes_decrypted_data.decode('utf-8'))
+        decrypted_data = JSONCodec.get_default().loads(bytes_decrypted_data)
 
         ers_results[0].results = decrypted_data
 
@@ -74,6 +91,8 @@ class EncryptedResourceServer(ResourceServer):
         # Get the encrypted results
 
         ers_results = super().get_data(queries)
+        if len(ers_results) == 0 or not ers_results[0].is_success():
+            return ers_results
 
         # Decrypt the results
         encrypted_data = ers_results[0].results
@@ -88,7 +107,7 @@ class EncryptedResourceServer(ResourceServer):
         bytes_decrypted_data = unseal_box.decrypt(bytes_encrypted_data)
 
         # Decode to JSON format
-        decrypted_data = json.loads(bytes_decrypted_data.decode('utf-8'))
+        decrypted_data = JSONCodec.get_default().loads(bytes_decrypted_data)
 
         ers_results[0].results = decrypted_data
 
@@ -0,0 +1,161 @@
+"""Module doc string. Leave empty for now.
+
+AsyncResourceServer.py
+"""
+import asyncio
+from typing import TypeVar, List, Dict
+
+from iudx.common.AsyncHTTPEntity import AsyncHTTPEntity
+from iudx.common.HTTPResponse import HTTPResponse
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.ResourceResult import ResourceResult
+
+from iudx.auth.Token import Token
+
+
+AsyncResourceServer = TypeVar('T')
+
+
+class AsyncResourceServer():
+    """Asyncio counterpart of ResourceServer. All queries of a call are
+       sent concurrently from a single event loop, bounded by the
+       in-flight limit of the AsyncHTTPEntity.
+    """
+
+    def __init__(self, rs_url: str=None, token: str=None, token_obj: Token=None,
+                 headers: Dict[str, str]=None, max_in_flight: int=64,
+                 http_entity: AsyncHTTPEntity=None):
+        """AsyncResourceServer base class constructor
+
+        Args:
+            rs_url (String): Resource server url.
+            token (String): Access token for the resources.
+            token_obj (Token): Token object to request the access token.
+            headers (Dict): Headers passed with the API Request.
+            max_in_flight (Integer): Maximum concurrent requests.
+            http_entity (AsyncHTTPEntity): Shared async transport.
+        """
+        self.url: str = rs_url
+        self.token: str = token
+        self.token_obj: Token = token_obj
+        if (headers is not None):
+            self.headers: Dict[str, str] = headers
+        else:
+            self.headers = {}
+        if http_entity is None:
+            http_entity = AsyncHTTPEntity(max_in_flight=max_in_flight)
+        self.http_entity: AsyncHTTPEntity = http_entity
+
+        if self.token is not None:
+            self.headers["token"] = self.token
+        return
+
+    parse_response = ResourceServer.parse_response
+    _parse_one = ResourceServer._parse_one
+
+    def _to_results(self, responses: List, queries: List[ResourceQuery]) -> List[ResourceResult]:
+        # One result per query, requests which raised keep their error.
+        rs_results = []
+        for query, response in zip(queries, responses):
+            if isinstance(response, Exception):
+                rs_results.append(self._parse_one(None, query, response))
+            else:
+                rs_results.append(self._parse_one(response, query))
+        return rs_results
+
+    async def _get_headers(self, query: ResourceQuery) -> Dict[str, str]:
+        # The access token is requested on first use, off the event loop.
+        if self.token is None and self.token_obj is not None:
+            loop = asyncio.get_running_loop()
+            self.token = await loop.run_in_executor(
+                None, self.token_obj.request_token)
+            self.headers["token"] = self.token
+
+        if len(query.get_headers()) > 0:
+            return dict(query.get_headers())
+        return dict(self.headers)
+
+    async def get_data(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
+        """Method to post the request for geo, temporal, property, add filters
+            and make complex query.
+
+        Args:
+            queries (List[ResourceQuery]): A list of query objects of
+            ResourceQuery class.
+        Returns:
+            rs_results (List[ResourceResult]): returns a list of
+                ResourceResult object.
+        """
+        url = self.url + "/temporal/entityOperations/query"
+
+        requests = []
+        for query in queries:
+            offset, limit = query.get_offset_limit()
+            new_url = url
+            if offset is not None and limit is not None:
+                new_url = url + "?offset=" + str(offset) + "&limit=" + str(limit)
+            headers = await self._get_headers(query)
+            requests.append(
+                self.http_entity.post(new_url, query.get_query(), headers))
+
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        return self._to_results(responses, queries)
+
+    async def get_data_using_get(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
+        """Get data using HTTP Get
+
+        Args:
+            queries (List[ResourceQuery]): A list of query objects of
+            ResourceQuery class.
+        Returns:
+            rs_results (List[ResourceResult]): returns a list of
+                ResourceResult object.
+        """
+        url = self.url + "/entities"
+
+        requests = []
+        for query in queries:
+            offset, limit = query.get_offset_limit()
+            new_url = url + query.get_query_for_get()
+            if offset is not None and limit is not None:
+                new_url = new_url + "&offset=" + str(offset) + "&limit=" + str(limit)
+            headers = await self._get_headers(query)
+            requests.append(self.http_entity.get(new_url, headers))
+
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        return self._to_results(responses, queries)
+
+    async def get_latest(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
+        """Method to get the request for latest resource data.
+
+        Args:
+            queries (List[ResourceQuery]): A list of query objects of
+            ResourceQuery class.
+        Returns:
+            rs_results (List[ResourceResult]): returns a list of
+                ResourceResult object.
+        """
+        base_url = self.url + "/entities"
+
+        requests = []
+        for query in queries:
+            url = base_url + query.latest_search()
+            headers = await self._get_headers(query)
+            requests.append(self.http_entity.get(url, headers))
+
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        return self._to_results(responses, queries)
+
+    async def close(self) -> None:
+        """Method to close the connections of the async transport.
+        """
+        await self.http_entity.close()
+        return None
+
+    async def __aenter__(self) -> AsyncResourceServer:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
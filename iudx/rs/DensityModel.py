@@ -0,0 +1,156 @@
+"""Module doc string. Leave empty for now.
+
+DensityModel.py
+"""
+import os
+import tempfile
+import threading
+import time
+from typing import TypeVar, Dict
+
+from iudx.common.JSONCodec import JSONCodec
+from iudx.rs.ResourceQuery import ResourceQuery
+
+
+DensityModel = TypeVar('T')
+
+
+class DensityModel():
+    """Records per hour observed for each resource, kept in a local JSON
+       store so that later searches can size their slices without count
+       queries. Estimates older than the TTL are ignored.
+    """
+
+    _default: DensityModel = None
+
+    def __init__(self: DensityModel, path: str = "~/.iudx/density.json",
+                 ttl: float = 7 * 24 * 3600, smoothing: float = 0.5):
+        """DensityModel base class constructor
+
+        Args:
+            path (String): JSON file of the store, in memory only when None.
+            ttl (Float): Seconds an estimate stays usable.
+            smoothing (Float): Weight of a new observation against the
+                previous estimate.
+        """
+        self.path = os.path.expanduser(path) if path is not None else None
+        self.ttl = ttl
+        self.smoothing = smoothing
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._rates: Dict[str, Dict] = self._read()
+        return
+
+    @classmethod
+    def get_default(cls) -> DensityModel:
+        """Method to return the model shared by the entities.
+
+        Returns:
+            density_model (DensityModel): The default DensityModel object.
+        """
+        if cls._default is None:
+            cls._default = DensityModel()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, density_model: DensityModel) -> None:
+        """Method to replace the model shared by the entities.
+
+        Args:
+            density_model (DensityModel): The new default model.
+        """
+        cls._default = density_model
+        return None
+
+    @staticmethod
+    def key(query: ResourceQuery) -> str:
+        """Method to return the store key of a query, None when its
+            density does not depend on the resource alone.
+        """
+        if len(query._entities) != 1:
+            return None
+        if query._geoproperty is not None or query._key is not None:
+            return None
+        return query._entities[0]
+
+    @staticmethod
+    def hours(query: ResourceQuery) -> float:
+        """Method to return the duration of a temporal query in hours.
+        """
+        if query._start_time is None or query._end_time is None:
+            return None
+        seconds = (query._end_time_datetime - query._start_time_datetime).total_seconds()
+        return max(seconds, 1.0) / 3600
+
+    def estimate(self, query: ResourceQuery) -> float:
+        """Method to estimate the records matched by a query.
+
+        Args:
+            query (ResourceQuery): Temporal query.
+        Returns:
+            records (Float): Estimated records, None when no fresh
+                estimate exists.
+        """
+        key = self.key(query)
+        hours = self.hours(query)
+        if key is None or hours is None:
+            return None
+        with self._lock:
+            entry = self._rates.get(key)
+        if entry is None or time.time() - entry["updated"] > self.ttl:
+            return None
+        return entry["rate"] * hours
+
+    def observe(self, query: ResourceQuery, records: int) -> None:
+        """Method to learn from the records counted or fetched for a query.
+
+        Args:
+            query (ResourceQuery): Temporal query.
+            records (Integer): Records matched by the query.
+        """
+        key = self.key(query)
+        hours = self.hours(query)
+        if key is None or hours is None:
+            return None
+        rate = records / hours
+        now = time.time()
+        with self._lock:
+            entry = self._rates.get(key)
+            if entry is not None and now - entry["updated"] <= self.ttl:
+                rate = self.smoothing * rate + (1 - self.smoothing) * entry["rate"]
+            self._rates[key] = {"rate": rate, "updated": now}
+            self._dirty = True
+        return None
+
+    def _read(self) -> Dict[str, Dict]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return JSONCodec.get_default().load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Method to write the observations to the store. Entries written
+            meanwhile by other processes are kept when they are newer.
+        """
+        if self.path is None:
+            return None
+        with self._lock:
+            if not self._dirty:
+                return None
+            rates = self._read()
+            for key, entry in self._rates.items():
+                if key not in rates or rates[key]["updated"] < entry["updated"]:
+                    rates[key] = entry
+            self._rates = rates
+            self._dirty = False
+
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                JSONCodec.get_default().dump(rates, f)
+            os.replace(tmp_path, self.path)
+        return None
@@ -0,0 +1,235 @@
+"""Module doc string. Leave empty for now.
+
+QueryPlanner.py
+"""
+import math
+from datetime import timedelta
+from typing import TypeVar, Generator, List, Tuple
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.ResourceResult import ResourceResult
+from iudx.rs.DensityModel import DensityModel
+
+
+QueryPlanner = TypeVar('T')
+
+
+class QueryPlanner():
+    """Splits temporal queries into slices small enough to be fetched in
+       one page. The slices of a level are counted concurrently and each
+       overflowing slice is split in proportion to its count, so planning
+       takes about one round trip per level instead of one per slice.
+       With a DensityModel, resources with a fresh estimate are sliced
+       without counting at all. Planning with an AsyncResourceServer
+       counts on the event loop, see plan_async.
+    """
+
+    def __init__(self: QueryPlanner, rs: ResourceServer,
+                 max_records: int = 5000, fill_ratio: float = 0.8,
+                 min_slice: timedelta = timedelta(seconds=1),
+                 time_format: str = "%Y-%m-%dT%H:%M:%S+05:30",
+                 density_model: DensityModel = None):
+        """QueryPlanner base class constructor
+
+        Args:
+            rs (ResourceServer): Resource server the counts are sent to,
+                an AsyncResourceServer for plan_async.
+            max_records (Integer): Maximum records of a slice.
+            fill_ratio (Float): Target share of max_records for new slices,
+                leaves headroom for uneven data.
+            min_slice (timedelta): Slices are not split below this duration.
+            time_format (String): Format of the slice timestamps.
+            density_model (DensityModel): Records per hour learnt from
+                earlier counts and fetches, counts only when None.
+        """
+        self.rs = rs
+        self.max_records = max_records
+        self.fill_ratio = fill_ratio
+        self.min_slice = min_slice
+        self.time_format = time_format
+        self.density_model = density_model
+        self.failed_results: List[ResourceResult] = []
+        return
+
+    def count(self, queries: List[ResourceQuery]) -> List[int]:
+        """Method to count the records of the queries concurrently.
+
+        Args:
+            queries (List[ResourceQuery]): Queries to be counted.
+        Returns:
+            counts (List[Integer]): Records matched by each query, None
+                when its count failed. The failed results are kept in
+                'failed_results' with the counted query.
+        """
+        count_queries = [query.copy().count() for query in queries]
+        return self._counts(queries, self.rs.get_data(count_queries))
+
+    async def count_async(self, queries: List[ResourceQuery]) -> List[int]:
+        """Method to count the records of the queries concurrently with an
+            AsyncResourceServer, see count.
+        """
+        count_queries = [query.copy().count() for query in queries]
+        return self._counts(queries, await self.rs.get_data(count_queries))
+
+    def _counts(self, queries: List[ResourceQuery],
+                rs_results: List[ResourceResult]) -> List[int]:
+        counts = []
+        for query, rs_result in zip(queries, rs_results):
+            if not rs_result.is_success():
+                rs_result.query = query
+                self.failed_results.append(rs_result)
+                counts.append(None)
+                continue
+            counts.append(rs_result.results[0]["totalHits"])
+        return counts
+
+    def take_failed(self) -> List[ResourceResult]:
+        """Method to return the failed counts and forget them.
+
+        Returns:
+            rs_results (List[ResourceResult]): Failed counts since the last
+                call, their queries are left out of the plans.
+        """
+        failed, self.failed_results = self.failed_results, []
+        return failed
+
+    def can_split(self, query: ResourceQuery) -> bool:
+        """Method to check whether a query has a time range to split.
+        """
+        if query._start_time is None or query._end_time is None:
+            return False
+        duration = query._end_time_datetime - query._start_time_datetime
+        return duration >= 2 * self.min_slice
+
+    def split(self, query: ResourceQuery, total: int) -> List[ResourceQuery]:
+        """Method to split a query into slices of equal duration, as many
+            as its count needs at the target fill.
+
+        Args:
+            query (ResourceQuery): Temporal query to be split.
+            total (Integer): Records matched by the query.
+        Returns:
+            slices (List[ResourceQuery]): Consecutive slices of the query.
+        """
+        start = query._start_time_datetime
+        end = query._end_time_datetime
+        parts = max(2, math.ceil(total / (self.max_records * self.fill_ratio)))
+
+        # Timestamps have a resolution of seconds.
+        seconds = math.ceil((end - start).total_seconds() / parts)
+        step = max(timedelta(seconds=seconds), self.min_slice)
+
+        slices = []
+        slice_start = start
+        while slice_start < end:
+            slice_end = min(slice_start + step, end)
+            piece = query.copy()
+            piece.during_search(
+                start_time=slice_start.strftime(self.time_format),
+                end_time=slice_end.strftime(self.time_format),
+                )
+            slices.append(piece)
+            slice_start = slice_end
+        return slices
+
+    def plan(self, queries: List[ResourceQuery],
+             use_model: bool = True) -> List[ResourceQuery]:
+        """Method to split the queries until every slice fits a page.
+
+        Args:
+            queries (List[ResourceQuery]): Temporal queries to be planned.
+            use_model (Boolean): Size slices from the density model where
+                it has a fresh estimate, instead of counting them.
+        Returns:
+            slices (List[ResourceQuery]): Slices to be fetched, in the
+                order of the queries and of time. Queries whose count
+                failed are skipped, see take_failed.
+        """
+        levels = self._levels(queries, use_model)
+        try:
+            level = next(levels)
+            while True:
+                level = levels.send(self.count(level))
+        except StopIteration as stop:
+            return stop.value
+
+    async def plan_async(self, queries: List[ResourceQuery],
+                         use_model: bool = True) -> List[ResourceQuery]:
+        """Method to plan the queries like plan, counting each level with
+            an AsyncResourceServer.
+        """
+        levels = self._levels(queries, use_model)
+        try:
+            level = next(levels)
+            while True:
+                level = levels.send(await self.count_async(level))
+        except StopIteration as stop:
+            return stop.value
+
+    def _levels(self, queries: List[ResourceQuery], use_model: bool
+                ) -> Generator[List[ResourceQuery], List[int], List[ResourceQuery]]:
+        """Plan the queries level by level, yielding the queries of each
+            level to be counted and receiving their counts.
+        """
+        planned: List[Tuple[Tuple, ResourceQuery]] = []
+        level = []
+        for i, query in enumerate(queries):
+            estimate = None
+            if use_model and self.density_model is not None:
+                estimate = self.density_model.estimate(query)
+            if estimate is None:
+                level.append(((i,), query))
+            elif estimate <= self.max_records * self.fill_ratio or not self.can_split(query):
+                planned.append(((i,), query))
+            else:
+                for j, piece in enumerate(self.split(query, estimate)):
+                    planned.append(((i, j), piece))
+
+        while len(level) > 0:
+            counts = yield [query for _, query in level]
+            next_level = []
+            for (key, query), total in zip(level, counts):
+                if total is None:
+                    continue
+                self.observe(query, total)
+                if total <= self.max_records or not self.can_split(query):
+                    planned.append((key, query))
+                    continue
+                for i, piece in enumerate(self.split(query, total)):
+                    next_level.append((key + (i,), piece))
+            level = next_level
+
+        self.save()
+        planned.sort(key=lambda item: item[0])
+        return [query for _, query in planned]
+
+    def observe(self, query: ResourceQuery, records: int) -> None:
+        """Method to feed the records of a query to the density model.
+        """
+        if self.density_model is not None:
+            self.density_model.observe(query, records)
+        return None
+
+    def save(self) -> None:
+        """Method to persist the density model.
+        """
+        if self.density_model is not None:
+            self.density_model.save()
+        return None
+
+    def overflowed(self, rs_result: ResourceResult) -> bool:
+        """Method to check whether a fetched slice matched more records
+            than a page returns, so it has to be planned again.
+
+        Args:
+            rs_result (ResourceResult): Result of a planned slice.
+        Returns:
+            overflowed (Boolean): True when records are missing.
+        """
+        if not rs_result.is_success() or rs_result.query is None:
+            return False
+        offset, limit = rs_result.query.get_offset_limit()
+        if offset is not None or limit is not None:
+            return False
+        return rs_result.totalHits > len(rs_result.results)
@@ -4,9 +4,12 @@ ResourceQuery.py
 """
 
 from typing import TypeVar, Generic, Any, List, Dict
+import copy
 import json
 from datetime import date, datetime, timedelta
 
+from iudx.common.JSONCodec import JSONCodec
+
 ResourceQuery = TypeVar('T')
 str_or_float = TypeVar('str_or_float', str, float)
 
@@ -40,6 +43,20 @@ class ResourceQuery():
         self.time_format = "%Y-%m-%dT%H:%M:%S%z"
         return
 
+    def copy(self) -> ResourceQuery:
+        """Method to return an independent copy of the query, cheaper
+            than copy.deepcopy.
+
+        Returns:
+            query (ResourceQuery): The copied query.
+        """
+        query = copy.copy(self)
+        query._headers = dict(self._headers)
+        query._entities = list(self._entities)
+        if self._filters is not None:
+            query._filters = list(self._filters)
+        return query
+
     def set_header(self, key, value):
         self._headers[key] = value
 
@@ -243,4 +260,4 @@ class ResourceQuery():
         else:
             raise RuntimeError("Minimum one entity is requred.")
 
-        return json.dumps(opts)
+        return JSONCodec.get_default().dumps(opts)
@@ -5,6 +5,7 @@ ResourceResult.py
 from typing import TypeVar, Generic, Any, List, Dict
 
 ResourceResult = TypeVar('T')
+ResourceQuery = TypeVar('T')
 
 
 class ResourceResult():
@@ -21,4 +22,17 @@ class ResourceResult():
         self.offset: int = 0
         self.limit: int = 0
         self.totalHits : int = 0
+        self.query: ResourceQuery = None
+        self.status: int = None
+        self.latency: float = None
+        self.bytes: int = 0
+        self.error: str = None
         return
+
+    def is_success(self) -> bool:
+        """Method to check whether the query returned its data.
+
+        Returns:
+            success (Boolean): True for a 200 response.
+        """
+        return self.error is None and self.status == 200
@@ -3,18 +3,25 @@
 ResourceServer.py
 """
 import json
+import queue
 from datetime import datetime, timedelta
-from typing import TypeVar, Generic, Any, List, Dict
+from typing import TypeVar, Generic, Any, Callable, Iterator, List, Dict, Tuple, Union
 
 from iudx.common.HTTPEntity import HTTPEntity
 from iudx.common.HTTPResponse import HTTPResponse
+from iudx.common.Transport import Transport
+from iudx.common.Executor import Executor
+from iudx.common.RetryPolicy import RetryPolicy
+from iudx.common.CircuitBreaker import CircuitBreaker
+from iudx.common.RateLimiter import RateLimiter
+from iudx.common.ConcurrencyController import ConcurrencyController
 
 from iudx.rs.ResourceQuery import ResourceQuery
 from iudx.rs.ResourceResult import ResourceResult
 
 from iudx.auth.Token import Token
 
-import multiprocessing
+ResourceServer = TypeVar('T')
 
 
 class ResourceServer():
@@ -23,8 +30,30 @@ class ResourceServer():
     """
 
     def __init__(self, rs_url: str=None, token: str=None, token_obj: Token=None,
-                 headers: Dict[str, str]=None):
+                 headers: Dict[str, str]=None, transport: Transport=None,
+                 executor: Union[str, Executor]="thread", workers: int=None,
+                 retry_policy: RetryPolicy=None,
+                 circuit_breaker: CircuitBreaker=None,
+                 rate_limiter: RateLimiter=None,
+                 concurrency: ConcurrencyController=None):
         """ResourceServer base class constructor
+
+        Args:
+            rs_url (String): Resource server url.
+            token (String): Access token for the resources.
+            token_obj (Token): Token object to request the access token.
+            headers (Dict): Headers passed with the API Request.
+            transport (Transport): Connection pool shared with other clients.
+            executor (String/Executor): 'thread', 'process', 'inline' or an
+                Executor object used to fan out the queries.
+            workers (Integer): Number of workers of the shared executor.
+            retry_policy (RetryPolicy): Retries of failed requests, each
+                query of a batch is retried on its own.
+            circuit_breaker (CircuitBreaker): Per-host circuit breaker.
+            rate_limiter (RateLimiter): Client side rate limits, enforced
+                across the threads and processes of the executor.
+            concurrency (ConcurrencyController): Adaptive limit on the
+                queries in flight, grows up to the executor workers.
         """
         # Request access token
         if token is None and token_obj is not None:
@@ -36,12 +65,114 @@ class ResourceServer():
             self.headers: Dict[str, str] = headers
         else:
             self.headers = {}
-        self.pool = multiprocessing.Pool(processes=multiprocessing.cpu_count())
+        self.transport: Transport = transport
+        self.retry_policy: RetryPolicy = retry_policy
+        self.circuit_breaker: CircuitBreaker = circuit_breaker
+        self.rate_limiter: RateLimiter = rate_limiter
+        if not isinstance(executor, Executor):
+            executor = Executor.shared(kind=executor, workers=workers)
+        self.executor: Executor = executor.acquire()
+        if concurrency is None:
+            concurrency = ConcurrencyController(max_limit=self.executor.workers)
+        self.concurrency: ConcurrencyController = concurrency
+        self._closed = False
 
         if self.token is not None:
             self.headers["token"] = self.token
         return
 
+    @property
+    def pool(self) -> Executor:
+        return self.executor
+
+    def close(self) -> None:
+        """Method to release the executor used by the resource server.
+        """
+        if not self._closed:
+            self._closed = True
+            self.executor.release()
+        return None
+
+    def __enter__(self) -> ResourceServer:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _http_entity(self) -> HTTPEntity:
+        return HTTPEntity(
+            transport=self.transport,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            rate_limiter=self.rate_limiter,
+            )
+
+    def _iter_dispatch(self, fn: Callable, args_list: List[Tuple],
+                       ordered: bool = False,
+                       buffer_size: int = None) -> Iterator[Tuple]:
+        """Run the requests on the executor, keeping as many in flight as
+            the concurrency controller allows, and yield (index, response,
+            error) as they complete. At most buffer_size requests are run ahead
+            of the consumer, in ordered mode this bounds the reorder buffer.
+        """
+        total = len(args_list)
+        window = total if buffer_size is None else max(1, buffer_size)
+        done = queue.Queue()
+
+        def on_response(index: int, response: HTTPResponse) -> None:
+            self.concurrency.release(
+                latency=response.get_elapsed(),
+                status=response.get_status_code()
+                )
+            done.put((index, response, None))
+
+        def on_error(index: int, error: BaseException) -> None:
+            self.concurrency.release(error=True)
+            done.put((index, None, error))
+
+        submitted = 0
+        yielded = 0
+        next_index = 0
+        reorder: Dict[int, Tuple] = {}
+        while yielded < total:
+            while submitted < total and submitted - yielded < window:
+                self.concurrency.acquire()
+                self.executor.apply_async(
+                    fn, args_list[submitted],
+                    callback=lambda response, i=submitted: on_response(i, response),
+                    error_callback=lambda error, i=submitted: on_error(i, error),
+                    )
+                submitted += 1
+
+            completed = [done.get()]
+            if ordered:
+                index, response, error = completed.pop()
+                reorder[index] = (index, response, error)
+                while next_index in reorder:
+                    completed.append(reorder.pop(next_index))
+                    next_index += 1
+
+            for item in completed:
+                yielded += 1
+                yield item
+
+    def _iter_results(self, fn: Callable, args_list: List[Tuple],
+                      queries: List[ResourceQuery], ordered: bool = False,
+                      buffer_size: int = None) -> Iterator[ResourceResult]:
+        """Dispatch the requests and yield one ResourceResult per query.
+        """
+        for index, response, error in self._iter_dispatch(
+                fn, args_list, ordered=ordered, buffer_size=buffer_size):
+            yield self._parse_one(response, queries[index], error)
+
+    def get_concurrency_stats(self) -> Dict:
+        """Method to return the adaptive concurrency and latency stats.
+
+        Returns:
+            stats (Dict): See ConcurrencyController.get_stats.
+        """
+        return self.concurrency.get_stats()
+
     def status(self) -> bool:
         """Pydoc heading.
 
@@ -52,80 +183,225 @@ class ResourceServer():
         """
         return False
 
-    def parse_response(self, responses: List[HTTPResponse]) -> List[ResourceResult]:
+    def parse_response(self, responses: List[HTTPResponse],
+                       queries: List[ResourceQuery] = None) -> List[ResourceResult]:
         """Parse responses
 
        Args:
            responses (argument-type): response fetched for the query
+           queries (List[ResourceQuery]): queries of the responses, in order
        Returns:
-           parsed response
+           parsed response, one ResourceResult for every response
        """
         rs_results = []
-        for response in responses:
-            rs_result = ResourceResult()
-            if response.get_status_code() == 401:
-                raise RuntimeError("Not Authorized: Invalid Credentials")
-
-            elif response.get_status_code() == 200:
-                result_data = response.get_json()
-                rs_result.type = result_data["type"]
-                rs_result.title = result_data["title"]
-                rs_result.results = result_data["results"]
-                if ("offset" in result_data.keys()):
-                    rs_result.offset = result_data["offset"]
-                if ("limit" in result_data.keys()):
-                    rs_result.limit = result_data["limit"]
-                if ("totalHits" in result_data.keys()):
-                    rs_result.totalHits = result_data["totalHits"]
-                rs_results.append(rs_result)
+        for i, response in enumerate(responses):
+            query = queries[i] if queries is not None else None
+            rs_results.append(self._parse_one(response, query))
 
         return rs_results
 
-    def get_data_using_get(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
-        """ Get data using HTTP Get 
+    def _parse_one(self, response: HTTPResponse, query: ResourceQuery = None,
+                   error: BaseException = None) -> ResourceResult:
+        """Parse a single response. Failed queries keep their status and
+            error, and have no results.
+        """
+        rs_result = ResourceResult()
+        rs_result.query = query
+        rs_result.results = []
+        if error is not None:
+            rs_result.error = f"{type(error).__name__}: {error}"
+            return rs_result
+
+        rs_result.status = response.get_status_code()
+        rs_result.latency = response.get_elapsed()
+        rs_result.bytes = response.get_content_length()
+        try:
+            result_data = response.get_json()
+        except ValueError:
+            result_data = {}
+        if not isinstance(result_data, dict):
+            result_data = {}
+
+        if rs_result.status == 200 and "results" not in result_data:
+            rs_result.error = "Malformed response: no 'results' in the body"
+        elif rs_result.status == 200:
+            rs_result.type = result_data.get("type")
+            rs_result.title = result_data.get("title")
+            rs_result.results = result_data["results"]
+            if ("offset" in result_data.keys()):
+                rs_result.offset = result_data["offset"]
+            if ("limit" in result_data.keys()):
+                rs_result.limit = result_data["limit"]
+            if ("totalHits" in result_data.keys()):
+                rs_result.totalHits = result_data["totalHits"]
+        elif rs_result.status == 401:
+            rs_result.type = result_data.get("type", 401)
+            rs_result.error = "Not Authorized: Invalid Credentials"
+        else:
+            rs_result.type = result_data.get("type", rs_result.status)
+            rs_result.title = result_data.get("title", "")
+            detail = result_data.get("detail", rs_result.title)
+            rs_result.error = f"HTTP {rs_result.status}"
+            if detail:
+                rs_result.error += f": {detail}"
+
+        return rs_result
+
+    def _get_url(self, url: str, query: ResourceQuery) -> str:
+        """Build the GET url of a query, without modifying 'url'.
+        """
+        offset, limit = query.get_offset_limit()
+        new_url = url
+        if (query._is_property_search):
+            new_url = url + query.get_query_for_get()
+        if offset is not None and limit is not None:
+            new_url += "&" if "?" in new_url else "?"
+            new_url += "offset=" + str(offset) + "&limit=" + str(limit)
+        return new_url
+
+    def _iter_pages(self, iter_fn: Callable, queries: List[ResourceQuery],
+                    page_size: int, max_hits: int = None,
+                    parallel: bool = True, buffer_size: int = None
+                    ) -> Iterator[Tuple[int, ResourceResult]]:
+        """Fetch every page of the queries, yielding (index of the query,
+            page). An offset and limit set on a query select the window of
+            records to be fetched. The first pages give the totalHits of
+            the queries, the remaining pages are then fetched at once in
+            the order of the offsets, or page by page following the
+            totalHits of the latest page.
+        """
+        windows = []
+        for query in queries:
+            start, count = query.get_offset_limit()
+            start = start or 0
+            end = None if count is None else start + count
+            if max_hits is not None:
+                end = start + int(max_hits) if end is None else min(end, start + int(max_hits))
+            windows.append((start, end))
+
+        def page(index: int, offset: int) -> ResourceQuery:
+            end = windows[index][1]
+            limit = page_size if end is None else min(page_size, end - offset)
+            return queries[index].copy().set_offset_limit(offset, limit)
+
+        def stop(index: int, rs_result: ResourceResult) -> int:
+            total_hits = int(rs_result.totalHits or 0)
+            end = windows[index][1]
+            return total_hits if end is None else min(total_hits, end)
+
+        def fetch(pages: List[ResourceQuery]) -> Iterator[ResourceResult]:
+            return iter_fn(pages, ordered=True, buffer_size=buffer_size)
+
+        owners = []
+        pages = []
+        first_pages = [page(index, windows[index][0]) for index in range(len(queries))]
+        for index, rs_result in enumerate(fetch(first_pages)):
+            yield index, rs_result
+            if not rs_result.is_success():
+                continue
+            if not parallel:
+                owners.append((index, rs_result))
+                continue
+            for offset in range(windows[index][0] + page_size,
+                                stop(index, rs_result), page_size):
+                owners.append(index)
+                pages.append(page(index, offset))
+
+        if parallel:
+            if len(pages) > 0:
+                yield from zip(owners, fetch(pages))
+            return
+
+        for index, rs_result in owners:
+            offset = windows[index][0] + page_size
+            while offset < stop(index, rs_result):
+                rs_result = next(fetch([page(index, offset)]))
+                yield index, rs_result
+                if not rs_result.is_success():
+                    break
+                offset += page_size
+
+    def iter_data_using_get(self, queries: List[ResourceQuery],
+                            ordered: bool = False, buffer_size: int = None
+                            ) -> Iterator[ResourceResult]:
+        """Method to get the queries like get_data_using_get, yielding each
+            result as soon as its response arrives. Every result carries
+            its source query in 'query'.
 
         Args:
-            queries (List[ResourceQuery]): A list of query objects of 
+            queries (List[ResourceQuery]): A list of query objects of
             ResourceQuery class.
-        Returns:
-            rs_results (List[ResourceResult]): returns a list of 
-                ResourceResult object.
+            ordered (Boolean): Yield the results in the order of the queries.
+            buffer_size (Integer): Maximum queries run ahead of the consumer,
+                unbounded when None.
+        Yields:
+            rs_result (ResourceResult): A ResourceResult object.
         """
         url = self.url + "/entities"
 
-
-        rs_results = []
         zipped_url = []
-        offset = None
-        limit = None
         for query in queries:
-            offset, limit = query.get_offset_limit()
-            new_url = url
-            if (query._is_property_search):
-                url +=  query.get_query_for_get()
-            if offset is not None and limit is not None:
-                new_url = url + "&offset=" + str(offset) + "&limit=" + str(limit)
-            response = HTTPEntity().get(url=new_url, headers=self.headers)
-            rs_results += self.parse_response([response])
-        return rs_results
+            zipped_url.append((self._get_url(url, query),
+                               dict(self.headers, **query.get_headers())))
 
+        yield from self._iter_results(
+            self._http_entity().get, zipped_url, queries,
+            ordered=ordered, buffer_size=buffer_size)
 
-
-
-    def get_data(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
-        """Method to post the request for geo, temporal, property, add filters
-            and make complex query.
+    def get_data_using_get(self, queries: List[ResourceQuery],
+                           page_size: int = None,
+                           max_hits: int = None) -> List[ResourceResult]:
+        """ Get data using HTTP Get. The queries are sent concurrently.
 
         Args:
             queries (List[ResourceQuery]): A list of query objects of 
             ResourceQuery class.
+            page_size (Integer): Fetch every page of the queries,
+                'page_size' records at a time, see fetch_all. Only the
+                first page is fetched when None.
+            max_hits (Integer): Records fetched at most per query when
+                paginating.
         Returns:
-            rs_results (List[ResourceResult]): returns a list of 
-                ResourceResult object.
+            rs_results (List[ResourceResult]): returns a ResourceResult
+                object for every query, the successful pages of a query
+                are merged into its result. Every other failed page follows
+                as its own result, whose query selects that page.
+        """
+        if page_size is None:
+            return list(self.iter_data_using_get(queries, ordered=True))
+
+        rs_results: List[ResourceResult] = [None] * len(queries)
+        failed_pages: List[ResourceResult] = []
+        for index, page in self._iter_pages(
+                self.iter_data_using_get, queries, page_size, max_hits):
+            rs_result = rs_results[index]
+            if rs_result is None:
+                page.query = queries[index]
+                rs_results[index] = page
+            elif not page.is_success():
+                failed_pages.append(page)
+            else:
+                rs_result.results += page.results
+                rs_result.bytes += page.bytes
+        return rs_results + failed_pages
+
+    def iter_data(self, queries: List[ResourceQuery], ordered: bool = False,
+                  buffer_size: int = None) -> Iterator[ResourceResult]:
+        """Method to post the queries like get_data, yielding each result
+            as soon as its response arrives. Every result carries its
+            source query in 'query'.
+
+        Args:
+            queries (List[ResourceQuery]): A list of query objects of
+            ResourceQuery class.
+            ordered (Boolean): Yield the results in the order of the queries.
+            buffer_size (Integer): Maximum queries run ahead of the consumer,
+                unbounded when None.
+        Yields:
+            rs_result (ResourceResult): A ResourceResult object.
         """
         url = self.url + "/temporal/entityOperations/query"
 
-        rs_results = []
         zipped_url = []
         offset = None
         limit = None
@@ -135,18 +411,68 @@ class ResourceServer():
             new_url = url
             if offset is not None and limit is not None:
                 new_url = url + "?offset=" + str(offset) + "&limit=" + str(limit)
-            if (query.get_headers() is not {}):
-                zipped_url.append((new_url, new_query, query.get_headers()))
-            else:
-                zipped_url.append((new_url, new_query, self.headers))
+            zipped_url.append((new_url, new_query,
+                               dict(self.headers, **query.get_headers())))
 
-        responses: List[HTTPResponse] = self.pool.starmap(
-            HTTPEntity().post,
-            zipped_url
-            )
-        rs_results = self.parse_response(responses)
+        yield from self._iter_results(
+            self._http_entity().post, zipped_url, queries,
+            ordered=ordered, buffer_size=buffer_size)
+
+    def get_data(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
+        """Method to post the request for geo, temporal, property, add filters
+            and make complex query.
+
+        Args:
+            queries (List[ResourceQuery]): A list of query objects of 
+            ResourceQuery class.
+        Returns:
+            rs_results (List[ResourceResult]): returns a ResourceResult
+                object for every query, failed ones carry the status and
+                error and have no results.
+        """
+        rs_results = list(self.iter_data(queries, ordered=True))
         return rs_results
 
+    def fetch_all(self, query: ResourceQuery, page_size: int = 5000,
+                  parallel: bool = True, buffer_size: int = 8,
+                  use_get: bool = False,
+                  key: Callable[[Dict], Any] = None) -> Iterator[ResourceResult]:
+        """Method to fetch every page of a query, yielding each page as it
+            arrives. The first page gives the totalHits, the remaining pages
+            are then scheduled at once, or one after the other. An offset
+            and limit set on the query select the window of records to be
+            fetched.
+
+        Args:
+            query (ResourceQuery): A query object of ResourceQuery class.
+            page_size (Integer): Records requested per page.
+            parallel (Boolean): Fetch the remaining pages concurrently,
+                otherwise page by page, following the totalHits of the
+                latest page.
+            buffer_size (Integer): Pages fetched ahead of the consumer.
+            use_get (Boolean): Use the GET endpoint of property searches
+                instead of the POST endpoint.
+            key (Callable): Identity of a record. When given, records of a
+                page which were yielded by the previous page are dropped,
+                as records move across page boundaries when the data
+                changes between the requests.
+        Yields:
+            rs_result (ResourceResult): A page, in the order of the offsets.
+                Failed pages carry their status and error.
+        """
+        iter_fn = self.iter_data_using_get if use_get else self.iter_data
+        previous = set()
+
+        for _, rs_result in self._iter_pages(iter_fn, [query], page_size,
+                                             parallel=parallel,
+                                             buffer_size=buffer_size):
+            if key is not None:
+                keys = [key(record) for record in rs_result.results]
+                rs_result.results = [record for record, record_key
+                                     in zip(rs_result.results, keys)
+                                     if record_key not in previous]
+                previous = set(keys)
+            yield rs_result
 
     def get_latest(self, queries: List[ResourceQuery]) -> List[ResourceResult]:
         """Method to get the request for latest resource data.
@@ -161,27 +487,8 @@ class ResourceServer():
         zipped_url = []
         for query in queries:
             url = base_url + query.latest_search()
-            if (query.get_headers() is not {}):
-                zipped_url.append((url, query.get_headers()))
-            else:
-                zipped_url.append((url, self.headers))
-
-        responses: List[HTTPResponse] = self.pool.starmap(
-            HTTPEntity().get,
-            zipped_url
-            )
-
-        rs_results = []
-        for response in responses:
-            rs_result = ResourceResult()
-            if response.get_status_code() == 401:
-                raise RuntimeError("Not Authorized: Invalid Credentials")
-
-            elif response.get_status_code() == 200:
-                result_data = response.get_json()
-                rs_result.type = result_data["type"]
-                rs_result.title = result_data["title"]
-                rs_result.results = result_data["results"]
-                rs_results.append(rs_result)
+            zipped_url.append((url, dict(self.headers, **query.get_headers())))
 
+        rs_results = list(self._iter_results(
+            self._http_entity().get, zipped_url, queries, ordered=True))
         return rs_results
@@ -5,6 +5,10 @@ setup(
     version='2.0.1',
     packages=find_packages(),
     install_requires=['requests', 'urllib3', 'pandas', 'click', 'tqdm'],
+    extras_require={
+        'async': ['aiohttp'],
+        'fastjson': ['orjson'],
+    },
     entry_points={
         "console_scripts": [
             "iudx=iudx.entity.Entity:Entity.cli",
@@ -0,0 +1,110 @@
+'''
+    This script tests the adaptive concurrency of the ResourceServer fan-out.
+'''
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.ConcurrencyController import ConcurrencyController
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.read_body()
+        with _Handler.lock:
+            _Handler.in_flight += 1
+            _Handler.max_in_flight = max(_Handler.max_in_flight,
+                                         _Handler.in_flight)
+        time.sleep(0.01)
+        with _Handler.lock:
+            _Handler.in_flight -= 1
+        self.send_json(200, {"type": 200, "title": "ok", "results": [{"id": 1}]})
+
+
+class ConcurrencyControllerTest(unittest.TestCase):
+    """Test different scenarios for the ConcurrencyController.
+    """
+    def test_additive_increase(self):
+        """Function to test that healthy responses raise the limit.
+        """
+        controller = ConcurrencyController(initial_limit=2, max_limit=8)
+        for _ in range(40):
+            controller.acquire()
+            controller.release(latency=0.01, status=200)
+        self.assertGreater(controller.get_stats()["limit"], 2)
+        self.assertLessEqual(controller.get_stats()["limit"], 8)
+
+    def test_multiplicative_decrease(self):
+        """Function to test that throttling halves the limit.
+        """
+        controller = ConcurrencyController(initial_limit=8, max_limit=8)
+        controller.acquire()
+        controller.release(latency=0.01, status=429)
+        stats = controller.get_stats()
+        self.assertEqual(stats["limit"], 4)
+        self.assertEqual(stats["failures"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_latency_backoff(self):
+        """Function to test that a rising p95 latency lowers the limit.
+        """
+        controller = ConcurrencyController(initial_limit=8, max_limit=8)
+        for _ in range(20):
+            controller.acquire()
+            controller.release(latency=0.01, status=200)
+        for _ in range(10):
+            controller.acquire()
+            controller.release(latency=1.0, status=200)
+        self.assertLess(controller.get_stats()["limit"], 8)
+
+    def test_latency_recovery(self):
+        """Function to test that a lasting rise in latency without errors
+            becomes the baseline, and the limit recovers.
+        """
+        controller = ConcurrencyController(initial_limit=8, max_limit=8)
+        # Fast counts set a low p95, then slower fetches hold steady.
+        for _ in range(40):
+            controller.acquire()
+            controller.release(latency=0.001, status=200)
+        lowest = 8
+        for _ in range(150):
+            controller.acquire()
+            time.sleep(0.005)
+            controller.release(latency=0.005, status=200)
+            lowest = min(lowest, controller.get_stats()["limit"])
+        self.assertLess(lowest, 8)
+        self.assertEqual(controller.get_stats()["limit"], 8)
+
+    def test_resource_server_dispatch(self):
+        """Function to test that the fan-out respects the limit.
+        """
+        controller = ConcurrencyController(initial_limit=2, max_limit=3)
+        with LocalServer(_Handler) as server:
+            with ResourceServer(rs_url=server.url, token="token", workers=8,
+                                concurrency=controller) as rs:
+                queries = []
+                for _ in range(12):
+                    query = ResourceQuery()
+                    query.add_entity("entity")
+                    queries.append(query)
+                results = rs.get_data(queries)
+                stats = rs.get_concurrency_stats()
+
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(_Handler.max_in_flight, 3)
+        self.assertEqual(stats["successes"], 12)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertIsNotNone(stats["p95_latency"])
+
+
+if __name__ == '__main__':
+    unittest.main()
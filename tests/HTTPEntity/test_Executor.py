@@ -0,0 +1,44 @@
+'''
+    This script tests the lazy, shared executor.
+'''
+import unittest
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.Executor import Executor
+from iudx.rs.ResourceServer import ResourceServer
+
+
+class ExecutorTest(unittest.TestCase):
+    """Test different scenarios for the Executor class.
+    """
+
+    def test_lazy_shared_pool(self):
+        """Function to test that clients share one lazily started pool.
+        """
+        servers = [ResourceServer(rs_url="http://localhost", executor="thread",
+                                  workers=2) for i in range(50)]
+        executor = servers[0].executor
+        self.assertIsNone(executor._pool)
+        for rs in servers:
+            self.assertIs(rs.executor, executor)
+
+        self.assertEqual(executor.starmap(pow, [(2, 3), (3, 2)]), [8, 9])
+        self.assertIsNotNone(executor._pool)
+
+        for rs in servers:
+            rs.close()
+        self.assertIsNone(executor._pool)
+
+    def test_kinds(self):
+        """Function to test every supported kind of executor.
+        """
+        for kind in Executor.KINDS:
+            with Executor(kind=kind, workers=2) as executor:
+                self.assertEqual(executor.starmap(pow, [(2, 2)]), [4])
+        with self.assertRaises(ValueError):
+            Executor(kind="fiber")
+
+
+if __name__ == '__main__':
+    unittest.main()
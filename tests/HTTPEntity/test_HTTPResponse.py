@@ -0,0 +1,69 @@
+'''
+    This script tests incremental decoding of the 'results' array.
+'''
+import unittest
+import json
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.HTTPResponse import iter_json_results
+
+
+class HTTPResponseTest(unittest.TestCase):
+    """Test different scenarios for the streaming decoder of HTTPResponse.
+    """
+    def setUp(self):
+        self.results = [
+            {"id": "a/b/c", "value": i, "ratio": i / 7, "name": "śensor",
+             "location": {"coordinates": [72.8, 21.1]}, "ok": i % 2 == 0}
+            for i in range(50)
+        ]
+        self.document = json.dumps({
+            "type": "urn:dx:rs:success",
+            "title": "Success",
+            "results": self.results,
+            "totalHits": 12345,
+        }, ensure_ascii=False, indent=1).encode("utf-8")
+
+    def _chunks(self, size):
+        return [self.document[i:i + size]
+                for i in range(0, len(self.document), size)]
+
+    def test_records(self):
+        """Function to test decoding record by record for any chunk size.
+        """
+        for size in [1, 3, 7, 64, 100000]:
+            meta = {}
+            records = list(iter_json_results(self._chunks(size), meta=meta))
+            self.assertEqual(records, self.results)
+            self.assertEqual(meta["totalHits"], 12345)
+            self.assertEqual(meta["type"], "urn:dx:rs:success")
+
+    def test_scalars(self):
+        """Function to test numbers and literals cut at any chunk boundary.
+        """
+        document = (b'{"results":[1.5,2e3,-0.25E-2,true,null,{"a":1}],'
+                    b'"totalHits":12.75}')
+        for size in range(1, len(document) + 1):
+            meta = {}
+            chunks = [document[i:i + size] for i in range(0, len(document), size)]
+            records = list(iter_json_results(chunks, meta=meta))
+            self.assertEqual(records, [1.5, 2000.0, -0.0025, True, None, {"a": 1}])
+            self.assertEqual(meta["totalHits"], 12.75)
+
+    def test_batches(self):
+        """Function to test decoding fixed size batches of records.
+        """
+        batches = list(iter_json_results(self._chunks(13), batch_size=16))
+        self.assertEqual([len(b) for b in batches], [16, 16, 16, 2])
+        self.assertEqual(sum(batches, []), self.results)
+
+    def test_malformed(self):
+        """Function to test that a truncated document raises.
+        """
+        with self.assertRaises(ValueError):
+            list(iter_json_results(self._chunks(7)[:-20]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+'''
+    This script tests the JSON codec used for every request, response and file.
+'''
+import unittest
+import io
+import json
+import sys
+sys.path.insert(1, './')
+from unittest import mock
+
+from iudx.common import JSONCodec as json_codec
+from iudx.common.JSONCodec import JSONCodec
+
+
+DOCUMENT = {"id": "a/b/c", "name": "śensor ☂", "values": [1, 2.5, None, True],
+            "location": {"coordinates": [72.8, 21.1]}}
+
+
+class JSONCodecTest(unittest.TestCase):
+    """Test different scenarios for the JSONCodec class.
+    """
+    def _installed(self):
+        return [backend for backend in JSONCodec.BACKENDS
+                if getattr(json_codec, backend) is not None]
+
+    def test_backend_selection(self):
+        """Function to test that the fastest installed backend is chosen.
+        """
+        self.assertEqual(JSONCodec().backend, self._installed()[0])
+        self.assertEqual(JSONCodec(backend="json").backend, "json")
+
+    def test_unknown_backend(self):
+        """Function to test that an unknown backend is rejected.
+        """
+        with self.assertRaises(ValueError):
+            JSONCodec(backend="simplejson")
+
+    def test_missing_backend(self):
+        """Function to test that a backend which is not installed raises.
+        """
+        with mock.patch.object(json_codec, "ujson", None):
+            with self.assertRaises(ImportError):
+                JSONCodec(backend="ujson")
+
+    def test_stdlib_fallback(self):
+        """Function to test the standard library when no faster backend
+            is installed.
+        """
+        with mock.patch.object(json_codec, "orjson", None), \
+                mock.patch.object(json_codec, "ujson", None):
+            codec = JSONCodec()
+            self.assertEqual(codec.backend, "json")
+            self.assertEqual(codec.loads(codec.dumps(DOCUMENT)), DOCUMENT)
+
+    def test_round_trip(self):
+        """Function to test dumps/loads and dump/load with every installed
+            backend, including non-ASCII text and indentation.
+        """
+        for backend in self._installed():
+            with self.subTest(backend=backend):
+                codec = JSONCodec(backend=backend)
+                data = codec.dumps(DOCUMENT)
+                self.assertIsInstance(data, str)
+                self.assertEqual(codec.loads(data), DOCUMENT)
+                self.assertEqual(codec.loads(data.encode("utf-8")), DOCUMENT)
+                self.assertEqual(json.loads(data), DOCUMENT)
+
+                indented = codec.dumps(DOCUMENT, indent=2)
+                self.assertIn("\n", indented)
+                self.assertEqual(codec.loads(indented), DOCUMENT)
+
+                fp = io.StringIO()
+                codec.dump(DOCUMENT, fp, indent=2)
+                fp.seek(0)
+                self.assertEqual(codec.load(fp), DOCUMENT)
+
+    def test_default(self):
+        """Function to test replacing the codec used throughout the SDK.
+        """
+        default = JSONCodec.get_default()
+        try:
+            codec = JSONCodec(backend="json")
+            JSONCodec.set_default(codec)
+            self.assertIs(JSONCodec.get_default(), codec)
+        finally:
+            JSONCodec.set_default(default)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+    This script tests the client side rate limiter.
+'''
+import unittest
+import time
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.Executor import Executor
+from iudx.common.RateLimiter import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    """Test different scenarios for the RateLimiter class.
+    """
+    def setUp(self):
+        self.url = "https://rs.iudx.org.in/ngsi-ld/v1/temporal/entityOperations/query"
+
+    def test_matching(self):
+        """Function to test that limits only apply to their host and endpoint.
+        """
+        rate_limiter = RateLimiter().add_limit(
+            rate=1, burst=1, host="rs.iudx.org.in", endpoint="/entities")
+        start = time.monotonic()
+        for i in range(3):
+            rate_limiter.acquire(self.url)
+            rate_limiter.acquire("https://cos.iudx.org.in/ngsi-ld/v1/entities/x")
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def _assert_rate(self, kind):
+        rate_limiter = RateLimiter().add_limit(rate=20, burst=1)
+        with Executor(kind=kind, workers=4) as executor:
+            start = time.monotonic()
+            executor.starmap(rate_limiter.acquire, [(self.url,)] * 11)
+            elapsed = time.monotonic() - start
+        # 1 request from the burst, then 10 more at 20 per second.
+        self.assertGreaterEqual(elapsed, 0.45)
+        self.assertLess(elapsed, 2.0)
+
+    def test_threads(self):
+        """Function to test the limit across the threads of an executor.
+        """
+        self._assert_rate("thread")
+
+    def test_processes(self):
+        """Function to test the limit across the processes of an executor.
+        """
+        self._assert_rate("process")
+
+
+if __name__ == '__main__':
+    unittest.main()
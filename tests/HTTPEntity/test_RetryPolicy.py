@@ -0,0 +1,82 @@
+'''
+    This script tests retries and the circuit breaker of HTTPEntity.
+'''
+import unittest
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.HTTPEntity import HTTPEntity
+from iudx.common.RetryPolicy import RetryPolicy
+from iudx.common.CircuitBreaker import CircuitBreaker, CircuitOpenError
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    statuses = []
+    calls = 0
+
+    def do_GET(self):
+        _Handler.calls += 1
+        status = _Handler.statuses.pop(0) if _Handler.statuses else 200
+        headers = {"Retry-After": "0"} if status == 429 else None
+        self.send_json(status, {}, headers)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """Test different scenarios for the RetryPolicy and CircuitBreaker.
+    """
+    def setUp(self):
+        _Handler.calls = 0
+        self.server = LocalServer(_Handler)
+        self.url = self.server.url
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_retry_status(self):
+        """Function to test that retryable statuses are re-sent.
+        """
+        _Handler.statuses = [503, 429]
+        http_entity = HTTPEntity(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.01),
+            circuit_breaker=CircuitBreaker())
+        result = http_entity.get(self.url, headers={})
+        self.assertEqual(result.get_status_code(), 200)
+        self.assertEqual(_Handler.calls, 3)
+
+    def test_attempts_exhausted(self):
+        """Function to test that the last response is returned.
+        """
+        _Handler.statuses = [502, 502, 502]
+        http_entity = HTTPEntity(
+            retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0.01),
+            circuit_breaker=CircuitBreaker())
+        result = http_entity.get(self.url, headers={})
+        self.assertEqual(result.get_status_code(), 502)
+        self.assertEqual(_Handler.calls, 2)
+
+    def test_circuit_breaker(self):
+        """Function to test that an open circuit refuses requests.
+        """
+        _Handler.statuses = [500, 500]
+        http_entity = HTTPEntity(
+            retry_policy=RetryPolicy.no_retry(),
+            circuit_breaker=CircuitBreaker(failure_threshold=2,
+                                           reset_timeout=60))
+        http_entity.get(self.url, headers={})
+        http_entity.get(self.url, headers={})
+        with self.assertRaises(CircuitOpenError):
+            http_entity.get(self.url, headers={})
+        self.assertEqual(_Handler.calls, 2)
+
+    def test_parse_retry_after(self):
+        """Function to test parsing of the 'Retry-After' header.
+        """
+        self.assertEqual(RetryPolicy.parse_retry_after("7"), 7.0)
+        self.assertEqual(
+            RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+
+
+if __name__ == '__main__':
+    unittest.main()
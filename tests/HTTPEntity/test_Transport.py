@@ -0,0 +1,61 @@
+'''
+    This script tests the pooled transport against a local http server.
+'''
+import unittest
+import pickle
+import sys
+sys.path.insert(1, './')
+
+from iudx.common.HTTPEntity import HTTPEntity
+from iudx.common.Transport import Transport
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    ports = set()
+
+    def do_GET(self):
+        _Handler.ports.add(self.client_address[1])
+        self.send_json(200, {"type": "urn:dx:rs:success", "results": []})
+
+
+class TransportTest(unittest.TestCase):
+    """Test different scenarios for the Transport class.
+    """
+    def setUp(self):
+        _Handler.ports = set()
+        self.server = LocalServer(_Handler)
+        self.url = self.server.url
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_connection_reuse(self):
+        """Function to test that requests share one keep-alive connection.
+        """
+        with Transport(pool_maxsize=4) as transport:
+            http_entity = HTTPEntity(transport=transport)
+            for i in range(5):
+                result = http_entity.get(self.url + "/entities", headers={})
+                self.assertEqual(result.get_status_code(), 200)
+        self.assertEqual(len(_Handler.ports), 1)
+
+    def test_no_keep_alive(self):
+        """Function to test that keep-alive can be switched off.
+        """
+        with Transport(keep_alive=False) as transport:
+            http_entity = HTTPEntity(transport=transport)
+            for i in range(3):
+                http_entity.get(self.url + "/entities", headers={})
+        self.assertEqual(len(_Handler.ports), 3)
+
+    def test_pickle_resolves_same_transport(self):
+        """Function to test that a pickled transport resolves to the registry.
+        """
+        transport = Transport()
+        self.assertIs(pickle.loads(pickle.dumps(transport)), transport)
+        transport.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+'''
+    Local http server the tests run the SDK against, tests subclass
+    JSONHandler with their routes only.
+'''
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler replying with JSON bodies. Subclasses
+       implement do_GET/do_POST.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("content-length", 0)))
+
+    def read_json(self) -> Any:
+        return json.loads(self.read_body())
+
+    def send_json(self, status: int, payload: Any = None,
+                  headers: Dict[str, str] = None) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServer():
+    """Threaded http server on a free local port, serving until closed.
+    """
+    def __init__(self, handler: type):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.url = "http://127.0.0.1:" + str(self.server.server_port)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,103 @@
+'''
+    This script tests the tokens cached on disk across processes.
+'''
+import unittest
+import base64
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+import sys
+sys.path.insert(1, './')
+
+from iudx.auth.Token import Token
+from iudx.auth.FileTokenCache import FileTokenCache
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    calls = 0
+    lifetime = 3600
+
+    def do_POST(self):
+        self.read_body()
+        _Handler.calls += 1
+        time.sleep(0.05)
+        claims = {"n": _Handler.calls, "exp": time.time() + _Handler.lifetime}
+        payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+        self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                             "results": {"accessToken": "e30." + payload.decode() + ".sig"}})
+
+
+class FileTokenCacheTest(unittest.TestCase):
+    """Test different scenarios for the FileTokenCache.
+    """
+    def setUp(self):
+        _Handler.calls = 0
+        _Handler.lifetime = 3600
+        self.server = LocalServer(_Handler)
+        self.auth_url = self.server.url
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "iudx", "tokens.json")
+
+    def tearDown(self):
+        self.server.close()
+        self.directory.cleanup()
+
+    def token(self, client_id: str = "id") -> Token:
+        # A new cache object stands for a new process.
+        token = Token(auth_url=self.auth_url, client_id=client_id,
+                      client_secret="secret", cache=FileTokenCache(self.path))
+        return token.set_item("a", "resource", "consumer")
+
+    def test_reused_across_processes(self):
+        """Function to test that a stored token skips the auth server.
+        """
+        first = self.token().request_token()
+        self.assertEqual(self.token().request_token(), first)
+        self.assertEqual(_Handler.calls, 1)
+
+        mode = stat.S_IMODE(os.stat(self.path).st_mode)
+        self.assertEqual(mode, 0o600)
+        with open(self.path) as f:
+            self.assertNotIn("secret", f.read())
+
+    def test_per_credentials(self):
+        """Function to test that other credentials get their own token.
+        """
+        first = self.token().request_token()
+        self.assertNotEqual(self.token("other").request_token(), first)
+        self.assertEqual(_Handler.calls, 2)
+
+    def test_expired_and_exposed(self):
+        """Function to test that stale or world readable tokens are ignored.
+        """
+        _Handler.lifetime = 30
+        self.token().request_token()
+        self.token().request_token()
+        self.assertEqual(_Handler.calls, 2)
+
+        _Handler.lifetime = 3600
+        self.token().request_token()
+        os.chmod(self.path, 0o644)
+        self.token().request_token()
+        self.assertEqual(_Handler.calls, 4)
+
+    def test_concurrent(self):
+        """Function to test that concurrent processes request the token once.
+        """
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.token().request_token()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(_Handler.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+'''
+    This script tests the caching and refresh of access tokens.
+'''
+import unittest
+import base64
+import json
+import threading
+import time
+import sys
+sys.path.insert(1, './')
+
+from iudx.auth.Token import Token
+from iudx.auth.TokenCache import TokenCache, token_expiry
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+def make_jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return "e30." + payload.decode() + ".signature"
+
+
+class _Handler(JSONHandler):
+    calls = 0
+    lifetime = 3600
+
+    def do_POST(self):
+        item = self.read_json()
+        _Handler.calls += 1
+        time.sleep(0.05)
+        access_token = make_jwt({"sub": item["itemId"], "n": _Handler.calls,
+                                 "exp": time.time() + _Handler.lifetime})
+        self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                             "results": {"accessToken": access_token}})
+
+
+class TokenCacheTest(unittest.TestCase):
+    """Test different scenarios for the TokenCache.
+    """
+    def setUp(self):
+        _Handler.calls = 0
+        _Handler.lifetime = 3600
+        self.server = LocalServer(_Handler)
+        self.auth_url = self.server.url
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_expiry(self):
+        """Function to test the expiry parsing.
+        """
+        self.assertEqual(token_expiry(make_jwt({"exp": 2000000000})), 2000000000)
+        self.assertEqual(token_expiry("opaque", {"expiry": 2000000000}), 2000000000)
+        self.assertAlmostEqual(token_expiry("opaque", {"expiry": 600}),
+                               time.time() + 600, delta=5)
+
+    def test_cached_per_item(self):
+        """Function to test that tokens are reused per item.
+        """
+        token = Token(auth_url=self.auth_url, client_id="id", client_secret="secret")
+        first = token.set_item("a", "resource", "consumer").request_token()
+        self.assertEqual(token.request_token(), first)
+        other = token.set_item("b", "resource", "consumer").request_token()
+        self.assertNotEqual(other, first)
+        self.assertEqual(_Handler.calls, 2)
+
+    def test_coalesced(self):
+        """Function to test that concurrent requests share one call.
+        """
+        token = Token(auth_url=self.auth_url, client_id="id", client_secret="secret")
+        token.set_item("a", "resource", "consumer")
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(token.request_token()))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(_Handler.calls, 1)
+
+    def test_request_tokens(self):
+        """Function to test the concurrent tokens of many items.
+        """
+        token = Token(auth_url=self.auth_url, client_id="id", client_secret="secret")
+        token.set_item("group", "resource_group", "consumer")
+        items = [(str(i), "resource", "consumer") for i in range(16)]
+        start = time.monotonic()
+        tokens = token.request_tokens(items)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(len(set(tokens)), 16)
+        self.assertEqual(tokens[3], token.set_item("3", "resource", "consumer").request_token())
+        self.assertEqual(_Handler.calls, 16)
+        self.assertLess(elapsed, 16 * 0.05)
+        self.assertEqual(token.request_tokens([]), [])
+
+    def test_request_tokens_keeps_item(self):
+        """Function to test that the bulk request leaves the item alone.
+        """
+        token = Token(auth_url=self.auth_url, client_id="id", client_secret="secret")
+        token.set_item("group", "resource_group", "consumer")
+        token.request_tokens([("a", "resource", "consumer"), ("b", "resource", "consumer")])
+        self.assertEqual(token.item["itemId"], "group")
+
+    def test_proactive_refresh(self):
+        """Function to test that a token in use is refreshed before expiry.
+        """
+        _Handler.lifetime = 4
+        token = Token(auth_url=self.auth_url, client_id="id", client_secret="secret",
+                      cache=TokenCache(refresh_margin=1))
+        token.set_item("a", "resource", "consumer")
+        first = token.request_token()
+        self.assertEqual(token.request_token(), first)
+        time.sleep(2.5)
+        self.assertEqual(_Handler.calls, 1)
+
+        # Due for a refresh, the current token is still returned.
+        self.assertEqual(token.request_token(), first)
+        deadline = time.monotonic() + 5
+        while _Handler.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        self.assertEqual(_Handler.calls, 2)
+        self.assertNotEqual(token.request_token(), first)
+
+    def test_no_thread_per_token(self):
+        """Function to test that cached tokens start no threads.
+        """
+        cache = TokenCache()
+        threads = threading.active_count()
+        for i in range(100):
+            cache.put(("id", str(i), "resource", "consumer"), "token",
+                      time.time() + 3600)
+        self.assertEqual(threading.active_count(), threads)
+
+if __name__ == '__main__':
+    unittest.main()
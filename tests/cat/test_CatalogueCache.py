@@ -0,0 +1,88 @@
+'''
+    This script tests the caching of catalogue responses.
+'''
+import unittest
+import tempfile
+import sys
+sys.path.insert(1, './')
+
+from iudx.cat.Catalogue import Catalogue
+from iudx.cat.CatalogueCache import CatalogueCache
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    requests = []
+    version = "1"
+
+    def do_GET(self):
+        _Handler.requests.append((self.path, self.headers.get("If-None-Match")))
+        etag = '"' + _Handler.version + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_json(304)
+            return
+        self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": 1,
+                             "results": [{"id": "item", "version": _Handler.version}]},
+                       {"ETag": etag})
+
+
+class CatalogueCacheTest(unittest.TestCase):
+    """Test different scenarios for the CatalogueCache.
+    """
+    def setUp(self):
+        _Handler.requests = []
+        _Handler.version = "1"
+        self.server = LocalServer(_Handler)
+        self.cat_url = self.server.url
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.close()
+        self.directory.cleanup()
+
+    def catalogue(self, cache: CatalogueCache) -> Catalogue:
+        return Catalogue(cat_url=self.cat_url,
+                         headers={"content-type": "application/json"}, cache=cache)
+
+    def test_fresh(self):
+        """Function to test that fresh responses are served locally.
+        """
+        cat = self.catalogue(CatalogueCache())
+        first = cat.get_item("item")
+        first.documents[0]["version"] = "changed"
+        second = cat.get_item("item")
+        self.assertEqual(second.documents[0]["version"], "1")
+        self.assertEqual(second.status, "urn:dx:cat:Success")
+        cat.get_related_entity("item", "resourceGroup")
+        cat.list_entity("resource")
+        self.assertEqual(len(_Handler.requests), 3)
+
+    def test_revalidation(self):
+        """Function to test the conditional requests after the TTL.
+        """
+        cat = self.catalogue(CatalogueCache(ttl=0))
+        cat.get_item("item")
+        self.assertEqual(cat.get_item("item").documents[0]["version"], "1")
+        self.assertEqual(_Handler.requests[-1][1], '"1"')
+
+        _Handler.version = "2"
+        self.assertEqual(cat.get_item("item").documents[0]["version"], "2")
+        self.assertEqual(len(_Handler.requests), 3)
+
+    def test_disk_and_lru(self):
+        """Function to test the on-disk store and the memory bound.
+        """
+        cache = CatalogueCache(max_entries=1, path=self.directory.name)
+        cat = self.catalogue(cache)
+        cat.get_item("a")
+        cat.get_item("b")
+        self.assertEqual(len(cache._entries), 1)
+
+        other = self.catalogue(CatalogueCache(path=self.directory.name))
+        other.get_item("a")
+        other.get_item("b")
+        self.assertEqual(len(_Handler.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
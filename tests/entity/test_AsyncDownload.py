@@ -0,0 +1,100 @@
+'''
+    This script tests the async search endpoints of entities.
+'''
+import unittest
+import os
+import json
+import tempfile
+import time
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.auth.Token import Token
+from iudx.common.RateLimiter import RateLimiter
+from iudx.entity.Entity import Entity
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        _Handler.requests.append((url.path, self.headers.get("token")))
+        if url.path == "/item":
+            results = [{"id": params["id"][0], "type": ["iudx:ResourceGroup"]}]
+            body = {"type": "urn:dx:cat:Success", "totalHits": 1, "results": results}
+        elif url.path == "/search":
+            body = {"type": "urn:dx:cat:Success", "totalHits": 1,
+                    "results": [{"id": "resource-1"}]}
+        elif url.path == "/async/search":
+            body = {"type": "urn:dx:rs:success",
+                    "result": [{"searchId": "search-" + params["id"][0]}]}
+        elif url.path == "/async/status":
+            body = {"type": "urn:dx:rs:success",
+                    "results": [{"searchId": params["searchId"][0],
+                                 "status": "COMPLETE", "progress": 100,
+                                 "file-download-url": "http://" + self.headers["host"] + "/file"}]}
+        else:
+            body = {"results": [{"id": "resource-1"}]}
+        self.send_json(200, body)
+
+    def do_POST(self):
+        self.read_body()
+        self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                             "results": {"accessToken": "token", "expiry": 3600}})
+
+
+class AsyncDownloadTest(unittest.TestCase):
+    """Test different scenarios for the async search endpoints.
+    """
+    def setUp(self):
+        _Handler.requests = []
+        self.server = LocalServer(_Handler)
+        self.directory = tempfile.TemporaryDirectory()
+        token = Token(auth_url=self.server.url, client_id="id",
+                      client_secret="secret")
+        token.set_item("group", "resource_group", "consumer")
+        self.entity = Entity(
+            entity_id="group", cat_url=self.server.url, rs_url=self.server.url,
+            token_obj=token, headers={"content-type": "application/json"})
+
+    def tearDown(self):
+        self.entity.close()
+        self.server.close()
+        self.directory.cleanup()
+
+    def test_status_rate_limit(self):
+        """Function to test that a limit on '/async/status' throttles
+            async_status.
+        """
+        self.entity.rs.rate_limiter = RateLimiter().add_limit(
+            rate=10, burst=1, endpoint="/async/status")
+        start = time.monotonic()
+        for _ in range(4):
+            status = self.entity.async_status(search_id="search-1")
+        # 1 request from the burst, then 3 more at 10 per second.
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+        self.assertEqual(status["results"][0]["status"], "COMPLETE")
+
+    def test_download(self):
+        """Function to test that the file is streamed through the
+            resource server client.
+        """
+        path = self.entity.async_download(
+            start_time="2021-01-01T00:00:00+05:30",
+            end_time="2021-01-02T00:00:00+05:30",
+            file_name=os.path.join(self.directory.name, "out"),
+            poll_interval=0, progress=False)
+
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"results": [{"id": "resource-1"}]})
+        paths = [path for path, _ in _Handler.requests]
+        self.assertEqual(paths[-3:], ["/async/search", "/async/status", "/file"])
+        self.assertEqual(_Handler.requests[-1][1], "token")
+
+
+if __name__ == '__main__':
+    unittest.main()
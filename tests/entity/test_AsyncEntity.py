@@ -0,0 +1,100 @@
+'''
+    This script tests the failure handling of the asyncio entity.
+'''
+import unittest
+import asyncio
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.entity.AsyncEntity import AsyncEntity
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    # Status answered for the data of a resource, or of a slice start.
+    statuses = {}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/item":
+            results = [{"id": parse_qs(url.query)["id"][0],
+                        "type": ["iudx:ResourceGroup"]}]
+            body = {"type": "urn:dx:cat:Success", "totalHits": 1, "results": results}
+        elif url.path == "/search":
+            results = [{"id": "resource-1"}, {"id": "resource-2"}]
+            body = {"type": "urn:dx:cat:Success", "totalHits": 2, "results": results}
+        else:
+            resource_id = url.path.split("/entities/")[-1]
+            status = _Handler.statuses.get(resource_id, 200)
+            if status != 200:
+                self.send_json(status, {"type": status, "title": "Failed"})
+                return
+            body = {"type": "urn:dx:rs:success", "title": "ok",
+                    "results": [{"id": resource_id,
+                                 "observationDateTime": "2021-01-01T00:00:00+05:30"}]}
+        self.send_json(200, body)
+
+    def do_POST(self):
+        body = self.read_json()
+        if body.get("options") == "count":
+            self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok",
+                                 "results": [{"totalHits": 1}]})
+            return
+        start = body["temporalQ"]["time"]
+        status = _Handler.statuses.get(start, 200)
+        if status != 200:
+            self.send_json(status, {"type": status, "title": "Failed"})
+            return
+        self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok", "totalHits": 1,
+                             "results": [{"id": body["entities"][0]["id"],
+                                          "observationDateTime": start}]})
+
+
+class AsyncEntityTest(unittest.TestCase):
+    """Test different scenarios for the failed queries of AsyncEntity.
+    """
+    def setUp(self):
+        _Handler.statuses = {}
+        self.server = LocalServer(_Handler)
+
+    def tearDown(self):
+        self.server.close()
+
+    def _run(self, search):
+        async def run():
+            async with AsyncEntity(entity_id="group", cat_url=self.server.url,
+                                   rs_url=self.server.url, token="token") as entity:
+                return entity, await search(entity)
+        return asyncio.run(run())
+
+    def test_latest_unauthorized(self):
+        """Function to test that an expired token raises.
+        """
+        _Handler.statuses = {"resource-2": 401}
+        with self.assertRaises(RuntimeError):
+            self._run(lambda entity: entity.latest())
+
+    def test_latest_failed(self):
+        """Function to test that failed queries are kept in failed_results.
+        """
+        _Handler.statuses = {"resource-2": 503}
+        entity, resources_df = self._run(lambda entity: entity.latest())
+        self.assertEqual(list(resources_df["id"]), ["resource-1"])
+        self.assertEqual(len(entity.failed_results), 1)
+        self.assertEqual(entity.failed_results[0].status, 503)
+
+    def test_during_failed(self):
+        """Function to test that a failed slice is kept in failed_results.
+        """
+        _Handler.statuses = {"2021-01-01T00:00:00+05:30": 500}
+        entity, resources_df = self._run(lambda entity: entity.during_search(
+            start_time="2021-01-01T00:00:00+05:30",
+            end_time="2021-01-15T00:00:00+05:30"))
+        self.assertEqual(len(resources_df), 1)
+        self.assertEqual(len(entity.failed_results), 1)
+        self.assertEqual(entity.failed_results[0].status, 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+'''
+    This script tests temporal searches over the resources of a group.
+'''
+import unittest
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.auth.Token import Token
+from iudx.entity.Entity import Entity
+from iudx.rs.DensityModel import DensityModel
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    missing = {"resource-2"}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/item":
+            results = [{"id": parse_qs(url.query)["id"][0],
+                        "type": ["iudx:ResourceGroup"]}]
+        else:
+            results = [{"id": "resource-1"}, {"id": "resource-2"}]
+        self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": len(results),
+                             "results": results})
+
+    def do_POST(self):
+        body = self.read_json()
+        if self.path == "/token":
+            self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                                 "results": {"accessToken": "token", "expiry": 3600}})
+            return
+        resource_id = body["entities"][0]["id"]
+        if resource_id in _Handler.missing:
+            self.send_json(404, {"type": "urn:dx:rs:resourceNotFound",
+                                 "title": "Not Found"})
+        elif body.get("options") == "count":
+            self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok",
+                                 "results": [{"totalHits": 2}]})
+        else:
+            self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok", "totalHits": 2,
+                                 "results": [{"id": resource_id,
+                                              "observationDateTime": body["temporalQ"]["time"]},
+                                             {"id": resource_id,
+                                              "observationDateTime": body["temporalQ"]["endtime"]}]})
+
+
+class DuringSearchTest(unittest.TestCase):
+    """Test different scenarios for the temporal search of a group.
+    """
+    def setUp(self):
+        self.server = LocalServer(_Handler)
+        self.directory = tempfile.TemporaryDirectory()
+        token = Token(auth_url=self.server.url, client_id="id",
+                      client_secret="secret")
+        token.set_item("group", "resource_group", "consumer")
+        self.entity = Entity(
+            entity_id="group", cat_url=self.server.url, rs_url=self.server.url,
+            token_obj=token, headers={"content-type": "application/json"},
+            density_model=DensityModel(
+                path=os.path.join(self.directory.name, "density.json")))
+
+    def tearDown(self):
+        self.entity.close()
+        self.server.close()
+        self.directory.cleanup()
+
+    def test_failed_count(self):
+        """Function to test that a resource whose count fails becomes a
+            failed slice instead of failing the search.
+        """
+        resources_df = self.entity.during_search(
+            start_time="2021-01-01T00:00:00+05:30",
+            end_time="2021-01-02T00:00:00+05:30")
+
+        self.assertEqual(set(resources_df["id"]), {"resource-1"})
+        self.assertEqual(len(self.entity.failed_results), 1)
+        failed = self.entity.failed_results[0]
+        self.assertEqual(failed.status, 404)
+        self.assertEqual(failed.query._entities[0], "resource-2")
+        self.assertIsNone(failed.query._count)
+        stats = self.entity.progress.get_stats()
+        self.assertEqual(stats["resource-2"]["failed"], 1)
+        self.assertEqual(stats["resource-1"]["rows"], 2)
+
+    def test_failed_count_streamed(self):
+        """Function to test that iter_during skips the failed resource.
+        """
+        frames = list(self.entity.iter_during(
+            start_time="2021-01-01T00:00:00+05:30",
+            end_time="2021-01-02T00:00:00+05:30"))
+        self.assertEqual([set(frame["id"]) for frame in frames], [{"resource-1"}])
+        self.assertEqual(len(self.entity.failed_results), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
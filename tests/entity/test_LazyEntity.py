@@ -0,0 +1,124 @@
+'''
+    This script tests the deferred initialization of entities.
+'''
+import unittest
+import threading
+import time
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.auth.Token import Token
+from iudx.entity.Entity import Entity
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    requests = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def _enter(self, path):
+        with _Handler.lock:
+            _Handler.requests.append(path)
+            _Handler.in_flight += 1
+            _Handler.max_in_flight = max(_Handler.max_in_flight,
+                                         _Handler.in_flight)
+        time.sleep(0.05)
+        with _Handler.lock:
+            _Handler.in_flight -= 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self._enter(url.path)
+        if url.path == "/item":
+            iid = parse_qs(url.query)["id"][0]
+            results = [{"id": iid, "type": ["iudx:ResourceGroup"],
+                        "accessPolicy": "SECURE"}]
+        else:
+            results = [{"id": "resource-1"}, {"id": "resource-2"}]
+        self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": len(results),
+                             "results": results})
+
+    def do_POST(self):
+        item = self.read_json()
+        self._enter(self.path)
+        self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                             "results": {"accessToken": "t-" + item["itemId"],
+                                         "expiry": 3600}})
+
+
+class LazyEntityTest(unittest.TestCase):
+    """Test different scenarios for lazy entities.
+    """
+    def setUp(self):
+        _Handler.requests = []
+        _Handler.max_in_flight = 0
+        self.server = LocalServer(_Handler)
+        self.cat_url = self.server.url
+
+    def tearDown(self):
+        self.server.close()
+
+    def entity(self, entity_id: str, lazy: bool = True,
+               token_obj: Token = None) -> Entity:
+        return Entity(entity_id=entity_id, cat_url=self.cat_url,
+                      rs_url="http://127.0.0.1:1/ngsi-ld/v1",
+                      headers={"content-type": "application/json"},
+                      token_obj=token_obj, lazy=lazy)
+
+    def test_deferred(self):
+        """Function to test that nothing is fetched before first access.
+        """
+        entity = self.entity("group")
+        self.assertEqual(_Handler.requests, [])
+        self.assertEqual([r["id"] for r in entity.resources],
+                         ["resource-1", "resource-2"])
+        self.assertIsNotNone(entity.rs)
+        self.assertEqual(_Handler.requests, ["/item", "/search"])
+        entity.close()
+
+    def test_eager(self):
+        """Function to test that the default still resolves at once.
+        """
+        entity = self.entity("group", lazy=False)
+        self.assertEqual(len(_Handler.requests), 2)
+        self.assertEqual(len(entity.resources), 2)
+        entity.close()
+
+    def test_prefetch(self):
+        """Function to test that many entities resolve concurrently.
+        """
+        entities = [self.entity(f"group-{i}") for i in range(8)]
+        Entity.prefetch(entities)
+
+        self.assertEqual(len(_Handler.requests), 16)
+        self.assertGreater(_Handler.max_in_flight, 1)
+        self.assertTrue(all(len(entity.resources) == 2 for entity in entities))
+        for entity in entities:
+            entity.close()
+
+    def test_prefetch_tokens(self):
+        """Function to test that every entity gets the token of the item
+            set when it was built, requested concurrently.
+        """
+        token = Token(auth_url=self.cat_url, client_id="id",
+                      client_secret="secret")
+        entities = []
+        for i in range(4):
+            token.set_item(f"g{i}", "resource_group", "consumer")
+            entities.append(self.entity(f"g{i}", token_obj=token))
+        _Handler.requests = []
+        Entity.prefetch(entities)
+
+        self.assertEqual([entity.rs.token for entity in entities],
+                         ["t-g0", "t-g1", "t-g2", "t-g3"])
+        self.assertEqual(_Handler.requests.count("/token"), 4)
+        self.assertEqual(token.item["itemId"], "g3")
+        for entity in entities:
+            entity.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+'''
+    This script tests the paginated property search of entities.
+'''
+import unittest
+import time
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.entity.Entity import Entity
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+RECORDS = {"resource-1": 12001, "resource-2": 3}
+
+
+class _Handler(JSONHandler):
+    pages = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if url.path.endswith("/item"):
+            results = [{"id": params["id"][0], "type": ["iudx:ResourceGroup"]}]
+            body = {"type": "urn:dx:cat:Success", "totalHits": 1, "results": results}
+        elif url.path.endswith("/search"):
+            results = [{"id": resource_id} for resource_id in RECORDS]
+            body = {"type": "urn:dx:cat:Success", "totalHits": 2, "results": results}
+        else:
+            resource_id = params["id"][0]
+            offset, limit = int(params["offset"][0]), int(params["limit"][0])
+            _Handler.pages.append((resource_id, offset))
+            time.sleep(0.05)
+            total = RECORDS[resource_id]
+            results = [{"id": resource_id, "n": n}
+                       for n in range(offset, min(offset + limit, total))]
+            body = {"type": "urn:dx:rs:success", "title": "Success",
+                    "totalHits": total, "results": results}
+        self.send_json(200, body)
+
+
+class PropertySearchTest(unittest.TestCase):
+    """Test different scenarios for the property search.
+    """
+    def setUp(self):
+        _Handler.pages = []
+        self.server = LocalServer(_Handler)
+        url = self.server.url
+        self.entity = Entity(entity_id="group", cat_url=url, rs_url=url,
+                             headers={"content-type": "application/json"})
+
+    def tearDown(self):
+        self.entity.close()
+        self.server.close()
+
+    def test_pages(self):
+        """Function to test that every page of every resource is fetched
+            once and reassembled in order.
+        """
+        resources_df = self.entity.property_search(operation="==")
+
+        self.assertEqual(sorted(_Handler.pages),
+                         [("resource-1", 0), ("resource-1", 5000),
+                          ("resource-1", 10000), ("resource-2", 0)])
+        self.assertEqual(len(resources_df), 12004)
+        self.assertEqual(list(resources_df["n"][:12001]), list(range(12001)))
+        self.assertEqual(list(resources_df["id"][12001:]), ["resource-2"] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
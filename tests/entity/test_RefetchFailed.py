@@ -0,0 +1,79 @@
+'''
+    This script tests re-sending the failed queries of an entity.
+'''
+import unittest
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.auth.Token import Token
+from iudx.entity.Entity import Entity
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    latest = []
+    failures = set()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/item":
+            results = [{"id": parse_qs(url.query)["id"][0],
+                        "type": ["iudx:ResourceGroup"]}]
+            self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": len(results),
+                                 "results": results})
+        elif url.path == "/search":
+            results = [{"id": "resource-1"}, {"id": "resource-2"}]
+            self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": len(results),
+                                 "results": results})
+        else:
+            resource_id = url.path.split("/entities/")[-1]
+            _Handler.latest.append((resource_id, self.headers.get("token")))
+            if resource_id in _Handler.failures:
+                _Handler.failures.discard(resource_id)
+                self.send_json(400, {"type": "urn:dx:rs:badRequest",
+                                     "title": "Bad Request"})
+                return
+            self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok",
+                                 "results": [{"id": resource_id,
+                                              "observationDateTime": "2021-01-01T00:00:00"}]})
+
+    def do_POST(self):
+        item = self.read_json()
+        self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                             "results": {"accessToken": "t-" + item["itemId"],
+                                         "expiry": 3600}})
+
+
+class RefetchFailedTest(unittest.TestCase):
+    """Test different scenarios for Entity.refetch_failed.
+    """
+    def setUp(self):
+        _Handler.latest = []
+        _Handler.failures = {"resource-2"}
+        self.server = LocalServer(_Handler)
+        token = Token(auth_url=self.server.url, client_id="id",
+                      client_secret="secret")
+        token.set_item("group", "resource_group", "consumer")
+        self.entity = Entity(entity_id="group", cat_url=self.server.url,
+                             rs_url=self.server.url, token_obj=token,
+                             headers={"content-type": "application/json"})
+
+    def tearDown(self):
+        self.entity.close()
+        self.server.close()
+
+    def test_latest_keeps_resource_token(self):
+        """Function to test that a refetched latest query is sent with the
+            token of its resource.
+        """
+        self.entity.latest()
+        self.assertEqual(len(self.entity.failed_results), 1)
+        self.entity.refetch_failed()
+
+        self.assertEqual(self.entity.failed_results, [])
+        self.assertEqual(_Handler.latest[-1], ("resource-2", "t-resource-2"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+'''
+    This script tests the assembly of query results into a DataFrame.
+'''
+import unittest
+import sys
+sys.path.insert(1, './')
+
+import pandas as pd
+
+from iudx.entity.ResultAssembler import ResultAssembler
+
+
+class ResultAssemblerTest(unittest.TestCase):
+    """Test different scenarios for the ResultAssembler.
+    """
+    def test_time_series(self):
+        """Function to test the union of columns and the time ordering.
+        """
+        assembler = ResultAssembler()
+        assembler.add([
+            {"id": "a", "observationDateTime": "2021-01-02T00:00:00+05:30", "speed": 1},
+        ])
+        assembler.add([
+            {"id": "b", "observationDateTime": "2021-01-01T00:00:00+05:30", "level": 2.5},
+        ])
+        assembler.add([])
+        resources_df = assembler.to_time_series()
+
+        self.assertEqual(assembler.rows, 2)
+        self.assertEqual(list(resources_df["id"]), ["b", "a"])
+        self.assertEqual(list(resources_df.index), [0, 1])
+        self.assertEqual(set(resources_df.columns),
+                         {"id", "observationDateTime", "speed", "level"})
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(
+            resources_df["observationDateTime"]))
+        self.assertEqual(len(assembler.records()), 2)
+
+    def test_reconcile(self):
+        """Function to test that mismatching dtypes get a common dtype.
+        """
+        frames = ResultAssembler.reconcile([
+            pd.DataFrame({"speed": [1, 2], "state": [True, False]}),
+            pd.DataFrame({"speed": [1.5], "state": ["unknown"]}),
+        ])
+        self.assertEqual(frames[0]["speed"].dtype, "float64")
+        self.assertEqual(frames[0]["state"].dtype, object)
+        self.assertEqual(frames[1]["state"].dtype, object)
+
+    def test_empty(self):
+        """Function to test that no batches give an empty DataFrame.
+        """
+        resources_df = ResultAssembler().to_time_series()
+        self.assertEqual(len(resources_df), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+'''
+    This script tests the sinks streaming search results to disk.
+'''
+import unittest
+import json
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+
+import pandas as pd
+
+from iudx.entity import ResultSink as result_sink
+from iudx.entity.ResultSink import ResultSink, CSVSink, NDJSONSink
+
+
+SLICES = [
+    [{"id": "a", "observationDateTime": "2021-01-01T00:00:00+05:30", "speed": 1.0}],
+    [{"id": "a", "observationDateTime": "2021-01-02T00:00:00+05:30", "speed": 2.0},
+     {"id": "a", "observationDateTime": "2021-01-03T00:00:00+05:30", "speed": 3.0,
+      "extra": 1}],
+]
+
+
+class ResultSinkTest(unittest.TestCase):
+    """Test different scenarios for the ResultSinks.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_csv(self):
+        """Function to test that slices are appended under one header.
+        """
+        sink = ResultSink.create(self.path("data.csv"))
+        self.assertIsInstance(sink, CSVSink)
+        with sink:
+            for records in SLICES:
+                sink.write(records)
+        stats = sink.close()
+
+        resources_df = pd.read_csv(self.path("data.csv"))
+        self.assertEqual(len(resources_df), 3)
+        self.assertEqual(list(resources_df["speed"]), [1.0, 2.0, 3.0])
+        self.assertEqual(stats["rows"], 3)
+        self.assertEqual(stats["slices"], 2)
+        self.assertEqual(stats["bytes"], os.path.getsize(self.path("data.csv")))
+        self.assertEqual(sink.extra_columns, {"extra"})
+
+        # The late column is kept in the side file, by row.
+        with open(self.path("data.extra.json")) as f:
+            extra = [json.loads(line) for line in f]
+        self.assertEqual(extra, [{"row": 2, "extra": 1}])
+
+    def test_ndjson(self):
+        """Function to test that the raw records are kept.
+        """
+        with ResultSink.create(self.path("data.json")) as sink:
+            self.assertIsInstance(sink, NDJSONSink)
+            for records in SLICES:
+                sink.write(records)
+        with open(self.path("data.json")) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records, SLICES[0] + SLICES[1])
+
+    @unittest.skipIf(result_sink.pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        """Function to test that slices become row groups of one file.
+        """
+        with ResultSink.create(self.path("data.parquet")) as sink:
+            for records in SLICES:
+                sink.write(records)
+        resources_df = pd.read_parquet(self.path("data.parquet"))
+        self.assertEqual(len(resources_df), 3)
+
+    @unittest.skipIf(result_sink.pyarrow is None, "pyarrow is not installed")
+    def test_parquet_type_drift(self):
+        """Function to test that later slices whose column types drift are
+            cast to the file, and values which do not fit go to the side file.
+        """
+        with ResultSink.create(self.path("data.parquet")) as sink:
+            sink.write([{"count": 1, "label": None}])
+            sink.write([{"count": 1.5, "label": "text"}])
+            sink.write([{"count": "n/a", "label": 2.0}])
+
+        resources_df = pd.read_parquet(self.path("data.parquet"))
+        self.assertEqual(list(resources_df["count"][:2]), [1.0, 1.5])
+        self.assertTrue(pd.isna(resources_df["count"][2]))
+        self.assertEqual(list(resources_df["label"][1:]), ["text", "2"])
+        self.assertEqual(sink.extra_columns, {"count"})
+        with open(self.path("data.extra.json")) as f:
+            extra = [json.loads(line) for line in f]
+        self.assertEqual(extra, [{"row": 2, "count": "n/a"}])
+
+    def test_unsupported(self):
+        """Function to test that unknown file types are rejected.
+        """
+        with self.assertRaises(RuntimeError):
+            ResultSink.create(self.path("data.xlsx"))
+
+
+if __name__ == '__main__':
+    unittest.main()
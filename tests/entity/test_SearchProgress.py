@@ -0,0 +1,63 @@
+'''
+    This script tests the per-resource progress of group searches.
+'''
+import unittest
+import sys
+sys.path.insert(1, './')
+
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.ResourceResult import ResourceResult
+from iudx.entity.SearchProgress import SearchProgress
+
+
+def make_query(resource_id: str) -> ResourceQuery:
+    return ResourceQuery().add_entity(resource_id)
+
+
+def make_result(query: ResourceQuery, rows: int, status: int = 200) -> ResourceResult:
+    rs_result = ResourceResult()
+    rs_result.query = query
+    rs_result.status = status
+    rs_result.results = [{}] * rows
+    if status != 200:
+        rs_result.error = f"HTTP {status}"
+    return rs_result
+
+
+class SearchProgressTest(unittest.TestCase):
+    """Test different scenarios for the SearchProgress.
+    """
+    def test_progress(self):
+        """Function to test the counts and the callback per resource.
+        """
+        updates = []
+        progress = SearchProgress(lambda resource_id, stats: updates.append(resource_id))
+        queries = [make_query("a"), make_query("a"), make_query("b")]
+        progress.plan(queries)
+        progress.update(make_result(queries[0], 10))
+        progress.update(make_result(queries[2], 0, status=503))
+
+        stats = progress.get_stats()
+        self.assertEqual(stats["a"], {"slices": 2, "done": 1, "failed": 0, "rows": 10})
+        self.assertEqual(stats["b"], {"slices": 1, "done": 1, "failed": 1, "rows": 0})
+        self.assertEqual(updates, ["a", "b"])
+        self.assertIn("b: 1/1 slices, 0 rows, 1 failed", progress.report())
+
+    def test_replanned(self):
+        """Function to test that an overflowing slice is replaced.
+        """
+        progress = SearchProgress()
+        query = make_query("a")
+        progress.plan([query])
+        overflowed = make_result(query, 5000)
+        progress.update(overflowed)
+        pieces = [make_query("a"), make_query("a")]
+        progress.replanned([overflowed], pieces)
+        for piece in pieces:
+            progress.update(make_result(piece, 3000))
+        self.assertEqual(progress.get_stats()["a"],
+                         {"slices": 2, "done": 2, "failed": 0, "rows": 6000})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+'''
+    This script tests the incremental sync of an entity to a local dataset.
+'''
+import unittest
+import glob
+import json
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs
+
+from iudx.auth.Token import Token
+from iudx.entity.Entity import Entity
+from iudx.rs.DensityModel import DensityModel
+from tests.LocalServer import LocalServer, JSONHandler
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S+05:30"
+
+
+class _Handler(JSONHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/item":
+            results = [{"id": parse_qs(url.query)["id"][0],
+                        "type": ["iudx:Resource"]}]
+        else:
+            results = [{"id": "resource-1"}]
+        self.send_json(200, {"type": "urn:dx:cat:Success", "totalHits": len(results),
+                             "results": results})
+
+    def do_POST(self):
+        body = self.read_json()
+        if self.path == "/token":
+            self.send_json(200, {"type": "urn:dx:auth:success", "title": "Token Success",
+                                 "results": {"accessToken": "token", "expiry": 3600}})
+            return
+        start = datetime.strptime(body["temporalQ"]["time"], TIME_FORMAT)
+        end = datetime.strptime(body["temporalQ"]["endtime"], TIME_FORMAT)
+        if body.get("options") == "count":
+            # Large enough for the planner to split the range into slices.
+            hits = int((end - start) / timedelta(hours=1)) * 1000
+            self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok",
+                                 "results": [{"totalHits": hits}]})
+            return
+        # One record on every full hour of the slice.
+        results = []
+        moment = start.replace(minute=0, second=0)
+        if moment < start:
+            moment += timedelta(hours=1)
+        while moment < end:
+            results.append({"id": body["entities"][0]["id"],
+                            "observationDateTime": moment.strftime(TIME_FORMAT)})
+            moment += timedelta(hours=1)
+        self.send_json(200, {"type": "urn:dx:rs:success", "title": "ok",
+                             "totalHits": len(results), "results": results})
+
+
+class SyncTest(unittest.TestCase):
+    """Test different scenarios for the sync of an entity.
+    """
+    def setUp(self):
+        self.server = LocalServer(_Handler)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "dataset")
+        token = Token(auth_url=self.server.url, client_id="id",
+                      client_secret="secret")
+        token.set_item("resource-1", "resource", "consumer")
+        self.entity = Entity(
+            entity_id="resource-1", cat_url=self.server.url, rs_url=self.server.url,
+            token_obj=token, headers={"content-type": "application/json"},
+            density_model=DensityModel(
+                path=os.path.join(self.directory.name, "density.json")))
+
+    def tearDown(self):
+        self.entity.close()
+        self.server.close()
+        self.directory.cleanup()
+
+    def _records(self):
+        records = []
+        for part in glob.glob(os.path.join(self.path, "**", "part-*"), recursive=True):
+            with open(part) as f:
+                records += [json.loads(line) for line in f if line.strip()]
+        return records
+
+    def test_interrupted_sync(self):
+        """Function to test that a run interrupted between slices saved the
+            mark of the slices it wrote, so the next run adds no duplicates.
+        """
+        iter_slices = self.entity._iter_slices
+
+        def interrupted(*args, **kwargs):
+            for index, rs_result in enumerate(iter_slices(*args, **kwargs)):
+                if index == 1:
+                    raise KeyboardInterrupt
+                yield rs_result
+
+        self.entity._iter_slices = interrupted
+        with self.assertRaises(KeyboardInterrupt):
+            self.entity.sync(self.path, until="2021-01-02T00:00:00+05:30")
+        del self.entity._iter_slices
+
+        written = self._records()
+        self.assertGreater(len(written), 0)
+        self.assertLess(len(written), 24)
+        with open(os.path.join(self.path, "_sync_state.json")) as f:
+            mark = json.load(f)["resource-1"]
+        self.assertEqual(mark, max(r["observationDateTime"] for r in written))
+        self.assertEqual(glob.glob(os.path.join(self.path, "**", "*.tmp"),
+                                   recursive=True), [])
+
+        stats = self.entity.sync(self.path, until="2021-01-02T00:00:00+05:30")
+        observed = [r["observationDateTime"] for r in self._records()]
+        self.assertEqual(len(observed), 24)
+        self.assertEqual(len(set(observed)), 24)
+        self.assertEqual(stats["resource-1"]["rows"], 24 - len(written))
+        self.assertEqual(stats["resource-1"]["high_water_mark"],
+                         "2021-01-01T23:00:00+05:30")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+'''
+    This script tests the high-water marks of an incremental sync.
+'''
+import unittest
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+
+from iudx.entity.SyncState import SyncState
+
+
+class SyncStateTest(unittest.TestCase):
+    """Test different scenarios for the SyncState.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "dataset", "_sync_state.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_advance(self):
+        """Function to test that marks only move forward and persist.
+        """
+        state = SyncState(self.path)
+        self.assertIsNone(state.get("a"))
+        state.advance("a", "2021-01-02T00:00:00+05:30")
+        state.advance("a", "2021-01-01T23:00:00+05:30")
+        # Later in time, though earlier as a string.
+        state.advance("a", "2021-01-01T19:00:00Z")
+        state.save()
+
+        self.assertEqual(SyncState(self.path).get("a"), "2021-01-01T19:00:00Z")
+
+    def test_missing_file(self):
+        """Function to test that a new dataset starts without marks.
+        """
+        state = SyncState(self.path)
+        state.save()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(SyncState(self.path).get("a"), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+'''
+    This script tests the local cache of temporal search results.
+'''
+import unittest
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+from datetime import datetime, timedelta, timezone
+
+from iudx.entity.TemporalCache import TemporalCache
+
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+def records(start: datetime, hours: int):
+    return [
+        {"id": "a", "observationDateTime": (start + timedelta(hours=h)).isoformat(),
+         "speed": float(h)}
+        for h in range(hours)
+    ]
+
+
+class TemporalCacheTest(unittest.TestCase):
+    """Test different scenarios for the TemporalCache.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = TemporalCache(self.directory.name)
+        self.day = datetime(2021, 1, 1, tzinfo=timezone.utc).astimezone(IST)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_gaps(self):
+        """Function to test that only uncovered buckets are fetched.
+        """
+        start, end = self.day, self.day + timedelta(days=2)
+        cached, gaps = self.cache.lookup("a", start, end)
+        self.assertEqual(cached, [])
+        self.assertEqual(gaps, [(start, end)])
+        self.assertEqual(gaps[0][0].utcoffset(), timedelta(hours=5, minutes=30))
+        self.cache.store("a", gaps, records(start, 48))
+
+        # An overlapping window fetches its new day only.
+        later = end + timedelta(days=1)
+        cached, gaps = self.cache.lookup("a", start + timedelta(hours=12), later)
+        self.assertEqual(len(cached), 36)
+        self.assertEqual(gaps, [(end, later)])
+
+        # A window inside a bucket is read without fetching.
+        cached, gaps = self.cache.lookup("a", start + timedelta(hours=1),
+                                         start + timedelta(hours=3))
+        self.assertEqual([r["speed"] for r in cached], [1.0, 2.0])
+        self.assertEqual(gaps, [])
+
+    def test_trailing_bucket(self):
+        """Function to test the partially covered bucket.
+        """
+        start, end = self.day, self.day + timedelta(days=1)
+        fetched_at = (start + timedelta(hours=10)).timestamp()
+        _, gaps = self.cache.lookup("a", start, end)
+        self.cache.store("a", gaps, records(start, 10), fetched_at)
+
+        cached, gaps = self.cache.lookup("a", start, end)
+        self.assertEqual(len(cached), 10)
+        self.assertEqual(gaps, [(start + timedelta(hours=10), end)])
+        self.cache.store("a", gaps, records(start + timedelta(hours=10), 14))
+        cached, gaps = self.cache.lookup("a", start, end)
+        self.assertEqual(len(cached), 24)
+        self.assertEqual(gaps, [])
+
+        _, gaps = self.cache.lookup("a", start, end)
+        self.cache.store("a", [(start, end)], records(start, 5), fetched_at)
+        _, gaps = self.cache.lookup("a", start, end, refresh_trailing=True)
+        self.assertEqual(gaps, [(start, end)])
+
+    def test_eviction(self):
+        """Function to test that least recently used buckets are evicted.
+        """
+        for day in range(3):
+            start = self.day + timedelta(days=day)
+            _, gaps = self.cache.lookup("a", start, start + timedelta(days=1))
+            self.cache.store("a", gaps, records(start, 24))
+        self.cache.lookup("a", self.day, self.day + timedelta(hours=1))
+
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(self.directory.name)
+                   for name in names if name != "index.json")
+        self.cache.max_bytes = size * 2 // 3
+        start = self.day + timedelta(days=3)
+        _, gaps = self.cache.lookup("a", start, start + timedelta(days=1))
+        self.cache.store("a", gaps, records(start, 24))
+
+        _, gaps = self.cache.lookup("a", self.day, self.day + timedelta(days=4))
+        self.assertEqual(gaps, [(self.day + timedelta(days=1), self.day + timedelta(days=3))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+'''
+    This script tests the async resource server against a local http server.
+'''
+import unittest
+import asyncio
+import json
+import sys
+sys.path.insert(1, './')
+
+from iudx.rs.AsyncResourceServer import AsyncResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+
+    def do_POST(self):
+        query = self.read_json()
+        self.send_json(200, {
+            "type": "urn:dx:rs:success",
+            "title": "Success",
+            "results": [{"id": query["entities"][0]["id"],
+                         "observationDateTime": query["temporalQ"]["time"]}],
+        })
+
+    def do_GET(self):
+        self.send_json(200, {
+            "type": "urn:dx:rs:success",
+            "title": "Success",
+            "results": [{"id": self.path.split("/entities/")[-1]}],
+        })
+
+
+class AsyncResourceServerTest(unittest.TestCase):
+    """Test different scenarios for the AsyncResourceServer class.
+    """
+    def setUp(self):
+        self.testVector = {}
+        with open("./tests/rs/testVector_ResourceServer.json", "r") as f:
+            self.testVector = json.load(f)
+
+        self.server = LocalServer(_Handler)
+        self.url = self.server.url
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_get_data(self):
+        """Function to test concurrent temporal queries keep their order.
+        """
+        async def run():
+            async with AsyncResourceServer(rs_url=self.url,
+                                           max_in_flight=2) as rs:
+                queries = []
+                for time_param in self.testVector["time_params"]:
+                    queries.append(ResourceQuery().add_entity(
+                        self.testVector["entities"][0]
+                    ).during_search(
+                        start_time=time_param["time"],
+                        end_time=time_param["endtime"]
+                    ))
+                return await rs.get_data(queries)
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), len(self.testVector["time_params"]))
+        for result, time_param in zip(results, self.testVector["time_params"]):
+            self.assertEqual(result.type, "urn:dx:rs:success")
+            self.assertEqual(result.results[0]["observationDateTime"],
+                             time_param["time"])
+
+    def test_get_latest(self):
+        """Function to test the async get latest resource API.
+        """
+        async def run():
+            async with AsyncResourceServer(rs_url=self.url) as rs:
+                query = ResourceQuery().add_entity(self.testVector["entities"][0])
+                return await rs.get_latest([query])
+
+        results = asyncio.run(run())
+        self.assertEqual(results[0].results[0]["id"],
+                         self.testVector["entities"][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
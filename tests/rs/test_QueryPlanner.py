@@ -0,0 +1,199 @@
+'''
+    This script tests the slicing of temporal queries by the QueryPlanner.
+'''
+import unittest
+import asyncio
+import os
+import tempfile
+import sys
+sys.path.insert(1, './')
+from datetime import datetime
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.AsyncResourceServer import AsyncResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from iudx.rs.QueryPlanner import QueryPlanner
+from iudx.rs.DensityModel import DensityModel
+from iudx.rs.ResourceResult import ResourceResult
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S+05:30"
+
+
+def _records(start: datetime, end: datetime) -> int:
+    # 20 records per hour, 1000 per hour on the 3rd of January.
+    total = 0.0
+    hour = start
+    while hour < end:
+        step = min(end - hour, datetime(2021, 1, 1, 1) - datetime(2021, 1, 1))
+        rate = 1000 if hour.day == 3 else 20
+        total += rate * step.total_seconds() / 3600
+        hour += step
+    return int(total)
+
+
+class _Handler(JSONHandler):
+    counts = 0
+
+    def do_POST(self):
+        query = self.read_json()
+        _Handler.counts += 1
+        if query["entities"][0]["id"] == "missing":
+            self.send_json(404, {"type": "urn:dx:rs:resourceNotFound",
+                                 "title": "Not Found"})
+            return
+        start = datetime.strptime(query["temporalQ"]["time"], TIME_FORMAT)
+        end = datetime.strptime(query["temporalQ"]["endtime"], TIME_FORMAT)
+        self.send_json(200, {
+            "type": "urn:dx:rs:success", "title": "Success",
+            "results": [{"totalHits": _records(start, end)}]
+            })
+
+
+class QueryPlannerTest(unittest.TestCase):
+    """Test different scenarios for the QueryPlanner.
+    """
+    def setUp(self):
+        _Handler.counts = 0
+        self.server = LocalServer(_Handler)
+        self.rs = ResourceServer(
+            rs_url=self.server.url,
+            token="token", workers=8)
+
+    def tearDown(self):
+        self.rs.close()
+        self.server.close()
+
+    def test_plan(self):
+        """Function to test that slices fit a page and cover the range.
+        """
+        query = ResourceQuery()
+        query.add_entity("entity")
+        query.during_search(start_time="2021-01-01T00:00:00+05:30",
+                            end_time="2021-01-11T00:00:00+05:30")
+        planner = QueryPlanner(self.rs, time_format=TIME_FORMAT)
+        slices = planner.plan([query])
+
+        self.assertGreater(len(slices), 1)
+        self.assertEqual(slices[0]._start_time, query._start_time)
+        self.assertEqual(slices[-1]._end_time, query._end_time)
+        for previous, current in zip(slices, slices[1:]):
+            self.assertEqual(previous._end_time, current._start_time)
+        for piece in slices:
+            self.assertLessEqual(
+                _records(piece._start_time_datetime.replace(tzinfo=None),
+                         piece._end_time_datetime.replace(tzinfo=None)),
+                5000)
+            self.assertIsNone(piece._count)
+
+        # One count for the range, one per slice of the next levels.
+        self.assertLess(_Handler.counts, 2 * len(slices) + 1)
+
+    def test_plan_async(self):
+        """Function to test that async planning counts level by level and
+            gives the same slices.
+        """
+        def make_query():
+            query = ResourceQuery()
+            query.add_entity("entity")
+            query.during_search(start_time="2021-01-01T00:00:00+05:30",
+                                end_time="2021-01-11T00:00:00+05:30")
+            return query
+
+        slices = QueryPlanner(self.rs, time_format=TIME_FORMAT).plan([make_query()])
+        counts = _Handler.counts
+        _Handler.counts = 0
+
+        async def run():
+            async with AsyncResourceServer(rs_url=self.server.url,
+                                           token="token") as rs:
+                planner = QueryPlanner(rs, time_format=TIME_FORMAT)
+                return await planner.plan_async([make_query()])
+
+        async_slices = asyncio.run(run())
+        self.assertEqual([(q._start_time, q._end_time) for q in async_slices],
+                         [(q._start_time, q._end_time) for q in slices])
+        self.assertEqual(_Handler.counts, counts)
+
+    def test_sparse_query(self):
+        """Function to test that a small query is kept as it is.
+        """
+        query = ResourceQuery()
+        query.add_entity("entity")
+        query.during_search(start_time="2021-01-05T00:00:00+05:30",
+                            end_time="2021-01-06T00:00:00+05:30")
+        slices = QueryPlanner(self.rs, time_format=TIME_FORMAT).plan([query])
+        self.assertEqual(len(slices), 1)
+        self.assertIs(slices[0], query)
+        self.assertEqual(_Handler.counts, 1)
+
+    def test_failed_count(self):
+        """Function to test that a failed count skips only its query.
+        """
+        queries = []
+        for entity in ("entity", "missing"):
+            query = ResourceQuery()
+            query.add_entity(entity)
+            query.during_search(start_time="2021-01-05T00:00:00+05:30",
+                                end_time="2021-01-06T00:00:00+05:30")
+            queries.append(query)
+        planner = QueryPlanner(self.rs, time_format=TIME_FORMAT)
+        slices = planner.plan(queries)
+
+        self.assertEqual(slices, [queries[0]])
+        failed = planner.take_failed()
+        self.assertEqual(len(failed), 1)
+        self.assertIs(failed[0].query, queries[1])
+        self.assertEqual(failed[0].status, 404)
+        self.assertEqual(planner.take_failed(), [])
+
+    def test_density_model(self):
+        """Function to test that a learnt density replaces the counts.
+        """
+        def make_query():
+            query = ResourceQuery()
+            query.add_entity("entity")
+            query.during_search(start_time="2021-01-05T00:00:00+05:30",
+                                end_time="2021-01-08T00:00:00+05:30")
+            return query
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "density.json")
+            planner = QueryPlanner(self.rs, max_records=500,
+                                   time_format=TIME_FORMAT,
+                                   density_model=DensityModel(path=path))
+            counted = planner.plan([make_query()])
+            self.assertGreater(_Handler.counts, 0)
+            self.assertTrue(os.path.exists(path))
+
+            # A new model reads the store written by the first one.
+            _Handler.counts = 0
+            planner.density_model = DensityModel(path=path)
+            estimated = planner.plan([make_query()])
+            self.assertEqual(_Handler.counts, 0)
+            self.assertEqual(len(estimated), len(counted))
+
+            # Stale estimates fall back to counting.
+            planner.density_model = DensityModel(path=path, ttl=0)
+            planner.plan([make_query()])
+            self.assertGreater(_Handler.counts, 0)
+
+    def test_overflowed(self):
+        """Function to test the detection of slices missing records.
+        """
+        planner = QueryPlanner(self.rs)
+        rs_result = ResourceResult()
+        rs_result.query = ResourceQuery()
+        rs_result.status = 200
+        rs_result.results = [{}] * 10
+        rs_result.totalHits = 10
+        self.assertFalse(planner.overflowed(rs_result))
+        rs_result.totalHits = 11
+        self.assertTrue(planner.overflowed(rs_result))
+        rs_result.query.set_offset_limit(0, 10)
+        self.assertFalse(planner.overflowed(rs_result))
+
+
+if __name__ == '__main__':
+    unittest.main()
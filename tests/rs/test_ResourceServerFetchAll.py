@@ -0,0 +1,122 @@
+'''
+    This script tests the fetch_all pagination of the ResourceServer.
+'''
+import unittest
+import threading
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+    total = 23
+    # Records inserted at the head once the first page was served, which
+    # shifts the later pages by as many records.
+    inserted = 0
+    # Every record is {"v": 1}.
+    identical = False
+    requests = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.read_body()
+        params = parse_qs(urlparse(self.path).query)
+        offset = int(params["offset"][0])
+        limit = int(params["limit"][0])
+        with self.lock:
+            shift = self.inserted if len(self.requests) > 0 else 0
+            self.requests.append((offset, limit))
+        records = [{"n": n} for n in range(-shift, self.total)]
+        if self.identical:
+            records = [{"v": 1}] * self.total
+        self.send_json(200, {
+            "type": "urn:dx:rs:success", "title": "ok",
+            "offset": offset, "limit": limit,
+            "totalHits": len(records),
+            "results": records[offset:offset + limit],
+            })
+
+
+class ResourceServerFetchAllTest(unittest.TestCase):
+    """Test different scenarios for ResourceServer.fetch_all.
+    """
+    def setUp(self):
+        _Handler.requests = []
+        _Handler.inserted = 0
+        _Handler.identical = False
+        self.server = LocalServer(_Handler)
+        self.rs = ResourceServer(
+            rs_url=self.server.url,
+            token="token", workers=4)
+        self.query = ResourceQuery()
+        self.query.add_entity("resource-1")
+        self.query.during_search(start_time="2021-01-01T00:00:00Z",
+                                 end_time="2021-01-02T00:00:00Z")
+
+    def tearDown(self):
+        self.rs.close()
+        self.server.close()
+
+    def _records(self, pages):
+        return [record["n"] for page in pages for record in page.results]
+
+    def test_parallel(self):
+        """Function to test that every page is fetched in offset order.
+        """
+        pages = list(self.rs.fetch_all(self.query, page_size=5))
+        self.assertEqual(len(pages), 5)
+        self.assertEqual(self._records(pages), list(range(23)))
+        self.assertEqual(_Handler.requests[0], (0, 5))
+        self.assertEqual(sorted(_Handler.requests),
+                         [(offset, 5) for offset in range(0, 23, 5)])
+        self.assertIsNone(self.query.get_offset_limit()[0])
+
+    def test_sequential(self):
+        """Function to test page by page fetching.
+        """
+        pages = list(self.rs.fetch_all(self.query, page_size=10,
+                                       parallel=False))
+        self.assertEqual(self._records(pages), list(range(23)))
+        self.assertEqual(_Handler.requests, [(0, 10), (10, 10), (20, 10)])
+
+    def test_window(self):
+        """Function to test that the offset and limit of the query select
+            the records.
+        """
+        self.query.set_offset_limit(3, 12)
+        pages = list(self.rs.fetch_all(self.query, page_size=5))
+        self.assertEqual(self._records(pages), list(range(3, 15)))
+        self.assertEqual(sorted(_Handler.requests), [(3, 5), (8, 5), (13, 2)])
+
+    def test_dedup(self):
+        """Function to test that records shifted across a page boundary
+            are yielded once.
+        """
+        _Handler.inserted = 2
+        pages = list(self.rs.fetch_all(self.query, page_size=5,
+                                       parallel=False,
+                                       key=lambda record: record["n"]))
+        records = self._records(pages)
+        self.assertEqual(len(records), len(set(records)))
+        self.assertEqual(records[:5], [0, 1, 2, 3, 4])
+        self.assertIn(22, records)
+
+    def test_identical_records(self):
+        """Function to test that identical records are all yielded when
+            no key is given.
+        """
+        _Handler.identical = True
+        _Handler.total = 10
+        try:
+            pages = list(self.rs.fetch_all(self.query, page_size=4))
+        finally:
+            _Handler.total = 23
+        self.assertEqual([len(page.results) for page in pages], [4, 4, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+'''
+    This script tests the paginated get_data_using_get of the ResourceServer.
+'''
+import unittest
+import threading
+import sys
+sys.path.insert(1, './')
+from urllib.parse import urlparse, parse_qs
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+RECORDS = {"resource-1": 23, "resource-2": 4}
+
+
+class _Handler(JSONHandler):
+    requests = []
+    # Offsets answered with an error.
+    failing = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        with self.lock:
+            self.requests.append((self.path, self.headers.get("token")))
+        resource_id = params["id"][0]
+        if resource_id not in RECORDS:
+            self.send_json(404, {"type": "urn:dx:rs:resourceNotFound",
+                             "title": "Not Found"})
+            return
+        offset = int(params.get("offset", ["0"])[0])
+        limit = int(params.get("limit", ["5000"])[0])
+        if offset in self.failing:
+            self.send_json(500, {"type": "urn:dx:rs:internalServerError",
+                                 "title": "Internal Server Error"})
+            return
+        total = RECORDS[resource_id]
+        self.send_json(200, {
+            "type": "urn:dx:rs:success", "title": "ok",
+            "offset": offset, "limit": limit, "totalHits": total,
+            "results": [{"id": resource_id, "n": n}
+                        for n in range(offset, min(offset + limit, total))],
+            })
+
+
+class ResourceServerGetTest(unittest.TestCase):
+    """Test different scenarios for ResourceServer.get_data_using_get.
+    """
+    def setUp(self):
+        _Handler.requests = []
+        _Handler.failing = set()
+        self.server = LocalServer(_Handler)
+        self.rs = ResourceServer(
+            rs_url=self.server.url,
+            token="token", workers=4)
+
+    def tearDown(self):
+        self.rs.close()
+        self.server.close()
+
+    def _query(self, resource_id):
+        query = ResourceQuery()
+        query.add_entity(resource_id)
+        query.property_search(key="id", value=resource_id, operation="==")
+        return query
+
+    def test_urls_independent(self):
+        """Function to test that every query gets its own url.
+        """
+        queries = [self._query("resource-1"), self._query("resource-2")]
+        queries[0].set_offset_limit(5, 3)
+        rs_results = self.rs.get_data_using_get(queries)
+
+        self.assertEqual([len(r.results) for r in rs_results], [3, 4])
+        self.assertEqual(rs_results[0].results[0]["n"], 5)
+        for path, token in _Handler.requests:
+            self.assertEqual(path.count("?id="), 1)
+            self.assertEqual(token, "token")
+
+    def test_paginate(self):
+        """Function to test that every page of every query is merged into
+            its result.
+        """
+        queries = [self._query("resource-1"), self._query("resource-2")]
+        rs_results = self.rs.get_data_using_get(queries, page_size=5)
+
+        self.assertEqual([n["n"] for n in rs_results[0].results],
+                         list(range(23)))
+        self.assertEqual(len(rs_results[1].results), 4)
+        self.assertIs(rs_results[0].query, queries[0])
+        self.assertIsNone(queries[0].get_offset_limit()[0])
+        # One request per page.
+        self.assertEqual(len(_Handler.requests), 5 + 1)
+
+    def test_paginate_max_hits(self):
+        """Function to test that pagination stops at max_hits.
+        """
+        rs_results = self.rs.get_data_using_get(
+            [self._query("resource-1")], page_size=5, max_hits=12)
+        self.assertEqual(len(rs_results[0].results), 12)
+
+    def test_failed_query(self):
+        """Function to test that a failed query keeps its error.
+        """
+        rs_results = self.rs.get_data_using_get(
+            [self._query("missing"), self._query("resource-2")], page_size=5)
+        self.assertFalse(rs_results[0].is_success())
+        self.assertEqual(rs_results[0].status, 404)
+        self.assertTrue(rs_results[1].is_success())
+
+    def test_failed_page(self):
+        """Function to test that a failed page keeps the other pages and
+            comes back as its own result, which fetches only that page.
+        """
+        _Handler.failing = {10}
+        queries = [self._query("resource-1")]
+        rs_results = self.rs.get_data_using_get(queries, page_size=5)
+
+        self.assertEqual(len(rs_results), 2)
+        self.assertTrue(rs_results[0].is_success())
+        self.assertEqual([n["n"] for n in rs_results[0].results],
+                         list(range(10)) + list(range(15, 23)))
+        self.assertEqual(rs_results[1].status, 500)
+        self.assertEqual(rs_results[1].query.get_offset_limit(), (10, 5))
+
+        _Handler.failing = set()
+        _Handler.requests = []
+        rs_results = self.rs.get_data_using_get([rs_results[1].query], page_size=5)
+        self.assertEqual([n["n"] for n in rs_results[0].results],
+                         list(range(10, 15)))
+        self.assertEqual(len(_Handler.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+'''
+    This script tests the streaming iter_data API of the ResourceServer.
+'''
+import unittest
+import time
+import sys
+sys.path.insert(1, './')
+
+from iudx.rs.ResourceServer import ResourceServer
+from iudx.rs.ResourceQuery import ResourceQuery
+from tests.LocalServer import LocalServer, JSONHandler
+
+
+class _Handler(JSONHandler):
+
+    def do_POST(self):
+        entity = self.read_json()["entities"][0]["id"]
+        if not entity.isdigit():
+            self.send_json(404, {
+                "type": "urn:dx:rs:resourceNotFound", "title": "Not Found",
+                "detail": "Unknown entity"
+                })
+            return
+        # Later entities answer first.
+        time.sleep(0.05 * (3 - int(entity)))
+        self.send_json(200, {
+            "type": 200, "title": "ok", "results": [{"id": entity}]
+            })
+
+
+class ResourceServerStreamingTest(unittest.TestCase):
+    """Test different scenarios for ResourceServer.iter_data.
+    """
+    def setUp(self):
+        self.server = LocalServer(_Handler)
+        self.rs = ResourceServer(
+            rs_url=self.server.url,
+            token="token", workers=4)
+        self.queries = []
+        for i in range(3):
+            query = ResourceQuery()
+            query.add_entity(str(i))
+            self.queries.append(query)
+
+    def tearDown(self):
+        self.rs.close()
+        self.server.close()
+
+    def test_unordered(self):
+        """Function to test that results are yielded as they complete.
+        """
+        results = list(self.rs.iter_data(self.queries))
+        ids = [result.results[0]["id"] for result in results]
+        self.assertEqual(ids, ["2", "1", "0"])
+        for result in results:
+            self.assertIs(result.query,
+                          self.queries[int(result.results[0]["id"])])
+
+    def test_ordered(self):
+        """Function to test that ordered mode follows the queries.
+        """
+        results = list(self.rs.iter_data(self.queries, ordered=True,
+                                         buffer_size=2))
+        ids = [result.results[0]["id"] for result in results]
+        self.assertEqual(ids, ["0", "1", "2"])
+
+    def test_failed_query(self):
+        """Function to test that failed queries keep their result.
+        """
+        query = ResourceQuery()
+        query.add_entity("missing")
+        results = self.rs.get_data(self.queries + [query])
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result.is_success() for result in results[:3]))
+        failed = results[3]
+        self.assertFalse(failed.is_success())
+        self.assertIs(failed.query, query)
+        self.assertEqual(failed.status, 404)
+        self.assertEqual(failed.error, "HTTP 404: Unknown entity")
+        self.assertEqual(failed.results, [])
+        self.assertGreater(results[0].bytes, 0)
+        self.assertIsNotNone(results[0].latency)
+
+
+if __name__ == '__main__':
+    unittest.main()